@@ -17,6 +17,8 @@ from models.base import BaseModel
 from models.person import Person
 from models.recurring_meeting import RecurringMeeting  
 from models.report import Report, ReportParticipant, ReportAttachment
+from models.report_rollup import ReportRollup
+from models.s3_deletion import S3DeletionOutbox
 from utils.database import get_database_url
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,48 @@
+"""add report_rollups table
+
+Revision ID: 58d78bad4ff2
+Revises: eb87fc74a3ff
+Create Date: 2026-10-17 11:40:08.201394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '58d78bad4ff2'
+down_revision: Union[str, None] = 'eb87fc74a3ff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'report_rollups',
+        sa.Column('recurring_meeting_id', sa.Integer(), nullable=False),
+        sa.Column('period_type', sa.Enum('WEEK', 'MONTH', name='rollupperiod'), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('report_count', sa.Integer(), nullable=False),
+        sa.Column('attendees_total', sa.Integer(), nullable=False),
+        sa.Column('collection_usd', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('collection_bob', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('members_count', sa.Integer(), nullable=False),
+        sa.Column('visitors_count', sa.Integer(), nullable=False),
+        sa.Column('participants_count', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['recurring_meeting_id'], ['recurring_meetings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('recurring_meeting_id', 'period_type', 'period_start', name='uq_report_rollups_meeting_period')
+    )
+    op.create_index(op.f('ix_report_rollups_id'), 'report_rollups', ['id'], unique=False)
+    op.create_index('ix_report_rollups_period', 'report_rollups', ['period_type', 'period_start'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_rollups_period', table_name='report_rollups')
+    op.drop_index(op.f('ix_report_rollups_id'), table_name='report_rollups')
+    op.drop_table('report_rollups')
@@ -0,0 +1,41 @@
+"""add s3 deletion outbox
+
+Revision ID: b25e75292f8c
+Revises: 58d78bad4ff2
+Create Date: 2026-10-17 15:02:47.913204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b25e75292f8c'
+down_revision: Union[str, None] = '58d78bad4ff2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        's3_deletion_outbox',
+        sa.Column('file_key', sa.String(length=500), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_s3_deletion_outbox_id'), 's3_deletion_outbox', ['id'], unique=False)
+    op.create_index(op.f('ix_s3_deletion_outbox_file_key'), 's3_deletion_outbox', ['file_key'], unique=False)
+    op.create_index(op.f('ix_report_attachments_file_key'), 'report_attachments', ['file_key'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_report_attachments_file_key'), table_name='report_attachments')
+    op.drop_index(op.f('ix_s3_deletion_outbox_file_key'), table_name='s3_deletion_outbox')
+    op.drop_index(op.f('ix_s3_deletion_outbox_id'), table_name='s3_deletion_outbox')
+    op.drop_table('s3_deletion_outbox')
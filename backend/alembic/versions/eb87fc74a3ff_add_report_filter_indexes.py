@@ -0,0 +1,30 @@
+"""add report filter indexes
+
+Revision ID: eb87fc74a3ff
+Revises: 6871e6009940
+Create Date: 2026-10-17 09:12:31.482117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eb87fc74a3ff'
+down_revision: Union[str, None] = '6871e6009940'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_reports_meeting_datetime_id', 'reports', ['meeting_datetime', 'id'], unique=False)
+    op.create_index('ix_reports_leader_meeting_datetime', 'reports', ['leader_person_id', 'meeting_datetime'], unique=False)
+    op.create_index('ix_reports_recurring_meeting_datetime', 'reports', ['recurring_meeting_id', 'meeting_datetime'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_recurring_meeting_datetime', table_name='reports')
+    op.drop_index('ix_reports_leader_meeting_datetime', table_name='reports')
+    op.drop_index('ix_reports_meeting_datetime_id', table_name='reports')
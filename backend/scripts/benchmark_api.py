@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark the main API endpoints in-process through TestClient.
+Seeds the generate_data.py dataset when the database has no reports yet,
+replaces the Cognito and S3 clients with local stubs, calls every endpoint
+--requests times and prints latency percentiles, throughput and SQL
+statements per request. Results are written as JSON named after the git
+commit so runs can be compared with --compare.
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the API endpoints")
+    parser.add_argument("--database-url", help="Override DATABASE_URL, e.g. sqlite:///./benchmark.db")
+    parser.add_argument("--create-tables", action="store_true", help="Create the tables first (scratch databases)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Dataset scale for generate_data.py")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for data and request parameters")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight at once")
+    parser.add_argument("--endpoints", nargs="+", help="Only run these endpoints")
+    parser.add_argument("--output", help="Result file (default: benchmark-results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    return parser.parse_args()
+
+args = parse_args()
+if args.database_url:
+    os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("S3_BUCKET", "benchmark-bucket")
+# Statement counts come from the Server-Timing header; the per-request log line is just noise here
+os.environ.setdefault("REQUEST_METRICS_ENABLED", "true")
+os.environ.setdefault("SERVER_TIMING_ENABLED", "true")
+os.environ.setdefault("REQUEST_METRICS_LOG", "false")
+
+# Add the src directory to the path
+sys.path.append(os.path.join(BACKEND_DIR, 'src'))
+
+from botocore.exceptions import ClientError
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import func, select
+from main import app
+from models import Base
+from models.person import Person
+from models.recurring_meeting import RecurringMeeting
+from models.report import Report, ReportAttachment, ReportParticipant
+from auth.cognito import cognito_service
+from auth.jwt_handler import jwt_handler
+from services.s3_service import s3_service
+from utils.database import SessionLocal, get_engine
+from generate_data import generate_dataset
+
+STUB_SIGNING_KEY_ID = "benchmark"
+STUB_SIGNING_SECRET = b"benchmark-signing-secret"
+SQL_COUNT_PATTERN = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+class StubCognitoClient:
+    """Answers the cognito-idp calls CognitoService makes, without AWS"""
+
+    def __init__(self, access_token: str):
+        self.access_token = access_token
+
+    def admin_initiate_auth(self, **kwargs):
+        return {
+            "AuthenticationResult": {
+                "AccessToken": self.access_token,
+                "RefreshToken": "benchmark",
+                "IdToken": "benchmark",
+                "TokenType": "Bearer"
+            }
+        }
+
+    def get_user(self, AccessToken):
+        return {
+            "Username": "benchmark",
+            "UserAttributes": [{"Name": "email", "Value": "benchmark@example.com"}]
+        }
+
+    def admin_get_user(self, UserPoolId, Username):
+        return self.get_user(self.access_token)
+
+class StubS3Client:
+    """In-memory stand-in for the S3 calls S3Service makes.
+
+    Presigned URLs are formatted, not signed, so include_urls runs measure
+    the application side only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.objects = {}
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        size = len(fileobj.read())
+        with self._lock:
+            self.objects[key] = {
+                "ContentLength": size,
+                "ContentType": (ExtraArgs or {}).get("ContentType", "application/octet-stream"),
+                "LastModified": datetime.now(timezone.utc)
+            }
+
+    def head_object(self, Bucket, Key):
+        with self._lock:
+            if Key not in self.objects:
+                raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+            return dict(self.objects[Key])
+
+    def delete_object(self, Bucket, Key):
+        with self._lock:
+            self.objects.pop(Key, None)
+        return {}
+
+    def delete_objects(self, Bucket, Delete):
+        with self._lock:
+            for item in Delete["Objects"]:
+                self.objects.pop(item["Key"], None)
+        return {}
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None):
+        with self._lock:
+            contents = [
+                {"Key": key, "LastModified": meta["LastModified"]}
+                for key, meta in sorted(self.objects.items())
+                if key.startswith(Prefix)
+            ]
+        return {"Contents": contents}
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn=3600):
+        return f"https://{Params['Bucket']}.s3.amazonaws.com/{Params['Key']}?X-Amz-Expires={ExpiresIn}"
+
+    def generate_presigned_post(self, Bucket, Key, Fields=None, Conditions=None, ExpiresIn=3600):
+        return {"url": f"https://{Bucket}.s3.amazonaws.com/", "fields": {**(Fields or {}), "key": Key}}
+
+def install_stubs() -> str:
+    """Point Cognito and S3 at local stubs and return a bearer token for the API"""
+    claims = {
+        "sub": "benchmark",
+        "username": "benchmark",
+        "token_use": "access",
+        "client_id": cognito_service.client_id,
+        "iss": cognito_service.issuer,
+        "exp": int(time.time()) + 86400
+    }
+    access_token = jwt.encode(claims, STUB_SIGNING_SECRET, algorithm="HS256", headers={"kid": STUB_SIGNING_KEY_ID})
+    signing_key = {
+        "kty": "oct",
+        "kid": STUB_SIGNING_KEY_ID,
+        "alg": "HS256",
+        "k": base64.urlsafe_b64encode(STUB_SIGNING_SECRET).rstrip(b"=").decode()
+    }
+
+    # Tokens still go through the real local verification, only the key set is replaced
+    cognito_service._client = StubCognitoClient(access_token)
+    cognito_service._fetch_jwks = lambda: {STUB_SIGNING_KEY_ID: signing_key}
+    s3_service._s3_client = StubS3Client()
+
+    return jwt_handler.create_access_token({
+        "sub": "benchmark",
+        "email": "benchmark@example.com",
+        "cognito_token": access_token
+    })
+
+def load_context(db):
+    """Ids the request parameters are drawn from"""
+    meetings = db.execute(
+        select(RecurringMeeting.id, RecurringMeeting.leader_person_id, RecurringMeeting.location, Person.phone)
+        .join(Person, Person.id == RecurringMeeting.leader_person_id)
+    ).all()
+    return {
+        "person_ids": db.scalars(select(Person.id)).all(),
+        "meetings": meetings,
+        "report_ids": db.scalars(select(Report.id)).all(),
+        "counts": {
+            "persons": db.scalar(select(func.count(Person.id))),
+            "recurring_meetings": len(meetings),
+            "reports": db.scalar(select(func.count(Report.id))),
+            "participants": db.scalar(select(func.count(ReportParticipant.id))),
+            "attachments": db.scalar(select(func.count(ReportAttachment.id)))
+        }
+    }
+
+def random_leader(context, rng) -> int:
+    # Only some persons lead a meeting; the rest have no reports to filter on
+    return rng.choice(context["meetings"]).leader_person_id
+
+def new_report(context, rng):
+    meeting = rng.choice(context["meetings"])
+    return {
+        "registration_date": datetime.utcnow().isoformat(),
+        "meeting_datetime": (datetime(2024, 1, 1, 19) + timedelta(days=rng.randrange(365))).isoformat(),
+        "recurring_meeting_id": meeting.id,
+        "leader_person_id": meeting.leader_person_id,
+        "leader_phone": meeting.phone,
+        "location": meeting.location,
+        "collection_amount": "25.50",
+        "currency": "BOB",
+        "attendees_count": 10,
+        "participants": [
+            {"participant_name": f"Participant {number}", "participant_type": "MEMBER"}
+            for number in range(10)
+        ]
+    }
+
+# name -> builds (method, url, request kwargs); writes run last so they do not skew the reads
+ENDPOINTS = {
+    "auth_me": lambda c, rng: ("GET", "/api/v1/auth/me", {}),
+    "persons_list": lambda c, rng: ("GET", "/api/v1/persons/?limit=50", {}),
+    "person_get": lambda c, rng: ("GET", f"/api/v1/persons/{rng.choice(c['person_ids'])}", {}),
+    "meetings_list": lambda c, rng: ("GET", "/api/v1/recurring-meetings/?limit=50", {}),
+    "meeting_get": lambda c, rng: ("GET", f"/api/v1/recurring-meetings/{rng.choice(c['meetings']).id}", {}),
+    "missing_reports": lambda c, rng: (
+        "GET", f"/api/v1/recurring-meetings/missing-reports?leader_person_id={random_leader(c, rng)}", {}
+    ),
+    "reports_list": lambda c, rng: ("GET", "/api/v1/reports/?limit=50", {}),
+    "reports_list_urls": lambda c, rng: ("GET", "/api/v1/reports/?limit=50&include_urls=true", {}),
+    "reports_list_sparse": lambda c, rng: (
+        "GET", "/api/v1/reports/?limit=50&fields=meeting_datetime,location,attendees_count&include=", {}
+    ),
+    "reports_by_leader": lambda c, rng: (
+        "GET", f"/api/v1/reports/?limit=50&leader_person_id={random_leader(c, rng)}", {}
+    ),
+    "report_get": lambda c, rng: ("GET", f"/api/v1/reports/{rng.choice(c['report_ids'])}", {}),
+    "report_stats": lambda c, rng: ("GET", "/api/v1/reports/stats?period=month", {}),
+    "report_rollups": lambda c, rng: (
+        "GET", f"/api/v1/reports/rollups?period=WEEK&recurring_meeting_id={rng.choice(c['meetings']).id}", {}
+    ),
+    "report_export": lambda c, rng: (
+        "GET", f"/api/v1/reports/export?format=ndjson&leader_person_id={random_leader(c, rng)}", {}
+    ),
+    "report_create": lambda c, rng: ("POST", "/api/v1/reports/", {"json": new_report(c, rng)}),
+    "attachment_upload": lambda c, rng: (
+        "POST",
+        f"/api/v1/reports/{rng.choice(c['report_ids'])}/attachments",
+        {"files": {"file": ("photo.jpg", b"\xff\xd8" + b"\x00" * 50_000, "image/jpeg")}}
+    ),
+}
+
+def percentile(values, fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def run_endpoint(client, name, context, rng):
+    requests = [ENDPOINTS[name](context, rng) for _ in range(args.warmup + args.requests)]
+
+    def call(request):
+        method, url, kwargs = request
+        started = time.perf_counter()
+        response = client.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        match = SQL_COUNT_PATTERN.search(response.headers.get("server-timing", ""))
+        return elapsed, response.status_code, int(match.group(1)) if match else None
+
+    for request in requests[:args.warmup]:
+        call(request)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(call, requests[args.warmup:]))
+    wall = time.perf_counter() - started
+
+    latencies = sorted(elapsed * 1000 for elapsed, _, _ in results)
+    queries = [count for _, _, count in results if count is not None]
+    return {
+        "requests": len(results),
+        "errors": sum(1 for _, status_code, _ in results if status_code >= 400),
+        "throughput_rps": round(len(results) / wall, 1),
+        "mean_ms": round(statistics.mean(latencies), 2),
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p90_ms": round(percentile(latencies, 0.90), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "max_ms": round(latencies[-1], 2),
+        "sql_queries": statistics.median_low(queries) if queries else None
+    }
+
+def git_commit():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain"], cwd=BACKEND_DIR, capture_output=True, text=True
+        ).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+def print_comparison(results, baseline):
+    print(f"\nCompared with {baseline['commit']} ({baseline['timestamp']}):")
+    print(f"  {'endpoint':<20} {'p50 ms':>16} {'p95 ms':>16} {'queries':>9}")
+    for name, current in results["endpoints"].items():
+        previous = baseline["endpoints"].get(name)
+        if previous is None:
+            continue
+        cells = []
+        for key in ("p50_ms", "p95_ms"):
+            change = (current[key] - previous[key]) / previous[key] * 100 if previous[key] else 0.0
+            cells.append(f"{current[key]:>7.1f} ({change:+5.0f}%)")
+        print(f"  {name:<20} {cells[0]:>16} {cells[1]:>16} {previous['sql_queries']!s:>4}->{current['sql_queries']!s:<4}")
+
+def main():
+    unknown = set(args.endpoints or []) - set(ENDPOINTS)
+    if unknown:
+        print(f"❌ Unknown endpoints: {', '.join(sorted(unknown))} (choose from {', '.join(ENDPOINTS)})")
+        return 1
+
+    engine = get_engine()
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        if db.scalar(select(func.count(Report.id))):
+            print("Reusing the reports already in the database")
+        else:
+            print(f"Seeding scale {args.scale} with seed {args.seed}:")
+            started = time.perf_counter()
+            generate_dataset(engine, scale=args.scale, seed=args.seed)
+            print(f"Seeded the database in {time.perf_counter() - started:.1f} s")
+        context = load_context(db)
+    finally:
+        db.close()
+
+    print(f"Dataset on {engine.dialect.name}: " + ", ".join(f"{count} {name}" for name, count in context["counts"].items()))
+
+    token = install_stubs()
+    client = TestClient(app, headers={"Authorization": f"Bearer {token}"})
+    results = {
+        "commit": None,
+        "dirty": False,
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "database": engine.dialect.name,
+        "dataset": context["counts"],
+        "options": {"requests": args.requests, "warmup": args.warmup, "concurrency": args.concurrency, "seed": args.seed},
+        "endpoints": {}
+    }
+    results["commit"], results["dirty"] = git_commit()
+
+    print(f"\n{args.requests} requests per endpoint, concurrency {args.concurrency}:")
+    print(f"  {'endpoint':<20} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>7}")
+    # Seeded separately from the data, so a reused database gets the same requests
+    rng = random.Random(args.seed)
+    for name in ENDPOINTS:
+        if args.endpoints and name not in args.endpoints:
+            continue
+        stats = run_endpoint(client, name, context, rng)
+        results["endpoints"][name] = stats
+        print(
+            f"  {name:<20} {stats['throughput_rps']:>8.1f} {stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} "
+            f"{stats['p99_ms']:>8.1f} {stats['sql_queries']!s:>8} {stats['errors']:>7}"
+        )
+
+    output = args.output or os.path.join(
+        BACKEND_DIR, "benchmark-results", f"{results['commit']}{'-dirty' if results['dirty'] else ''}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {os.path.normpath(output)}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+
+    failed = [name for name, stats in results["endpoints"].items() if stats["errors"]]
+    if failed:
+        print(f"❌ Requests failed for: {', '.join(failed)}")
+        return 1
+
+    print("✅ Benchmark finished")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark ReportService.create_report for reports with 0, 50 and
+500 participants. Counts the SQL statements sent per call (an executemany
+counts once) and times the call plus building the API response from the
+returned report.
+Creates a throwaway leader and meeting and deletes them at the end.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark report creation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 50, 500], help="Participant counts")
+    parser.add_argument("--repeat", type=int, default=10, help="Reports created per size")
+    parser.add_argument("--database-url", help="Override DATABASE_URL, e.g. sqlite:///./benchmark.db")
+    parser.add_argument("--create-tables", action="store_true", help="Create the tables first (scratch databases)")
+    return parser.parse_args()
+
+args = parse_args()
+if args.database_url:
+    os.environ["DATABASE_URL"] = args.database_url
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy import event
+from models import Base
+from models.report import Currency, ParticipantType, ReportType
+from models.recurring_meeting import Periodicity
+from api.v1.schemas.person import PersonCreate
+from api.v1.schemas.recurring_meeting import RecurringMeetingCreate
+from api.v1.schemas.report import ReportCreate, ReportResponse, ParticipantCreate
+from services.person_service import PersonService
+from services.recurring_meeting_service import RecurringMeetingService
+from services.report_service import ReportService
+from utils.database import SessionLocal, get_engine
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.statements = 0
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+
+def report_payload(leader_id: int, meeting_id: int, index: int, size: int) -> ReportCreate:
+    participant_types = list(ParticipantType)
+    return ReportCreate(
+        registration_date=datetime.utcnow(),
+        meeting_datetime=datetime(2024, 1, 1, 19) + timedelta(days=7 * index),
+        recurring_meeting_id=meeting_id,
+        leader_person_id=leader_id,
+        leader_phone="70000000",
+        location="Benchmark",
+        collection_amount=Decimal("10.50"),
+        currency=Currency.BOB,
+        attendees_count=size,
+        participants=[
+            ParticipantCreate(
+                participant_name=f"Participant {number}",
+                participant_type=participant_types[number % len(participant_types)]
+            )
+            for number in range(size)
+        ]
+    )
+
+def main():
+    engine = get_engine()
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    leader = PersonService(db).create_person(PersonCreate(
+        first_name="Benchmark",
+        last_name="Leader",
+        birth_date=date(1990, 1, 1),
+        phone="70000000",
+        home_address="Benchmark"
+    ))
+    meeting = RecurringMeetingService(db).create_recurring_meeting(RecurringMeetingCreate(
+        meeting_datetime=datetime(2024, 1, 1, 19),
+        leader_person_id=leader.id,
+        report_type=ReportType.CELULA,
+        location="Benchmark",
+        periodicity=Periodicity.WEEKLY
+    ))
+    leader_id, meeting_id = leader.id, meeting.id
+    db.close()
+
+    counter = StatementCounter(engine)
+    index = 0
+    print(f"create_report on {engine.dialect.name}, {args.repeat} reports per size:")
+    print(f"  {'participants':>12} {'statements':>10} {'median ms':>9} {'p95 ms':>7}")
+    try:
+        for size in args.sizes:
+            timings, statements = [], []
+            for _ in range(args.repeat):
+                payload = report_payload(leader_id, meeting_id, index, size)
+                index += 1
+
+                db = SessionLocal()
+                try:
+                    counter.statements = 0
+                    started = time.perf_counter()
+                    report = ReportService(db).create_report(payload)
+                    ReportResponse.model_validate(report)
+                    timings.append((time.perf_counter() - started) * 1000)
+                    statements.append(counter.statements)
+                finally:
+                    db.close()
+
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(
+                f"  {size:>12} {max(statements):>10} "
+                f"{statistics.median(timings):>9.1f} {p95:>7.1f}"
+            )
+    finally:
+        db = SessionLocal()
+        PersonService(db).delete_person(leader_id)
+        db.close()
+
+    print("✅ Benchmark finished")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
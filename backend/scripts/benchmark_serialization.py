@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Script to measure the serialization share of a report page request.
+Loads a page of reports, times the response_model path FastAPI takes
+(validate, dump to dicts, json.dumps) against the precompiled TypeAdapter
+path and checks both produce the same bytes. It then requests the page
+through TestClient with FAST_JSON_RESPONSES off and on and reports the
+serialize share of the request from the Server-Timing header.
+Seeds the generate_data.py dataset when the database has no reports yet.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import sys
+import time
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark report response serialization")
+    parser.add_argument("--database-url", help="Override DATABASE_URL, e.g. sqlite:///./benchmark.db")
+    parser.add_argument("--create-tables", action="store_true", help="Create the tables first (scratch databases)")
+    parser.add_argument("--scale", type=float, default=0.2, help="Dataset scale when seeding")
+    parser.add_argument("--page-size", type=int, default=100, help="Reports per page")
+    parser.add_argument("--repeat", type=int, default=50, help="Measured runs per variant")
+    return parser.parse_args()
+
+args = parse_args()
+if args.database_url:
+    os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("REQUEST_METRICS_ENABLED", "true")
+os.environ.setdefault("SERVER_TIMING_ENABLED", "true")
+os.environ.setdefault("REQUEST_METRICS_LOG", "false")
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from typing import List
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from main import app
+from models import Base
+from models.report import Report
+from api.v1.schemas.report import ReportResponse
+from api.v1.serialization import AdapterJSONResponse, type_adapter
+from auth.dependencies import get_current_user
+from services.report_service import ReportService
+from utils.config import settings
+from utils.database import SessionLocal, get_engine
+from generate_data import generate_dataset
+
+TIMING_PATTERN = re.compile(r'(\w+);dur=([\d.]+)')
+
+def time_runs(function, repeat: int):
+    function()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def main():
+    engine = get_engine()
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        if not db.scalar(select(func.count(Report.id))):
+            generate_dataset(engine, scale=args.scale)
+        reports = ReportService(db).get_reports(limit=args.page_size)
+        participants = sum(len(report.participants) for report in reports)
+
+        field = next(
+            route.response_field for route in app.routes
+            if getattr(route, "path", None) == "/api/v1/reports/" and "GET" in route.methods
+        )
+
+        loop = asyncio.new_event_loop()
+
+        def response_model_path() -> bytes:
+            content = loop.run_until_complete(serialize_response(field=field, response_content=reports))
+            return JSONResponse(content).body
+
+        adapter = type_adapter(List[ReportResponse])
+
+        def adapter_path() -> bytes:
+            return AdapterJSONResponse(reports, adapter).body
+
+        if response_model_path() != adapter_path():
+            print("❌ The two paths produce different JSON")
+            return 1
+
+        print(
+            f"Serializing {len(reports)} reports ({participants} participants, "
+            f"{len(adapter_path()) / 1024:.0f} KiB), median of {args.repeat}:"
+        )
+        baseline = time_runs(response_model_path, args.repeat)
+        fast = time_runs(adapter_path, args.repeat)
+        print(f"  response_model + json.dumps  {baseline:8.2f} ms")
+        print(f"  TypeAdapter.dump_json        {fast:8.2f} ms  ({baseline / fast:.1f}x)")
+        loop.close()
+    finally:
+        db.close()
+
+    async def benchmark_user():
+        return {"username": "benchmark", "attributes": {}}
+
+    app.dependency_overrides[get_current_user] = benchmark_user
+    client = TestClient(app)
+    url = f"/api/v1/reports/?limit={args.page_size}"
+
+    print(f"\nGET {url} through TestClient, median of {args.repeat}:")
+    print(f"  {'FAST_JSON_RESPONSES':<20} {'total ms':>9} {'db ms':>7} {'serialize ms':>13} {'share':>6}")
+    for enabled in (False, True):
+        settings.FAST_JSON_RESPONSES = enabled
+        client.get(url)
+        samples = []
+        for _ in range(args.repeat):
+            response = client.get(url)
+            samples.append({
+                name: float(duration)
+                for name, duration in TIMING_PATTERN.findall(response.headers.get("server-timing", ""))
+            })
+
+        total = statistics.median(sample["total"] for sample in samples)
+        database = statistics.median(sample["db"] for sample in samples)
+        serialize = statistics.median(sample["serialize"] for sample in samples)
+        print(f"  {str(enabled).lower():<20} {total:>9.1f} {database:>7.1f} {serialize:>13.1f} {serialize / total:>6.0%}")
+
+    print("✅ Benchmark finished")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
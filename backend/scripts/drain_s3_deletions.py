@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Script to delete the S3 objects queued in the s3_deletion_outbox table.
+Runs the same batched DeleteObjects drain as the scheduled Lambda job, and
+with --sweep first queues objects under reports/ that no attachment
+references any more.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from datetime import timedelta
+from utils.database import SessionLocal
+from services.s3_cleanup_service import S3CleanupService, DELETE_BATCH_SIZE
+
+async def run(args, cleanup_service: S3CleanupService):
+    if args.sweep:
+        orphans = await cleanup_service.sweep_orphans(
+            prefix=args.prefix,
+            grace_period=timedelta(hours=args.grace_hours) if args.grace_hours is not None else None,
+            dry_run=args.dry_run
+        )
+        for file_key in orphans:
+            print(f"  orphan: {file_key}")
+        print(f"✅ Found {len(orphans)} orphaned objects under '{args.prefix}'")
+
+    if args.dry_run:
+        print(f"✅ {cleanup_service.pending_count()} objects are queued for deletion (dry run, nothing deleted)")
+        return 0
+
+    result = await cleanup_service.drain(batch_size=args.batch_size, max_batches=args.max_batches)
+    print(
+        f"✅ Deleted {result['deleted']} objects in {result['batches']} batches "
+        f"({result['skipped']} still referenced, {result['failed']} failed)"
+    )
+    return 1 if result["failed"] else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Drain the S3 deletion outbox")
+    parser.add_argument("--sweep", action="store_true", help="Queue unreferenced objects before draining")
+    parser.add_argument("--prefix", default="reports/", help="Prefix to sweep (default: reports/)")
+    parser.add_argument("--grace-hours", type=int, help="Skip objects younger than this (default: S3_ORPHAN_GRACE_HOURS)")
+    parser.add_argument("--dry-run", action="store_true", help="Only list, do not queue or delete")
+    parser.add_argument("--batch-size", type=int, default=DELETE_BATCH_SIZE, help="Keys per DeleteObjects call")
+    parser.add_argument("--max-batches", type=int, help="Stop after this many batches")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        return asyncio.run(run(args, S3CleanupService(db)))
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error cleaning up S3 objects: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
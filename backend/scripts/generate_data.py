@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Script to fill a database with synthetic persons, recurring meetings,
+reports, participants and attachments for scale testing.
+Reports follow each meeting's real cadence (daily, weekly or monthly) over
+the chosen history, with some occurrences left unreported. Rows are written
+with bulk Core inserts and explicit ids; the same --seed, --scale and
+--end-date always produce the same data. Scale 1 is about 1,000 persons and
+400,000 rows in total.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, time as time_of_day, timedelta
+from typing import Callable, Dict, List, Optional
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from models import Base
+from models.person import Person
+from models.recurring_meeting import Periodicity, RecurringMeeting
+from models.report import Currency, ParticipantType, Report, ReportAttachment, ReportParticipant, ReportType
+from services.occurrence_service import expand_occurrences
+from services.report_rollup_service import ReportRollupService
+from utils.database import get_engine
+
+PERSONS_PER_SCALE = 1000
+# Share of persons leading at least one recurring meeting
+LEADER_RATIO = 0.35
+DEFAULT_BATCH_SIZE = 10000
+
+FIRST_NAMES = [
+    "Ana", "Luis", "Carlos", "María", "José", "Lucía", "Jorge", "Sofía", "Miguel", "Valeria",
+    "Juan", "Camila", "Pedro", "Daniela", "Diego", "Gabriela", "Fernando", "Paola", "Ricardo", "Andrea",
+]
+LAST_NAMES = [
+    "Pérez", "Rojas", "Flores", "Mamani", "Quispe", "Vargas", "Gutiérrez", "Choque", "López", "Fernández",
+    "Torrez", "Mendoza", "Suárez", "Ortiz", "Vaca", "Salazar", "Rivera", "Castro", "Molina", "Justiniano",
+]
+ZONES = ["Equipetrol", "Plan 3000", "Villa 1ro de Mayo", "Urbarí", "Los Lotes", "El Trompillo", "Pampa de la Isla"]
+
+def _name(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+def _next_ids(connection: Connection) -> Dict[type, int]:
+    # Explicit ids let participants reference their report without reading it back
+    return {
+        model: (connection.scalar(select(func.max(model.id))) or 0) + 1
+        for model in (Person, RecurringMeeting, Report, ReportParticipant, ReportAttachment)
+    }
+
+def _meeting(rng: random.Random, meeting_id: int, leader: Dict, window_start: date, window_end: date, now: datetime) -> Dict:
+    # Cells meet weekly at night, services on Sunday mornings; a few groups meet daily or monthly
+    report_type = ReportType.CULTO if rng.random() < 0.15 else ReportType.CELULA
+    roll = rng.random()
+    periodicity = Periodicity.DAILY if roll < 0.05 else Periodicity.MONTHLY if roll < 0.15 else Periodicity.WEEKLY
+    # Most groups exist for the whole history, the rest started somewhere in it
+    start = window_start if rng.random() < 0.7 else window_start + timedelta(
+        days=rng.randrange(max(1, (window_end - window_start).days))
+    )
+    if report_type == ReportType.CULTO:
+        start += timedelta(days=(6 - start.weekday()) % 7)
+        hour = rng.choice([9, 11, 18])
+    else:
+        hour = rng.choice([19, 20])
+
+    return {
+        "id": meeting_id,
+        "meeting_datetime": datetime.combine(start, time_of_day(hour)),
+        "leader_person_id": leader["id"],
+        "report_type": report_type,
+        "location": leader["home_address"],
+        "description": f"{report_type.value.capitalize()} {leader['first_name']} {leader['last_name']}",
+        "google_maps_link": leader["google_maps_link"],
+        "periodicity": periodicity,
+        "created_at": now,
+        "updated_at": now
+    }
+
+class _Writer:
+    """Buffers rows per table and inserts them in batches"""
+
+    def __init__(self, connection: Connection, batch_size: int):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.buffers: Dict[str, List[Dict]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, table, row: Dict):
+        buffer = self.buffers.setdefault(table.name, [])
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        # Parents first, so foreign keys hold on databases that check them
+        for model in (Person, RecurringMeeting, Report, ReportParticipant, ReportAttachment):
+            rows = self.buffers.pop(model.__tablename__, None)
+            if rows:
+                self.connection.execute(insert(model.__table__), rows)
+                self.counts[model.__tablename__] = self.counts.get(model.__tablename__, 0) + len(rows)
+        self.connection.commit()
+
+def generate_dataset(
+    engine: Engine,
+    scale: float = 1.0,
+    seed: int = 42,
+    end_date: Optional[date] = None,
+    history_weeks: int = 104,
+    report_rate: float = 0.9,
+    attachment_ratio: float = 0.15,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    rebuild_rollups: bool = True,
+    progress: Callable[[str], None] = print
+) -> Dict[str, int]:
+    """Insert a synthetic dataset next to any existing rows and return the rows written per table"""
+    rng = random.Random(seed)
+    window_end = end_date or date.today()
+    window_start = window_end - timedelta(weeks=history_weeks)
+    # Fixed timestamps keep reruns identical
+    now = datetime.combine(window_start, time_of_day())
+
+    with engine.connect() as connection:
+        if connection.dialect.name == "sqlite":
+            # Scratch data; losing it on a crash is fine
+            connection.exec_driver_sql("PRAGMA synchronous=OFF")
+        elif connection.dialect.name == "mysql":
+            # Keys are consistent by construction, skip checking them row by row
+            connection.exec_driver_sql("SET foreign_key_checks=0, unique_checks=0")
+
+        ids = _next_ids(connection)
+        writer = _Writer(connection, batch_size)
+
+        persons = []
+        for index in range(int(PERSONS_PER_SCALE * scale)):
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            person = {
+                "id": ids[Person] + index,
+                "first_name": first_name,
+                "last_name": last_name,
+                "birth_date": date(1950, 1, 1) + timedelta(days=rng.randrange(55 * 365)),
+                "phone": f"{rng.choice('67')}{rng.randrange(10 ** 7):07d}",
+                "home_address": f"{rng.choice(ZONES)}, calle {rng.randint(1, 120)} #{rng.randint(1, 999)}",
+                "google_maps_link": (
+                    f"https://maps.google.com/?q=-17.{rng.randrange(10 ** 6):06d},-63.{rng.randrange(10 ** 6):06d}"
+                    if rng.random() < 0.6 else None
+                ),
+                "created_at": now,
+                "updated_at": now
+            }
+            persons.append(person)
+            writer.add(Person.__table__, person)
+
+        meetings = []
+        for leader in persons:
+            if rng.random() >= LEADER_RATIO:
+                continue
+            for _ in range(2 if rng.random() < 0.1 else 1):
+                meeting = _meeting(rng, ids[RecurringMeeting] + len(meetings), leader, window_start, window_end, now)
+                meetings.append(meeting)
+                writer.add(RecurringMeeting.__table__, meeting)
+        writer.flush()
+        progress(f"  {len(persons)} persons, {len(meetings)} recurring meetings")
+
+        report_id, participant_id, attachment_id = ids[Report], ids[ReportParticipant], ids[ReportAttachment]
+        phones = {person["id"]: person["phone"] for person in persons}
+        for number, meeting in enumerate(meetings, start=1):
+            # Each group has a steady roster of members plus the odd visitor
+            roster = [_name(rng) for _ in range(rng.randint(4, 15))]
+            currency = Currency.USD if rng.random() < 0.2 else Currency.BOB
+
+            for occurrence in expand_occurrences(meeting["meeting_datetime"], meeting["periodicity"], window_start, window_end):
+                if rng.random() >= report_rate:
+                    continue
+
+                meeting_datetime = datetime.combine(occurrence, meeting["meeting_datetime"].time())
+                registered = meeting_datetime + timedelta(hours=rng.randint(1, 72))
+                participants = [
+                    (name, ParticipantType.MEMBER) for name in roster if rng.random() < 0.75
+                ] + [
+                    (_name(rng), rng.choice([ParticipantType.VISITOR, ParticipantType.PARTICIPANT]))
+                    for _ in range(rng.choice([0, 0, 1, 1, 2, 3]))
+                ]
+                writer.add(Report.__table__, {
+                    "id": report_id,
+                    "registration_date": registered,
+                    "meeting_datetime": meeting_datetime,
+                    "recurring_meeting_id": meeting["id"],
+                    "leader_person_id": meeting["leader_person_id"],
+                    "leader_phone": phones[meeting["leader_person_id"]],
+                    "collaborator": _name(rng) if rng.random() < 0.3 else None,
+                    "location": meeting["location"],
+                    "collection_amount": round(rng.uniform(0, 60 if currency == Currency.USD else 400), 2),
+                    "currency": currency,
+                    "attendees_count": len(participants) + rng.randint(0, 3),
+                    "google_maps_link": meeting["google_maps_link"],
+                    "created_at": registered,
+                    "updated_at": registered
+                })
+
+                for participant_name, participant_type in participants:
+                    writer.add(ReportParticipant.__table__, {
+                        "id": participant_id,
+                        "report_id": report_id,
+                        "participant_name": participant_name,
+                        "participant_type": participant_type,
+                        "created_at": registered,
+                        "updated_at": registered
+                    })
+                    participant_id += 1
+
+                if rng.random() < attachment_ratio:
+                    for photo in range(rng.randint(1, 3)):
+                        writer.add(ReportAttachment.__table__, {
+                            "id": attachment_id,
+                            "report_id": report_id,
+                            "file_name": f"IMG_{occurrence:%Y%m%d}_{photo + 1}.jpg",
+                            "file_key": f"reports/{report_id}/{uuid.UUID(int=rng.getrandbits(128))}.jpg",
+                            "file_size": rng.randint(80_000, 4_000_000),
+                            "content_type": "image/jpeg",
+                            "created_at": registered,
+                            "updated_at": registered
+                        })
+                        attachment_id += 1
+
+                report_id += 1
+
+            if number % 500 == 0:
+                progress(f"  {number}/{len(meetings)} meetings, {report_id - ids[Report]} reports")
+
+        writer.flush()
+
+        if rebuild_rollups:
+            with Session(bind=connection) as db:
+                ReportRollupService(db).rebuild()
+                db.commit()
+
+        return writer.counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic data for scale testing")
+    parser.add_argument("--database-url", help="Target database (default: the configured DATABASE_URL)")
+    parser.add_argument("--create-tables", action="store_true", help="Create the tables first (scratch databases)")
+    parser.add_argument("--scale", type=float, default=1.0, help=f"{PERSONS_PER_SCALE} persons per unit")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--end-date", type=date.fromisoformat, help="Last day of the history (default: today)")
+    parser.add_argument("--history-weeks", type=int, default=104, help="Weeks of reports before --end-date")
+    parser.add_argument("--report-rate", type=float, default=0.9, help="Share of occurrences with a report")
+    parser.add_argument("--attachment-ratio", type=float, default=0.15, help="Share of reports with photos")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per INSERT")
+    parser.add_argument("--skip-rollups", action="store_true", help="Do not rebuild report_rollups afterwards")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url) if args.database_url else get_engine()
+
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    print(f"Generating scale {args.scale} with seed {args.seed} on {engine.dialect.name}:")
+    started = time.perf_counter()
+    try:
+        counts = generate_dataset(
+            engine,
+            scale=args.scale,
+            seed=args.seed,
+            end_date=args.end_date,
+            history_weeks=args.history_weeks,
+            report_rate=args.report_rate,
+            attachment_ratio=args.attachment_ratio,
+            batch_size=args.batch_size,
+            rebuild_rollups=not args.skip_rollups
+        )
+    except Exception as e:
+        print(f"❌ Error generating data: {e}")
+        raise
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    for table, count in counts.items():
+        print(f"  {count:>10} {table}")
+    print(f"✅ Inserted {total} rows in {elapsed:.1f} s ({total / elapsed:,.0f} rows/s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Script to import reports from a CSV or NDJSON file.
+Uses the same parser, lookups and validation as POST /reports/import, reads
+the file row by row and commits in chunks. Rows that fail are listed with
+their line number; everything else is imported.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.database import SessionLocal
+from api.v1.schemas.report import ReportImportFormat
+from services.report_import_service import ReportImportService, DEFAULT_CHUNK_SIZE, ensure_utf8
+
+def main():
+    parser = argparse.ArgumentParser(description="Import reports from CSV or NDJSON")
+    parser.add_argument("path", help="File to import")
+    parser.add_argument("--format", choices=[f.value for f in ReportImportFormat], help="Default: from the file extension")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Reports per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Validate only, do not insert")
+    args = parser.parse_args()
+
+    if args.format:
+        import_format = ReportImportFormat(args.format)
+    elif args.path.lower().endswith((".ndjson", ".jsonl")):
+        import_format = ReportImportFormat.NDJSON
+    else:
+        import_format = ReportImportFormat.CSV
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        with open(args.path, "rb") as upload:
+            # Before the first chunk commits, so a bad byte cannot leave a partial import
+            ensure_utf8(upload)
+            with io.TextIOWrapper(upload, encoding="utf-8-sig", newline="") as stream:
+                result = ReportImportService(db, chunk_size=args.chunk_size).import_reports(
+                    stream, import_format, dry_run=args.dry_run
+                )
+        elapsed = time.perf_counter() - started
+
+        for error in result["errors"]:
+            print(f"❌ row {error['row']}: {'; '.join(error['errors'])}")
+        if result["failed"] > len(result["errors"]):
+            print(f"❌ ... {result['failed'] - len(result['errors'])} more rows failed")
+
+        rate = result["total_rows"] / elapsed * 60 if elapsed else 0
+        print(
+            f"✅ {result['total_rows']} rows read, {result['valid']} valid, {result['imported']} imported, "
+            f"{result['failed']} failed in {elapsed:.1f}s ({rate:,.0f} rows/min)"
+        )
+        return 1 if result["failed"] else 0
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error importing reports: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Script to profile the cold-start import time of the Lambda handler module.
+Runs `python -X importtime -c "import main"` several times in fresh
+interpreters, prints the slowest modules of the median run and fails when
+the median exceeds the target.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# The median in the development container dropped from ~2.4 s to ~1.6 s once
+# boto3 stopped being imported and configured at import time; the target
+# keeps ~10% headroom over that so regressions show up
+DEFAULT_TARGET_MS = 1800
+
+LINE_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+def profile_once(module: str):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us)))
+
+    total_us = next(cumulative for name, _, cumulative in reversed(entries) if name == module)
+    return total_us, entries
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile import time of the Lambda handler")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreter runs")
+    parser.add_argument("--top", type=int, default=20, help="Number of slowest modules to show")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS, help="Fail above this median")
+    args = parser.parse_args()
+
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    runs.sort(key=lambda run: run[0])
+    median_us, entries = runs[len(runs) // 2]
+
+    print(f"Import time of '{args.module}' over {args.runs} runs:")
+    print(f"  min {runs[0][0] / 1000:.1f} ms, median {median_us / 1000:.1f} ms, max {runs[-1][0] / 1000:.1f} ms")
+    print(f"  stdev {statistics.pstdev(run[0] for run in runs) / 1000:.1f} ms")
+
+    # Self times summed per top-level package, so nothing is counted twice
+    packages = {}
+    for name, self_us, _ in entries:
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + self_us
+
+    print("\nSlowest packages (self time summed, median run):")
+    for name, package_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {package_us / 1000:8.1f} ms  {name}")
+
+    print("\nSlowest modules (self time, median run):")
+    for name, self_us, _ in sorted(entries, key=lambda entry: -entry[1])[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+    if median_us / 1000 > args.target_ms:
+        print(f"\n❌ Median import time {median_us / 1000:.1f} ms exceeds target {args.target_ms:.0f} ms")
+        return 1
+
+    print(f"\n✅ Median import time {median_us / 1000:.1f} ms is within target {args.target_ms:.0f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
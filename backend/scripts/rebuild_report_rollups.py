@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Script to backfill or verify the report_rollups table.
+Rebuilds weekly/monthly rollups from the reports table, or with --check
+compares the stored rollups against a fresh aggregation without writing.
+"""
+
+import argparse
+import os
+import sys
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.database import SessionLocal
+from services.report_rollup_service import ReportRollupService
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or check report rollups")
+    parser.add_argument("--check", action="store_true", help="Only report differences, do not write")
+    parser.add_argument(
+        "--recurring-meeting-id",
+        type=int,
+        action="append",
+        dest="recurring_meeting_ids",
+        help="Limit to a recurring meeting (repeatable)"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rollup_service = ReportRollupService(db)
+
+        if args.check:
+            mismatches = rollup_service.check(args.recurring_meeting_ids)
+            for mismatch in mismatches:
+                print(
+                    f"❌ meeting={mismatch['recurring_meeting_id']} "
+                    f"{mismatch['period_type'].value} {mismatch['period_start']}: {mismatch['differences']}"
+                )
+            if mismatches:
+                print(f"❌ {len(mismatches)} rollup rows are inconsistent")
+                return 1
+            print("✅ Rollups are consistent with reports")
+            return 0
+
+        written = rollup_service.rebuild(args.recurring_meeting_ids)
+        db.commit()
+        print(f"✅ Rebuilt {written} rollup rows")
+        return 0
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error processing rollups: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
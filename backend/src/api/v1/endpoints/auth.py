@@ -1,10 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.security import HTTPAuthorizationCredentials
+from api.v1.routing import InstrumentedRoute
 from api.v1.schemas.auth import LoginRequest, LoginResponse, UserInfo
 from auth.cognito import cognito_service
 from auth.jwt_handler import jwt_handler
-from auth.dependencies import get_current_user
+from auth.dependencies import get_current_user, security
+from auth.identity_cache import identity_cache
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 @router.post("/login", response_model=LoginResponse)
 async def login(request: LoginRequest):
@@ -45,13 +48,22 @@ async def login(request: LoginRequest):
     )
 
 @router.post("/logout")
-async def logout(current_user: dict = Depends(get_current_user)):
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: dict = Depends(get_current_user)
+):
+    identity_cache.evict(credentials.credentials)
     return {"message": "Successfully logged out"}
 
 @router.get("/me", response_model=UserInfo)
 async def get_current_user_info(current_user: dict = Depends(get_current_user)):
+    # Locally verified tokens only carry sub and email, so read the full profile from the pool
+    attributes = await cognito_service.get_user_attributes(current_user['username'])
+    if attributes is None:
+        attributes = current_user['attributes']
+
     return UserInfo(
         username=current_user['username'],
-        email=current_user['attributes'].get('email'),
-        attributes=current_user['attributes']
+        email=attributes.get('email'),
+        attributes=attributes
     )
\ No newline at end of file
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from utils.concurrency import run_sync
+from utils.config import settings
 from utils.database import get_db
+from utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 from auth.dependencies import get_current_user
+from api.v1.routing import InstrumentedRoute
+from api.v1.serialization import fast_json
 from api.v1.schemas.person import PersonCreate, PersonUpdate, PersonResponse
 from services.person_service import PersonService
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 @router.post("/", response_model=PersonResponse)
 async def create_person(
@@ -15,7 +20,7 @@ async def create_person(
     current_user: dict = Depends(get_current_user)
 ):
     person_service = PersonService(db)
-    person = person_service.create_person(person_data)
+    person = await run_sync(person_service.create_person, person_data)
     return person
 
 @router.get("/{person_id}", response_model=PersonResponse)
@@ -25,7 +30,7 @@ async def get_person(
     current_user: dict = Depends(get_current_user)
 ):
     person_service = PersonService(db)
-    person = person_service.get_person(person_id)
+    person = await run_sync(person_service.get_person, person_id)
     
     if not person:
         raise HTTPException(
@@ -37,13 +42,28 @@ async def get_person(
 
 @router.get("/", response_model=List[PersonResponse])
 async def get_persons(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     person_service = PersonService(db)
-    persons = person_service.get_persons(skip=skip, limit=limit)
+    try:
+        persons = await run_sync(person_service.get_persons, skip=skip, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    next_page = next_cursor(persons, limit, PersonService.cursor_key)
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json(List[PersonResponse], persons, response)
     return persons
 
 @router.put("/{person_id}", response_model=PersonResponse)
@@ -54,7 +74,7 @@ async def update_person(
     current_user: dict = Depends(get_current_user)
 ):
     person_service = PersonService(db)
-    person = person_service.update_person(person_id, person_data)
+    person = await run_sync(person_service.update_person, person_id, person_data)
     
     if not person:
         raise HTTPException(
@@ -71,7 +91,7 @@ async def delete_person(
     current_user: dict = Depends(get_current_user)
 ):
     person_service = PersonService(db)
-    success = person_service.delete_person(person_id)
+    success = await run_sync(person_service.delete_person, person_id)
     
     if not success:
         raise HTTPException(
@@ -1,44 +1,98 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date, timedelta
+from utils.concurrency import run_sync
+from utils.config import settings
 from utils.database import get_db
+from utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 from auth.dependencies import get_current_user
 from services.recurring_meeting_service import RecurringMeetingService
+from services.occurrence_service import OccurrenceService
+from api.v1.routing import InstrumentedRoute
+from api.v1.serialization import fast_json
 from api.v1.schemas.recurring_meeting import (
     RecurringMeetingResponse,
     RecurringMeetingCreate,
-    RecurringMeetingUpdate
+    RecurringMeetingUpdate,
+    MissingReportResponse
 )
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 @router.post("/", response_model=RecurringMeetingResponse, status_code=status.HTTP_201_CREATED)
-def create_recurring_meeting(
+async def create_recurring_meeting(
     recurring_meeting: RecurringMeetingCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     service = RecurringMeetingService(db)
-    return service.create_recurring_meeting(recurring_meeting)
+    return await run_sync(service.create_recurring_meeting, recurring_meeting)
 
 @router.get("/", response_model=List[RecurringMeetingResponse])
-def get_recurring_meetings(
+async def get_recurring_meetings(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     service = RecurringMeetingService(db)
-    return service.get_recurring_meetings(skip=skip, limit=limit)
+    try:
+        recurring_meetings = await run_sync(
+            service.get_recurring_meetings, skip=skip, limit=limit, cursor=cursor
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    next_page = next_cursor(recurring_meetings, limit, RecurringMeetingService.cursor_key)
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json(List[RecurringMeetingResponse], recurring_meetings, response)
+    return recurring_meetings
+
+@router.get("/missing-reports", response_model=List[MissingReportResponse])
+async def get_missing_reports(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    leader_person_id: Optional[int] = None,
+    recurring_meeting_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    # Defaults to the last 30 days; occurrences after today are never missing yet
+    today = date.today()
+    date_to = min(date_to or today, today)
+    date_from = date_from or date_to - timedelta(days=30)
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="date_from must not be after date_to"
+        )
+
+    service = OccurrenceService(db)
+    return await run_sync(
+        service.get_missing_reports,
+        date_from=date_from,
+        date_to=date_to,
+        leader_person_id=leader_person_id,
+        recurring_meeting_id=recurring_meeting_id
+    )
 
 @router.get("/{recurring_meeting_id}", response_model=RecurringMeetingResponse)
-def get_recurring_meeting(
+async def get_recurring_meeting(
     recurring_meeting_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     service = RecurringMeetingService(db)
-    recurring_meeting = service.get_recurring_meeting(recurring_meeting_id)
+    recurring_meeting = await run_sync(service.get_recurring_meeting, recurring_meeting_id)
     if not recurring_meeting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,24 +101,24 @@ def get_recurring_meeting(
     return recurring_meeting
 
 @router.get("/leader/{leader_person_id}", response_model=List[RecurringMeetingResponse])
-def get_recurring_meetings_by_leader(
+async def get_recurring_meetings_by_leader(
     leader_person_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     service = RecurringMeetingService(db)
-    return service.get_recurring_meetings_by_leader(leader_person_id)
+    return await run_sync(service.get_recurring_meetings_by_leader, leader_person_id)
 
 @router.put("/{recurring_meeting_id}", response_model=RecurringMeetingResponse)
-def update_recurring_meeting(
+async def update_recurring_meeting(
     recurring_meeting_id: int,
     recurring_meeting_update: RecurringMeetingUpdate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     service = RecurringMeetingService(db)
-    updated_recurring_meeting = service.update_recurring_meeting(
-        recurring_meeting_id, recurring_meeting_update
+    updated_recurring_meeting = await run_sync(
+        service.update_recurring_meeting, recurring_meeting_id, recurring_meeting_update
     )
     if not updated_recurring_meeting:
         raise HTTPException(
@@ -74,13 +128,13 @@ def update_recurring_meeting(
     return updated_recurring_meeting
 
 @router.delete("/{recurring_meeting_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_recurring_meeting(
+async def delete_recurring_meeting(
     recurring_meeting_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     service = RecurringMeetingService(db)
-    if not service.delete_recurring_meeting(recurring_meeting_id):
+    if not await run_sync(service.delete_recurring_meeting, recurring_meeting_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Recurring meeting not found"
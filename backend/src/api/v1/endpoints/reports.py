@@ -1,16 +1,109 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, UploadFile, File, Form
+from fastapi.responses import RedirectResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from pydantic import TypeAdapter
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from datetime import date, datetime
+from utils.concurrency import run_sync
+from utils.config import settings
 from utils.database import get_db
+from utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 from auth.dependencies import get_current_user
-from api.v1.schemas.report import ReportCreate, ReportUpdate, ReportResponse
+from api.v1.routing import InstrumentedRoute
+from api.v1.serialization import AdapterJSONResponse, fast_json
+from api.v1.schemas.report import (
+    ReportCreate,
+    ReportUpdate,
+    ReportResponse,
+    ReportFilter,
+    ReportInclude,
+    REPORT_FIELDS,
+    DEFAULT_REPORT_INCLUDES,
+    sparse_report_model,
+    ReportStats,
+    ReportRollupResponse,
+    AttachmentUploadRequest,
+    AttachmentUploadResponse,
+    AttachmentConfirmRequest,
+    ReportImportFormat,
+    ReportImportResult,
+    ReportExportFormat,
+    ReportExportLink,
+    ExportDelivery,
+    StatsPeriod,
+    StatsGroupBy
+)
 from services.report_service import ReportService
+from services.report_import_service import ReportImportService, ensure_utf8
+from services.report_export_service import ReportExportService, CONTENT_TYPES
+from services.report_stats_service import ReportStatsService
+from services.report_rollup_service import ReportRollupService
+from models.report_rollup import RollupPeriod
 from services.s3_service import s3_service
-from models.report import ReportAttachment
+import functools
+import io
 import json
+import tempfile
+import uuid
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+async def _download_url_context(reports) -> Optional[Dict[str, Dict[str, str]]]:
+    # Read by AttachmentResponse while serializing, see its download_url validator
+    file_keys = [attachment.file_key for report in reports for attachment in report.attachments]
+    if not file_keys:
+        return None
+
+    urls = await s3_service.get_file_urls(file_keys, expiration=settings.DOWNLOAD_URL_EXPIRATION)
+    return {"download_urls": urls}
+
+def _split(values: Optional[List[str]]) -> Optional[List[str]]:
+    # Accepts both fields=a,b and fields=a&fields=b
+    if values is None:
+        return None
+    return [name.strip() for value in values for name in value.split(",") if name.strip()]
+
+def report_selection(
+    fields: Optional[List[str]] = Query(
+        None, description="Report fields to return, comma-separated; id is always included"
+    ),
+    include: Optional[List[str]] = Query(
+        None, description="Relations to embed: participants, attachments, recurring_meeting, recurring_meeting.leader. Empty for none"
+    )
+) -> Tuple[Optional[FrozenSet[str]], FrozenSet[ReportInclude]]:
+    selected_fields = _split(fields)
+    unknown = set(selected_fields or []) - set(REPORT_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+
+    names = _split(include)
+    if names is None:
+        return (frozenset(selected_fields) if selected_fields is not None else None), DEFAULT_REPORT_INCLUDES
+
+    try:
+        includes = {ReportInclude(name) for name in names}
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"include must be one of: {', '.join(item.value for item in ReportInclude)}"
+        )
+    if ReportInclude.RECURRING_MEETING_LEADER in includes:
+        includes.add(ReportInclude.RECURRING_MEETING)
+    return (frozenset(selected_fields) if selected_fields is not None else None), frozenset(includes)
+
+@functools.lru_cache(maxsize=128)
+def _sparse_adapter(fields: FrozenSet[str], include: FrozenSet[ReportInclude], many: bool) -> TypeAdapter:
+    model = sparse_report_model(fields, include)
+    return TypeAdapter(List[model] if many else model)
+
+def _sparse_response(content, fields, include, many: bool, response: Optional[Response] = None, context=None) -> AdapterJSONResponse:
+    # Only what was loaded is read, so unselected columns and relations are never fetched
+    adapter = _sparse_adapter(fields if fields is not None else frozenset(REPORT_FIELDS), include, many)
+    headers = dict(response.headers) if response is not None else None
+    return AdapterJSONResponse(content, adapter, headers=headers, context=context)
 
 @router.post("/", response_model=ReportResponse)
 async def create_report(
@@ -19,35 +112,179 @@ async def create_report(
     current_user: dict = Depends(get_current_user)
 ):
     report_service = ReportService(db)
-    report = report_service.create_report(report_data)
+    report = await run_sync(report_service.create_report, report_data)
     return report
 
+@router.post("/import", response_model=ReportImportResult)
+async def import_reports(
+    file: UploadFile = File(...),
+    format: Optional[ReportImportFormat] = None,
+    dry_run: bool = False,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    import_format = format
+    if import_format is None:
+        file_name = (file.filename or "").lower()
+        import_format = ReportImportFormat.NDJSON if file_name.endswith((".ndjson", ".jsonl")) else ReportImportFormat.CSV
+
+    # Checked up front, so a bad byte late in the file cannot fail the import after earlier chunks committed
+    try:
+        await run_sync(ensure_utf8, file.file)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be UTF-8 encoded"
+        )
+
+    # The upload is spooled to disk by Starlette and parsed row by row
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        import_service = ReportImportService(db)
+        return await run_sync(import_service.import_reports, stream, import_format, dry_run=dry_run)
+    finally:
+        stream.detach()
+
+def _write_export(chunks, target):
+    for chunk in chunks:
+        target.write(chunk)
+    target.seek(0)
+
+@router.get("/export", response_model=ReportExportLink, responses={200: {"content": dict.fromkeys(CONTENT_TYPES.values(), {})}})
+async def export_reports(
+    format: ReportExportFormat = ReportExportFormat.CSV,
+    flatten_participants: bool = False,
+    delivery: ExportDelivery = ExportDelivery.STREAM,
+    filters: ReportFilter = Depends(),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    export_service = ReportExportService(db)
+    chunks = export_service.export(format, filters=filters, flatten_participants=flatten_participants)
+    file_name = f"reports-{datetime.utcnow():%Y%m%d-%H%M%S}.{format.value}"
+
+    if delivery == ExportDelivery.STREAM:
+        # Rows are fetched and encoded while the response is sent
+        return StreamingResponse(
+            chunks,
+            media_type=CONTENT_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+        )
+
+    # Spooled to /tmp and uploaded, for exports that outgrow a Lambda response
+    with tempfile.TemporaryFile() as export_file:
+        await run_sync(_write_export, chunks, export_file)
+        file_key = await s3_service.upload_fileobj(
+            export_file,
+            f"exports/{uuid.uuid4()}.{format.value}",
+            CONTENT_TYPES[format],
+            download_name=file_name
+        )
+
+    url = await s3_service.get_file_url(file_key, expiration=settings.EXPORT_URL_EXPIRATION)
+    return ReportExportLink(url=url, file_key=file_key, expires_in=settings.EXPORT_URL_EXPIRATION)
+
+@router.get("/stats", response_model=List[ReportStats])
+async def get_report_stats(
+    period: Optional[StatsPeriod] = None,
+    group_by: List[StatsGroupBy] = Query([]),
+    filters: ReportFilter = Depends(),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    stats_service = ReportStatsService(db)
+    return await run_sync(stats_service.get_stats, filters=filters, period=period, group_by=group_by)
+
+@router.get("/rollups", response_model=List[ReportRollupResponse])
+async def get_report_rollups(
+    period: RollupPeriod = RollupPeriod.WEEK,
+    recurring_meeting_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    rollup_service = ReportRollupService(db)
+    return await run_sync(
+        rollup_service.get_rollups,
+        period=period,
+        recurring_meeting_id=recurring_meeting_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+
 @router.get("/{report_id}", response_model=ReportResponse)
 async def get_report(
     report_id: int,
+    include_urls: bool = False,
+    selection: Tuple[Optional[FrozenSet[str]], FrozenSet[ReportInclude]] = Depends(report_selection),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
+    fields, include = selection
     report_service = ReportService(db)
-    report = report_service.get_report(report_id)
+    report = await run_sync(report_service.get_report, report_id, fields, include)
     
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Report not found"
         )
-    
+
+    context = None
+    if include_urls and ReportInclude.ATTACHMENTS in include:
+        context = await _download_url_context([report])
+
+    if fields is not None or include != DEFAULT_REPORT_INCLUDES:
+        return _sparse_response(report, fields, include, many=False, context=context)
+    # The response_model path cannot pass a validation context, the adapter path renders the same JSON
+    if settings.FAST_JSON_RESPONSES or context:
+        return fast_json(ReportResponse, report, context=context)
     return report
 
 @router.get("/", response_model=List[ReportResponse])
 async def get_reports(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_urls: bool = False,
+    filters: ReportFilter = Depends(),
+    selection: Tuple[Optional[FrozenSet[str]], FrozenSet[ReportInclude]] = Depends(report_selection),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
+    fields, include = selection
     report_service = ReportService(db)
-    reports = report_service.get_reports(skip=skip, limit=limit)
+    try:
+        reports = await run_sync(
+            report_service.get_reports,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            filters=filters,
+            fields=fields,
+            include=include
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    next_page = next_cursor(reports, limit, ReportService.cursor_key)
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+
+    # Presigned URLs for the whole page, so galleries need no redirect per image
+    context = None
+    if include_urls and ReportInclude.ATTACHMENTS in include:
+        context = await _download_url_context(reports)
+
+    if fields is not None or include != DEFAULT_REPORT_INCLUDES:
+        return _sparse_response(reports, fields, include, many=True, response=response, context=context)
+    if settings.FAST_JSON_RESPONSES or context:
+        return fast_json(List[ReportResponse], reports, response, context=context)
     return reports
 
 @router.put("/{report_id}", response_model=ReportResponse)
@@ -58,7 +295,7 @@ async def update_report(
     current_user: dict = Depends(get_current_user)
 ):
     report_service = ReportService(db)
-    report = report_service.update_report(report_id, report_data)
+    report = await run_sync(report_service.update_report, report_id, report_data)
     
     if not report:
         raise HTTPException(
@@ -75,7 +312,7 @@ async def delete_report(
     current_user: dict = Depends(get_current_user)
 ):
     report_service = ReportService(db)
-    success = report_service.delete_report(report_id)
+    success = await run_sync(report_service.delete_report, report_id)
     
     if not success:
         raise HTTPException(
@@ -94,9 +331,7 @@ async def upload_attachment(
 ):
     # Verify report exists
     report_service = ReportService(db)
-    report = report_service.get_report(report_id)
-    
-    if not report:
+    if not await run_sync(report_service.report_exists, report_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Report not found"
@@ -106,7 +341,8 @@ async def upload_attachment(
     file_key = await s3_service.upload_file(file, f"reports/{report_id}/")
     
     # Save attachment record
-    attachment = ReportAttachment(
+    attachment = await run_sync(
+        report_service.create_attachment,
         report_id=report_id,
         file_name=file.filename,
         file_key=file_key,
@@ -114,10 +350,142 @@ async def upload_attachment(
         content_type=file.content_type
     )
     
-    db.add(attachment)
-    db.commit()
-    db.refresh(attachment)
-    
+    return {"message": "File uploaded successfully", "attachment_id": attachment.id}
+
+@router.post("/{report_id}/attachments/batch")
+async def upload_attachments(
+    report_id: int,
+    files: List[UploadFile] = File(...),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if len(files) > settings.ATTACHMENT_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.ATTACHMENT_BATCH_MAX_FILES} files can be uploaded at once"
+        )
+
+    # Verify report exists once for the whole batch
+    report_service = ReportService(db)
+    if not await run_sync(report_service.report_exists, report_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+
+    # Files outside the size limit are reported per item instead of failing the batch
+    accepted = [file for file in files if 0 < (file.size or 0) <= settings.ATTACHMENT_MAX_SIZE_BYTES]
+    attachments = []
+    if accepted:
+        # Upload to S3 concurrently
+        file_keys = await s3_service.upload_files(
+            accepted,
+            f"reports/{report_id}/",
+            max_parallel=settings.ATTACHMENT_UPLOAD_PARALLELISM
+        )
+
+        # Save all attachment records in one transaction
+        attachments = await run_sync(
+            report_service.create_attachments,
+            report_id,
+            [
+                {
+                    "file_name": file.filename,
+                    "file_key": file_key,
+                    "file_size": file.size,
+                    "content_type": file.content_type
+                }
+                for file, file_key in zip(accepted, file_keys)
+            ]
+        )
+
+    attachment_ids = {id(file): attachment.id for file, attachment in zip(accepted, attachments)}
+    results = [
+        {"file_name": file.filename, "attachment_id": attachment_ids[id(file)]}
+        if id(file) in attachment_ids else
+        {"file_name": file.filename, "error": f"File size must be between 1 and {settings.ATTACHMENT_MAX_SIZE_BYTES} bytes"}
+        for file in files
+    ]
+
+    return {
+        "message": "Files uploaded successfully" if len(accepted) == len(files) else f"{len(accepted)} of {len(files)} files uploaded",
+        "attachment_ids": [attachment.id for attachment in attachments],
+        "results": results
+    }
+
+@router.post("/{report_id}/attachments/presign", response_model=AttachmentUploadResponse)
+async def presign_attachment_upload(
+    report_id: int,
+    upload_request: AttachmentUploadRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if upload_request.file_size <= 0 or upload_request.file_size > settings.ATTACHMENT_MAX_SIZE_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File size must be between 1 and {settings.ATTACHMENT_MAX_SIZE_BYTES} bytes"
+        )
+
+    # Verify report exists
+    report_service = ReportService(db)
+    if not await run_sync(report_service.report_exists, report_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+
+    # The browser uploads straight to S3; the file never passes through Lambda
+    upload = await s3_service.create_presigned_upload(
+        f"reports/{report_id}/",
+        upload_request.file_name,
+        upload_request.content_type,
+        settings.ATTACHMENT_MAX_SIZE_BYTES,
+        expiration=settings.PRESIGNED_UPLOAD_EXPIRATION
+    )
+
+    return AttachmentUploadResponse(expires_in=settings.PRESIGNED_UPLOAD_EXPIRATION, **upload)
+
+@router.post("/{report_id}/attachments/confirm")
+async def confirm_attachment_upload(
+    report_id: int,
+    confirm_request: AttachmentConfirmRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if not confirm_request.file_key.startswith(f"reports/{report_id}/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File key does not belong to this report"
+        )
+
+    report_service = ReportService(db)
+    if not await run_sync(report_service.report_exists, report_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+
+    # Confirming twice returns the attachment recorded the first time
+    attachment = await run_sync(report_service.get_attachment_by_key, report_id, confirm_request.file_key)
+    if attachment:
+        return {"message": "File uploaded successfully", "attachment_id": attachment.id}
+
+    metadata = await s3_service.get_file_metadata(confirm_request.file_key)
+    if not metadata:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Uploaded file not found"
+        )
+
+    attachment = await run_sync(
+        report_service.create_attachment,
+        report_id=report_id,
+        file_name=confirm_request.file_name,
+        file_key=confirm_request.file_key,
+        file_size=metadata['file_size'],
+        content_type=metadata['content_type']
+    )
+
     return {"message": "File uploaded successfully", "attachment_id": attachment.id}
 
 @router.delete("/{report_id}/attachments/{attachment_id}")
@@ -128,10 +496,8 @@ async def delete_attachment(
     current_user: dict = Depends(get_current_user)
 ):
     # Get attachment
-    attachment = db.query(ReportAttachment).filter(
-        ReportAttachment.id == attachment_id,
-        ReportAttachment.report_id == report_id
-    ).first()
+    report_service = ReportService(db)
+    attachment = await run_sync(report_service.get_attachment, report_id, attachment_id)
     
     if not attachment:
         raise HTTPException(
@@ -139,12 +505,9 @@ async def delete_attachment(
             detail="Attachment not found"
         )
     
-    # Delete from S3
-    await s3_service.delete_file(attachment.file_key)
-    
-    # Delete from database
-    db.delete(attachment)
-    db.commit()
+    # The S3 object is queued for deletion in the same transaction
+    await run_sync(report_service.delete_attachment, attachment)
+    s3_service.evict_file_url(attachment.file_key)
     
     return {"message": "Attachment deleted successfully"}
 
@@ -156,10 +519,8 @@ async def download_attachment(
     current_user: dict = Depends(get_current_user)
 ):
     # Get attachment
-    attachment = db.query(ReportAttachment).filter(
-        ReportAttachment.id == attachment_id,
-        ReportAttachment.report_id == report_id
-    ).first()
+    report_service = ReportService(db)
+    attachment = await run_sync(report_service.get_attachment, report_id, attachment_id)
     
     if not attachment:
         raise HTTPException(
@@ -169,7 +530,9 @@ async def download_attachment(
     
     # Generate presigned URL for download
     try:
-        download_url = await s3_service.get_file_url(attachment.file_key, expiration=3600)
+        download_url = await s3_service.get_file_url(
+            attachment.file_key, expiration=settings.DOWNLOAD_URL_EXPIRATION
+        )
         return RedirectResponse(url=download_url)
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,39 @@
+import asyncio
+import functools
+import time
+from typing import Callable
+from fastapi.routing import APIRoute
+from utils.metrics import current_metrics, mark_endpoint_finished
+
+class InstrumentedRoute(APIRoute):
+    """Route that measures the time between the endpoint returning and the response being ready"""
+
+    def get_route_handler(self) -> Callable:
+        endpoint = self.dependant.call
+        if asyncio.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def timed_endpoint(*args, **kwargs):
+                try:
+                    return await endpoint(*args, **kwargs)
+                finally:
+                    mark_endpoint_finished()
+        else:
+            @functools.wraps(endpoint)
+            def timed_endpoint(*args, **kwargs):
+                try:
+                    return endpoint(*args, **kwargs)
+                finally:
+                    mark_endpoint_finished()
+        self.dependant.call = timed_endpoint
+
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            metrics = current_metrics()
+            if metrics is not None and metrics.endpoint_finished is not None:
+                # Response model validation, jsonable_encoder and rendering
+                metrics.serialization_time += time.perf_counter() - metrics.endpoint_finished
+            return response
+
+        return timed_handler
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from models.recurring_meeting import Periodicity
 from models.report import ReportType
@@ -26,11 +26,20 @@ class RecurringMeetingUpdate(BaseModel):
     periodicity: Optional[Periodicity] = None
     google_maps_link: Optional[str] = None
 
-class RecurringMeetingResponse(RecurringMeetingBase):
+class RecurringMeetingSummary(RecurringMeetingBase):
     id: int
     created_at: datetime
     updated_at: datetime
-    leader: Optional[PersonResponse] = None
-    
+
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class RecurringMeetingResponse(RecurringMeetingSummary):
+    leader: Optional[PersonResponse] = None
+
+class MissingReportResponse(BaseModel):
+    recurring_meeting_id: int
+    leader_person_id: int
+    report_type: ReportType
+    location: str
+    expected_date: date
\ No newline at end of file
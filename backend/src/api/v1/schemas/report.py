@@ -1,9 +1,12 @@
-from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, create_model, field_validator
+from datetime import date, datetime
+from typing import Optional, List, Dict, FrozenSet, Type
 from decimal import Decimal
-from models.report import Currency, ParticipantType
-from api.v1.schemas.recurring_meeting import RecurringMeetingResponse
+import enum
+import functools
+from models.report import Currency, ParticipantType, ReportType
+from models.report_rollup import RollupPeriod
+from api.v1.schemas.recurring_meeting import RecurringMeetingResponse, RecurringMeetingSummary
 
 class ParticipantBase(BaseModel):
     participant_name: str
@@ -12,6 +15,10 @@ class ParticipantBase(BaseModel):
 class ParticipantCreate(ParticipantBase):
     pass
 
+class ParticipantUpdate(ParticipantBase):
+    # Existing participants are matched by id, otherwise by name and type
+    id: Optional[int] = None
+
 class ParticipantResponse(ParticipantBase):
     id: int
     created_at: datetime
@@ -28,10 +35,36 @@ class AttachmentResponse(BaseModel):
     content_type: str
     created_at: datetime
     updated_at: datetime
+    # Presigned URL, only filled when a listing asks for it (see _download_url)
+    download_url: Optional[str] = Field(None, validate_default=True)
     
     class Config:
         from_attributes = True
 
+    @field_validator("download_url")
+    @classmethod
+    def _download_url(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
+        # URLs are per request, so they come in through the validation context
+        # (file_key -> url) rather than being stored on the ORM instances
+        if value is None and info.context:
+            return info.context.get("download_urls", {}).get(info.data.get("file_key"))
+        return value
+
+class AttachmentUploadRequest(BaseModel):
+    file_name: str
+    content_type: str
+    file_size: int
+
+class AttachmentUploadResponse(BaseModel):
+    url: str
+    fields: Dict[str, str]
+    file_key: str
+    expires_in: int
+
+class AttachmentConfirmRequest(BaseModel):
+    file_key: str
+    file_name: str
+
 class ReportBase(BaseModel):
     registration_date: datetime
     meeting_datetime: datetime
@@ -60,7 +93,7 @@ class ReportUpdate(BaseModel):
     currency: Optional[Currency] = None
     attendees_count: Optional[int] = None
     google_maps_link: Optional[str] = None
-    participants: Optional[List[ParticipantCreate]] = None
+    participants: Optional[List[ParticipantUpdate]] = None
 
 class ReportResponse(ReportBase):
     id: int
@@ -71,4 +104,103 @@ class ReportResponse(ReportBase):
     recurring_meeting: Optional[RecurringMeetingResponse] = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ReportInclude(str, enum.Enum):
+    PARTICIPANTS = "participants"
+    ATTACHMENTS = "attachments"
+    RECURRING_MEETING = "recurring_meeting"
+    RECURRING_MEETING_LEADER = "recurring_meeting.leader"
+
+# What a report embeds when the request does not say
+DEFAULT_REPORT_INCLUDES = frozenset(ReportInclude)
+
+REPORT_RELATIONS = {"participants", "attachments", "recurring_meeting"}
+REPORT_FIELDS = [name for name in ReportResponse.model_fields if name not in REPORT_RELATIONS]
+
+@functools.lru_cache(maxsize=128)
+def sparse_report_model(fields: FrozenSet[str], include: FrozenSet[ReportInclude]) -> Type[BaseModel]:
+    """ReportResponse reduced to the given fields and relations; id is always kept"""
+    definitions = {}
+    for name, field in ReportResponse.model_fields.items():
+        if name in REPORT_RELATIONS:
+            if ReportInclude(name) not in include:
+                continue
+            if name == "recurring_meeting" and ReportInclude.RECURRING_MEETING_LEADER not in include:
+                definitions[name] = (Optional[RecurringMeetingSummary], None)
+                continue
+        elif name != "id" and name not in fields:
+            continue
+        definitions[name] = (field.annotation, field)
+
+    return create_model("SparseReportResponse", __config__=ConfigDict(from_attributes=True), **definitions)
+
+class ReportFilter(BaseModel):
+    # Whole days; date_to includes every report on that day
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    leader_person_id: Optional[int] = None
+    recurring_meeting_id: Optional[int] = None
+    report_type: Optional[ReportType] = None
+    currency: Optional[Currency] = None
+
+class ReportImportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+class ReportImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+class ReportImportResult(BaseModel):
+    total_rows: int
+    valid: int
+    imported: int
+    failed: int
+    errors: List[ReportImportError]
+
+class ReportExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    XLSX = "xlsx"
+
+class ExportDelivery(str, enum.Enum):
+    STREAM = "stream"
+    S3 = "s3"
+
+class ReportExportLink(BaseModel):
+    url: str
+    file_key: str
+    expires_in: int
+
+class StatsPeriod(str, enum.Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+class StatsGroupBy(str, enum.Enum):
+    LEADER = "leader"
+    RECURRING_MEETING = "recurring_meeting"
+    REPORT_TYPE = "report_type"
+    CURRENCY = "currency"
+
+class ReportStats(BaseModel):
+    period: Optional[str] = None
+    leader_person_id: Optional[int] = None
+    recurring_meeting_id: Optional[int] = None
+    report_type: Optional[ReportType] = None
+    currency: Optional[Currency] = None
+    report_count: int
+    attendees_total: int
+    collections: Dict[Currency, Decimal]
+    participants: Dict[ParticipantType, int]
+
+class ReportRollupResponse(BaseModel):
+    recurring_meeting_id: int
+    period_type: RollupPeriod
+    period_start: date
+    report_count: int
+    attendees_total: int
+    collections: Dict[Currency, Decimal]
+    participants: Dict[ParticipantType, int]
\ No newline at end of file
@@ -0,0 +1,51 @@
+import functools
+import time
+from typing import Any, Dict, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+from utils.metrics import current_metrics
+
+@functools.lru_cache(maxsize=None)
+def type_adapter(response_type: Any) -> TypeAdapter:
+    # Built on first use and kept, so cold starts only compile what they serve
+    return TypeAdapter(response_type)
+
+class AdapterJSONResponse(Response):
+    """JSON response rendered by a TypeAdapter straight to bytes.
+
+    Produces the same JSON as the response_model path (Decimal as a string,
+    ISO 8601 datetimes) without building intermediate dicts for json.dumps.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter,
+        status_code: int = 200,
+        headers=None,
+        context: Optional[Dict[str, Any]] = None
+    ):
+        self.adapter = adapter
+        self.context = context
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        body = self.adapter.dump_json(self.adapter.validate_python(content, from_attributes=True, context=self.context))
+        # Rendered inside the endpoint, so the route cannot see it as serialization
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.serialization_time += time.perf_counter() - started
+        return body
+
+def fast_json(
+    response_type: Any,
+    content: Any,
+    response: Optional[Response] = None,
+    context: Optional[Dict[str, Any]] = None
+) -> AdapterJSONResponse:
+    """Serialize content as response_type, keeping headers set on the endpoint's Response"""
+    headers = dict(response.headers) if response is not None else None
+    return AdapterJSONResponse(content, type_adapter(response_type), headers=headers, context=context)
@@ -1,24 +1,44 @@
-import boto3
 from botocore.exceptions import ClientError
+from jose import jwt
+from jose.exceptions import JOSEError
 from typing import Optional, Dict, Any
+from urllib.error import URLError
+from urllib.request import urlopen
+from utils.aws import create_client
+from utils.concurrency import run_sync
 from utils.config import settings
+from utils.metrics import aws_timer
+import json
 import os
+import threading
+import time
+
+class UnknownSigningKeyError(Exception):
+    """Raised when a token is signed with a key id missing from the cached JWKS"""
 
 class CognitoService:
     def __init__(self):
-        # Use AWS profile for local development
-        session = boto3.Session(profile_name='nylrad') if settings.ENVIRONMENT == 'local' else boto3.Session()
-        
-        self.client = session.client(
-            'cognito-idp',
-            region_name=settings.COGNITO_REGION
-        )
+        self._client = None
+        self._client_lock = threading.Lock()
         self.user_pool_id = settings.COGNITO_USER_POOL_ID
         self.client_id = settings.COGNITO_CLIENT_ID
+        self.issuer = f"https://cognito-idp.{settings.COGNITO_REGION}.amazonaws.com/{self.user_pool_id}"
+        self._jwks: Dict[str, Dict[str, Any]] = {}
+        self._jwks_fetched_at = 0.0
+
+    @property
+    def client(self):
+        # Created on first use so cold starts only pay for it when Cognito is called
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_client('cognito-idp', settings.COGNITO_REGION)
+        return self._client
 
     async def authenticate_user(self, username: str, password: str) -> Optional[Dict[str, Any]]:
         try:
-            response = self.client.admin_initiate_auth(
+            response = await run_sync(
+                self.client.admin_initiate_auth,
                 UserPoolId=self.user_pool_id,
                 ClientId=self.client_id,
                 AuthFlow='ADMIN_NO_SRP_AUTH',
@@ -45,7 +65,7 @@ class CognitoService:
 
     async def get_user_info(self, access_token: str) -> Optional[Dict[str, Any]]:
         try:
-            response = self.client.get_user(AccessToken=access_token)
+            response = await run_sync(self.client.get_user, AccessToken=access_token)
             
             user_attributes = {}
             for attr in response['UserAttributes']:
@@ -61,4 +81,91 @@ class CognitoService:
                 return None
             raise e
 
+    async def get_user_attributes(self, username: str) -> Optional[Dict[str, Any]]:
+        """Return every attribute the pool stores for username, or None if it does not exist"""
+        try:
+            response = await run_sync(
+                self.client.admin_get_user,
+                UserPoolId=self.user_pool_id,
+                Username=username
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'UserNotFoundException':
+                return None
+            raise e
+
+        return {attr['Name']: attr['Value'] for attr in response.get('UserAttributes', [])}
+
+    def _fetch_jwks(self) -> Dict[str, Dict[str, Any]]:
+        with aws_timer('cognito'), urlopen(f"{self.issuer}/.well-known/jwks.json", timeout=5) as response:
+            keys = json.load(response)['keys']
+        return {key['kid']: key for key in keys}
+
+    def _get_signing_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        age = now - self._jwks_fetched_at
+        # Refresh when the cache is stale, or early when an unknown kid shows up
+        # (key rotation), but never more often than the minimum refresh interval
+        if age > settings.COGNITO_JWKS_CACHE_SECONDS or (
+            kid not in self._jwks and age > settings.COGNITO_JWKS_MIN_REFRESH_SECONDS
+        ):
+            # Stamped on failure too, so an unreachable endpoint is retried once per
+            # minimum interval instead of on every token with an unknown kid
+            self._jwks_fetched_at = now
+            try:
+                self._jwks = self._fetch_jwks()
+            except (URLError, OSError, ValueError, KeyError):
+                # Keep serving the previous key set if the endpoint is unreachable
+                pass
+        return self._jwks.get(kid)
+
+    def verify_access_token(self, access_token: str) -> Optional[Dict[str, Any]]:
+        """Verify a Cognito access token locally and return its claims.
+
+        Returns None when the token is invalid and raises UnknownSigningKeyError
+        when its key id cannot be resolved from the JWKS.
+        """
+        try:
+            header = jwt.get_unverified_header(access_token)
+        except JOSEError:
+            return None
+
+        key = self._get_signing_key(header.get('kid', ''))
+        if key is None:
+            raise UnknownSigningKeyError(header.get('kid'))
+
+        try:
+            claims = jwt.decode(
+                access_token,
+                key,
+                algorithms=[key.get('alg', 'RS256')],
+                issuer=self.issuer,
+                options={'verify_aud': False}
+            )
+        except JOSEError:
+            return None
+
+        if claims.get('token_use') != 'access' or claims.get('client_id') != self.client_id:
+            return None
+        return claims
+
+    async def get_verified_user(self, access_token: str, email: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        try:
+            claims = await run_sync(self.verify_access_token, access_token)
+        except UnknownSigningKeyError:
+            return await self.get_user_info(access_token)
+
+        if claims is None:
+            return None
+
+        # Access tokens carry no profile attributes; email comes from the internal JWT
+        user_attributes = {'sub': claims['sub']}
+        if email:
+            user_attributes['email'] = email
+
+        return {
+            'username': claims.get('username', claims['sub']),
+            'attributes': user_attributes
+        }
+
 cognito_service = CognitoService()
\ No newline at end of file
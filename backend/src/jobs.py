@@ -0,0 +1,29 @@
+import asyncio
+import logging
+from utils.database import SessionLocal
+from services.s3_cleanup_service import S3CleanupService
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Scheduled Lambda handlers (see template.yaml)
+
+def drain_s3_deletions(event, context):
+    db = SessionLocal()
+    try:
+        result = asyncio.run(S3CleanupService(db).drain())
+        logger.info("S3 deletion outbox drained: %s", result)
+        return result
+    finally:
+        db.close()
+
+def sweep_s3_orphans(event, context):
+    db = SessionLocal()
+    try:
+        cleanup_service = S3CleanupService(db)
+        orphans = asyncio.run(cleanup_service.sweep_orphans())
+        result = asyncio.run(cleanup_service.drain())
+        logger.info("Queued %d orphaned S3 objects, drained: %s", len(orphans), result)
+        return {"orphans": len(orphans), **result}
+    finally:
+        db.close()
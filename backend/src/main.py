@@ -1,9 +1,18 @@
+import json
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
 
 from api.v1.router import api_router
+from auth.identity_cache import identity_cache
 from utils.config import settings
+from utils.database import connection_metrics
+from utils.metrics import RequestMetricsMiddleware
+from utils.pagination import NEXT_CURSOR_HEADER
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 app = FastAPI(
     title="IEM IPDD 12 Backend",
@@ -20,13 +29,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Outermost, so the timings cover the whole request
+app.add_middleware(RequestMetricsMiddleware)
+
 app.include_router(api_router, prefix="/api/v1")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # Cache size and hit counts show how many users are active, so they go to the log only
+    logger.info(json.dumps({"type": "identity_cache", **identity_cache.stats()}))
+    return {
+        "status": "healthy",
+        "database": connection_metrics.snapshot()
+    }
 
 # Lambda handler
 handler = Mangum(app)
\ No newline at end of file
@@ -1,12 +1,9 @@
-from sqlalchemy.orm import relationship
 from models.base import Base, BaseModel
 from models.person import Person
 from models.report import Report, ReportParticipant, ReportAttachment, ReportType, Currency, ParticipantType
 from models.recurring_meeting import RecurringMeeting, Periodicity
-
-# Add back_populates relationship
-Person.led_reports = relationship("Report", back_populates="leader")
-Person.recurring_meetings = relationship("RecurringMeeting", back_populates="leader")
+from models.report_rollup import ReportRollup, RollupPeriod
+from models.s3_deletion import S3DeletionOutbox
 
 __all__ = [
     "Base",
@@ -19,5 +16,8 @@ __all__ = [
     "Currency",
     "ParticipantType",
     "RecurringMeeting",
-    "Periodicity"
+    "Periodicity",
+    "ReportRollup",
+    "RollupPeriod",
+    "S3DeletionOutbox"
 ]
\ No newline at end of file
@@ -12,6 +12,6 @@ class Person(BaseModel):
     home_address = Column(String(500), nullable=False)
     google_maps_link = Column(String(1000), nullable=True)
 
-    # Relationships
-    led_reports = relationship("Report", back_populates="leader", cascade="all, delete-orphan")
-    recurring_meetings = relationship("RecurringMeeting", back_populates="leader", cascade="all, delete-orphan")
\ No newline at end of file
+    # Relationships; passive_deletes leaves removing children to ON DELETE CASCADE
+    led_reports = relationship("Report", back_populates="leader", cascade="all, delete-orphan", passive_deletes=True)
+    recurring_meetings = relationship("RecurringMeeting", back_populates="leader", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
@@ -22,4 +22,4 @@ class RecurringMeeting(BaseModel):
 
     # Relationships
     leader = relationship("Person", back_populates="recurring_meetings")
-    reports = relationship("Report", back_populates="recurring_meeting", cascade="all, delete-orphan")
\ No newline at end of file
+    reports = relationship("Report", back_populates="recurring_meeting", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
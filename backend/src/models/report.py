@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Enum, Numeric, Text
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Enum, Numeric, Text, Index
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 import enum
@@ -31,11 +31,17 @@ class Report(BaseModel):
     attendees_count = Column(Integer, nullable=False)
     google_maps_link = Column(String(1000), nullable=True)
 
+    __table_args__ = (
+        Index("ix_reports_meeting_datetime_id", "meeting_datetime", "id"),
+        Index("ix_reports_leader_meeting_datetime", "leader_person_id", "meeting_datetime"),
+        Index("ix_reports_recurring_meeting_datetime", "recurring_meeting_id", "meeting_datetime"),
+    )
+
     # Relationships
     recurring_meeting = relationship("RecurringMeeting", back_populates="reports")
     leader = relationship("Person", back_populates="led_reports")
-    participants = relationship("ReportParticipant", back_populates="report", cascade="all, delete-orphan")
-    attachments = relationship("ReportAttachment", back_populates="report", cascade="all, delete-orphan")
+    participants = relationship("ReportParticipant", back_populates="report", cascade="all, delete-orphan", passive_deletes=True)
+    attachments = relationship("ReportAttachment", back_populates="report", cascade="all, delete-orphan", passive_deletes=True)
 
 class ReportParticipant(BaseModel):
     __tablename__ = "report_participants"
@@ -52,7 +58,7 @@ class ReportAttachment(BaseModel):
 
     report_id = Column(Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False)
     file_name = Column(String(255), nullable=False)
-    file_key = Column(String(500), nullable=False)  # S3 key
+    file_key = Column(String(500), nullable=False, index=True)  # S3 key
     file_size = Column(Integer, nullable=False)
     content_type = Column(String(100), nullable=False)
 
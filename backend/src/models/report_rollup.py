@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Date, Integer, ForeignKey, Enum, Numeric, Index, UniqueConstraint
+from models.base import BaseModel
+import enum
+
+class RollupPeriod(str, enum.Enum):
+    WEEK = "WEEK"
+    MONTH = "MONTH"
+
+class ReportRollup(BaseModel):
+    __tablename__ = "report_rollups"
+
+    recurring_meeting_id = Column(Integer, ForeignKey("recurring_meetings.id", ondelete="CASCADE"), nullable=False)
+    period_type = Column(Enum(RollupPeriod, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    period_start = Column(Date, nullable=False)
+    report_count = Column(Integer, nullable=False, default=0)
+    attendees_total = Column(Integer, nullable=False, default=0)
+    collection_usd = Column(Numeric(12, 2), nullable=False, default=0)
+    collection_bob = Column(Numeric(12, 2), nullable=False, default=0)
+    members_count = Column(Integer, nullable=False, default=0)
+    visitors_count = Column(Integer, nullable=False, default=0)
+    participants_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("recurring_meeting_id", "period_type", "period_start", name="uq_report_rollups_meeting_period"),
+        Index("ix_report_rollups_period", "period_type", "period_start"),
+    )
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer, Text
+from models.base import BaseModel
+
+class S3DeletionOutbox(BaseModel):
+    """S3 objects waiting to be deleted.
+
+    Rows are written in the same transaction that removes the attachment
+    records and drained in batches by S3CleanupService.
+    """
+    __tablename__ = "s3_deletion_outbox"
+
+    file_key = Column(String(500), nullable=False, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
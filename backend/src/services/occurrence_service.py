@@ -0,0 +1,105 @@
+import calendar
+from datetime import date, datetime, timedelta
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from models.recurring_meeting import RecurringMeeting, Periodicity
+from models.report import Report
+
+def _nth_month(anchor: date, months: int) -> date:
+    # Same day of month as the anchor, clamped for shorter months (31st -> 30th/28th)
+    month_index = anchor.month - 1 + months
+    year = anchor.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(anchor.day, calendar.monthrange(year, month)[1]))
+
+def expand_occurrences(
+    start: datetime,
+    periodicity: Periodicity,
+    window_start: date,
+    window_end: date
+) -> Iterator[date]:
+    """Yield the dates a recurring meeting falls on within [window_start, window_end].
+
+    The first occurrence inside the window is computed arithmetically, so the
+    cost is proportional to the window, not to the age of the meeting.
+    """
+    anchor = start.date()
+    first = max(anchor, window_start)
+    if first > window_end:
+        return
+
+    if periodicity == Periodicity.MONTHLY:
+        months = (first.year - anchor.year) * 12 + first.month - anchor.month
+        if _nth_month(anchor, months) < first:
+            months += 1
+        occurrence = _nth_month(anchor, months)
+        while occurrence <= window_end:
+            yield occurrence
+            months += 1
+            occurrence = _nth_month(anchor, months)
+        return
+
+    step = 7 if periodicity == Periodicity.WEEKLY else 1
+    occurrence = anchor + timedelta(days=-(-(first - anchor).days // step) * step)
+    while occurrence <= window_end:
+        yield occurrence
+        occurrence += timedelta(days=step)
+
+class OccurrenceService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_missing_reports(
+        self,
+        date_from: date,
+        date_to: date,
+        leader_person_id: Optional[int] = None,
+        recurring_meeting_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        window_start = datetime.combine(date_from, datetime.min.time())
+        window_end = datetime.combine(date_to + timedelta(days=1), datetime.min.time())
+
+        meetings = select(
+            RecurringMeeting.id,
+            RecurringMeeting.meeting_datetime,
+            RecurringMeeting.periodicity,
+            RecurringMeeting.leader_person_id,
+            RecurringMeeting.report_type,
+            RecurringMeeting.location
+        ).where(RecurringMeeting.meeting_datetime < window_end)
+
+        # One pass over reports in the window instead of a query per meeting
+        reported = select(Report.recurring_meeting_id, func.date(Report.meeting_datetime)).where(
+            Report.meeting_datetime >= window_start,
+            Report.meeting_datetime < window_end
+        ).distinct()
+
+        if leader_person_id is not None:
+            meetings = meetings.where(RecurringMeeting.leader_person_id == leader_person_id)
+            reported = reported.where(Report.recurring_meeting_id.in_(
+                select(RecurringMeeting.id).where(RecurringMeeting.leader_person_id == leader_person_id)
+            ))
+        if recurring_meeting_id is not None:
+            meetings = meetings.where(RecurringMeeting.id == recurring_meeting_id)
+            reported = reported.where(Report.recurring_meeting_id == recurring_meeting_id)
+
+        reported_dates: Set[Tuple[int, date]] = set()
+        for meeting_id, meeting_date in self.db.execute(reported):
+            # SQLite returns DATE() as text
+            if isinstance(meeting_date, str):
+                meeting_date = date.fromisoformat(meeting_date)
+            reported_dates.add((meeting_id, meeting_date))
+
+        missing = []
+        for meeting in self.db.execute(meetings.order_by(RecurringMeeting.id)):
+            for occurrence in expand_occurrences(meeting.meeting_datetime, meeting.periodicity, date_from, date_to):
+                if (meeting.id, occurrence) not in reported_dates:
+                    missing.append({
+                        "recurring_meeting_id": meeting.id,
+                        "leader_person_id": meeting.leader_person_id,
+                        "report_type": meeting.report_type,
+                        "location": meeting.location,
+                        "expected_date": occurrence
+                    })
+        return missing
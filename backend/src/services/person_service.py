@@ -1,7 +1,13 @@
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from models.person import Person
+from models.recurring_meeting import RecurringMeeting
+from models.report import Report, ReportAttachment
+from services.report_rollup_service import ReportRollupService
+from services.s3_cleanup_service import S3CleanupService
 from api.v1.schemas.person import PersonCreate, PersonUpdate
+from utils.pagination import decode_cursor
 
 class PersonService:
     def __init__(self, db: Session):
@@ -25,8 +31,20 @@ class PersonService:
     def get_person(self, person_id: int) -> Optional[Person]:
         return self.db.query(Person).filter(Person.id == person_id).first()
 
-    def get_persons(self, skip: int = 0, limit: int = 100) -> List[Person]:
-        return self.db.query(Person).offset(skip).limit(limit).all()
+    @staticmethod
+    def cursor_key(person: Person) -> tuple:
+        return (person.id,)
+
+    def get_persons(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Person]:
+        query = self.db.query(Person).order_by(Person.id)
+
+        if cursor is not None:
+            last_id, = decode_cursor(cursor, (int,))
+            query = query.filter(Person.id > last_id)
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
 
     def update_person(self, person_id: int, person_data: PersonUpdate) -> Optional[Person]:
         person = self.get_person(person_id)
@@ -47,6 +65,28 @@ class PersonService:
         if not person:
             return False
         
+        # Reports led by this person may belong to other leaders' meetings,
+        # whose rollups are recomputed once the reports are gone
+        affected_meeting_ids = [
+            recurring_meeting_id for recurring_meeting_id, in self.db.query(Report.recurring_meeting_id)
+            .filter(Report.leader_person_id == person_id)
+            .distinct()
+        ]
+
+        # Attachments of the person's reports and of reports on their meetings
+        S3CleanupService(self.db).enqueue_attachments(
+            ReportAttachment.report_id.in_(
+                select(Report.id).where(or_(
+                    Report.leader_person_id == person_id,
+                    Report.recurring_meeting_id.in_(
+                        select(RecurringMeeting.id).where(RecurringMeeting.leader_person_id == person_id)
+                    )
+                ))
+            )
+        )
+        
         self.db.delete(person)
+        self.db.flush()
+        ReportRollupService(self.db).rebuild(affected_meeting_ids)
         self.db.commit()
         return True
\ No newline at end of file
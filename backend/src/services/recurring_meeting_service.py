@@ -1,7 +1,11 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from models.recurring_meeting import RecurringMeeting
+from models.report import Report, ReportAttachment
 from api.v1.schemas.recurring_meeting import RecurringMeetingCreate, RecurringMeetingUpdate
+from services.s3_cleanup_service import S3CleanupService
+from utils.pagination import decode_cursor
 
 class RecurringMeetingService:
     def __init__(self, db: Session):
@@ -32,10 +36,27 @@ class RecurringMeetingService:
             joinedload(RecurringMeeting.leader)
         ).filter(RecurringMeeting.id == recurring_meeting_id).first()
 
-    def get_recurring_meetings(self, skip: int = 0, limit: int = 100) -> List[RecurringMeeting]:
-        return self.db.query(RecurringMeeting).options(
+    @staticmethod
+    def cursor_key(recurring_meeting: RecurringMeeting) -> tuple:
+        return (recurring_meeting.id,)
+
+    def get_recurring_meetings(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[RecurringMeeting]:
+        query = self.db.query(RecurringMeeting).options(
             joinedload(RecurringMeeting.leader)
-        ).offset(skip).limit(limit).all()
+        ).order_by(RecurringMeeting.id)
+
+        if cursor is not None:
+            last_id, = decode_cursor(cursor, (int,))
+            query = query.filter(RecurringMeeting.id > last_id)
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
 
     def get_recurring_meetings_by_leader(self, leader_person_id: int) -> List[RecurringMeeting]:
         return self.db.query(RecurringMeeting).options(
@@ -68,6 +89,12 @@ class RecurringMeetingService:
         recurring_meeting = self.get_recurring_meeting(recurring_meeting_id)
         if not recurring_meeting:
             return False
+
+        S3CleanupService(self.db).enqueue_attachments(
+            ReportAttachment.report_id.in_(
+                select(Report.id).where(Report.recurring_meeting_id == recurring_meeting_id)
+            )
+        )
         
         self.db.delete(recurring_meeting)
         self.db.commit()
@@ -0,0 +1,261 @@
+import csv
+import io
+import json
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from xml.sax.saxutils import escape
+from models.report import Report
+from api.v1.schemas.report import ReportFilter, ReportExportFormat
+from services.report_service import ReportService
+
+# Reports fetched per keyset batch; participants are loaded per batch with SELECT ... IN
+EXPORT_BATCH_SIZE = 500
+# Rows buffered before a chunk is handed to the response
+FLUSH_ROWS = 200
+
+REPORT_COLUMNS = [
+    "id",
+    "meeting_datetime",
+    "registration_date",
+    "recurring_meeting_id",
+    "report_type",
+    "leader_person_id",
+    "leader_phone",
+    "collaborator",
+    "location",
+    "collection_amount",
+    "currency",
+    "attendees_count",
+    "google_maps_link",
+]
+
+CONTENT_TYPES = {
+    ReportExportFormat.CSV: "text/csv",
+    ReportExportFormat.NDJSON: "application/x-ndjson",
+    ReportExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+def _value(value: Any) -> Any:
+    if hasattr(value, "value"):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+class _ChunkBuffer(io.RawIOBase):
+    """Write-only stream whose contents are taken out in chunks"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+class ReportExportService:
+    """Streams filtered reports as CSV, NDJSON or XLSX.
+
+    Reports are read in keyset batches on (meeting_datetime, id), so memory use
+    depends on the batch size and not on the number of reports exported.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _reports(self, filters: Optional[ReportFilter]) -> Iterator[Report]:
+        query = self.db.query(Report).options(
+            joinedload(Report.recurring_meeting),
+            selectinload(Report.participants)
+        )
+        query = ReportService.apply_filters(query, filters).order_by(Report.meeting_datetime, Report.id)
+
+        # Keyset batches instead of yield_per: on MySQL yield_per streams through an
+        # unbuffered cursor, and the participants query on the same connection
+        # would silently discard the rest of that stream after the first batch
+        last = None
+        while True:
+            batch_query = query
+            if last is not None:
+                last_datetime, last_id = last
+                batch_query = query.filter(or_(
+                    Report.meeting_datetime > last_datetime,
+                    and_(Report.meeting_datetime == last_datetime, Report.id > last_id)
+                ))
+
+            batch = batch_query.limit(EXPORT_BATCH_SIZE).all()
+            yield from batch
+            if len(batch) < EXPORT_BATCH_SIZE:
+                return
+            last = ReportService.cursor_key(batch[-1])
+
+    def rows(self, filters: Optional[ReportFilter] = None, flatten_participants: bool = False) -> Iterator[Dict[str, Any]]:
+        for report in self._reports(filters):
+            row = {
+                column: _value(report.recurring_meeting.report_type if column == "report_type" else getattr(report, column))
+                for column in REPORT_COLUMNS
+            }
+
+            if not flatten_participants:
+                row["participants"] = [
+                    {
+                        "participant_name": participant.participant_name,
+                        "participant_type": _value(participant.participant_type)
+                    }
+                    for participant in report.participants
+                ]
+                yield row
+                continue
+
+            # One row per participant; reports without participants still get a row
+            for participant in report.participants or [None]:
+                yield {
+                    **row,
+                    "participant_name": participant.participant_name if participant else None,
+                    "participant_type": _value(participant.participant_type) if participant else None
+                }
+
+    @staticmethod
+    def columns(flatten_participants: bool) -> List[str]:
+        if flatten_participants:
+            return REPORT_COLUMNS + ["participant_name", "participant_type"]
+        return REPORT_COLUMNS + ["participants"]
+
+    def export(
+        self,
+        export_format: ReportExportFormat,
+        filters: Optional[ReportFilter] = None,
+        flatten_participants: bool = False
+    ) -> Iterator[bytes]:
+        rows = self.rows(filters, flatten_participants)
+        columns = self.columns(flatten_participants)
+        if export_format == ReportExportFormat.CSV:
+            return self._csv(rows, columns)
+        if export_format == ReportExportFormat.NDJSON:
+            return self._ndjson(rows)
+        return self._xlsx(rows, columns)
+
+    @staticmethod
+    def _csv(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+
+        for count, row in enumerate(rows, start=1):
+            if isinstance(row.get("participants"), list):
+                # Same "TYPE:Name;..." layout the CSV import reads
+                row["participants"] = ";".join(
+                    f"{participant['participant_type']}:{participant['participant_name']}"
+                    for participant in row["participants"]
+                )
+            writer.writerow(["" if row[column] is None else row[column] for column in columns])
+            if count % FLUSH_ROWS == 0:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        lines = []
+        for row in rows:
+            lines.append(json.dumps(row, default=str))
+            if len(lines) >= FLUSH_ROWS:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _xlsx_cell(reference: str, value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            return f'<c r="{reference}"><v>{value}</v></c>'
+        if isinstance(value, list):
+            value = ";".join(f"{item['participant_type']}:{item['participant_name']}" for item in value)
+        return f'<c r="{reference}" t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+    @classmethod
+    def _xlsx(cls, rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[bytes]:
+        """Minimal single-sheet workbook written straight into a streamed zip"""
+        letters = []
+        for index in range(len(columns)):
+            name = ""
+            index += 1
+            while index:
+                index, remainder = divmod(index - 1, 26)
+                name = chr(65 + remainder) + name
+            letters.append(name)
+
+        output = _ChunkBuffer()
+        with zipfile.ZipFile(output, mode="w", compression=zipfile.ZIP_DEFLATED) as workbook:
+            workbook.writestr("[Content_Types].xml", (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                '<Override PartName="/xl/worksheets/sheet1.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                '</Types>'
+            ))
+            workbook.writestr("_rels/.rels", (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                '<Relationship Id="rId1" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+                'Target="xl/workbook.xml"/>'
+                '</Relationships>'
+            ))
+            workbook.writestr("xl/workbook.xml", (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                '<sheets><sheet name="Reports" sheetId="1" r:id="rId1"/></sheets>'
+                '</workbook>'
+            ))
+            workbook.writestr("xl/_rels/workbook.xml.rels", (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                '<Relationship Id="rId1" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                'Target="worksheets/sheet1.xml"/>'
+                '</Relationships>'
+            ))
+            yield output.take()
+
+            with workbook.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True) as sheet:
+                sheet.write((
+                    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                    '<row r="1">'
+                    + "".join(cls._xlsx_cell(f"{letters[i]}1", column) for i, column in enumerate(columns))
+                    + '</row>'
+                ).encode("utf-8"))
+
+                for number, row in enumerate(rows, start=2):
+                    sheet.write((
+                        f'<row r="{number}">'
+                        + "".join(cls._xlsx_cell(f"{letters[i]}{number}", row[column]) for i, column in enumerate(columns))
+                        + '</row>'
+                    ).encode("utf-8"))
+                    if number % FLUSH_ROWS == 0:
+                        yield output.take()
+
+                sheet.write(b'</sheetData></worksheet>')
+
+        yield output.take()
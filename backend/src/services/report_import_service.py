@@ -0,0 +1,271 @@
+import codecs
+import csv
+import json
+from pydantic import ValidationError
+from sqlalchemy import Row, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.compiler import InsertmanyvaluesSentinelOpts
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple
+from models.person import Person
+from models.recurring_meeting import RecurringMeeting
+from models.report import Report, ReportParticipant
+from api.v1.schemas.report import ReportCreate, ReportImportFormat
+from services.report_rollup_service import ReportRollupService
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+def parse_csv_participants(value: str) -> List[Dict[str, str]]:
+    # "MEMBER:Ana Perez;VISITOR:Luis Rojas"
+    participants = []
+    for entry in value.split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        participant_type, _, participant_name = entry.partition(":")
+        participants.append({
+            "participant_type": participant_type.strip().upper(),
+            "participant_name": participant_name.strip()
+        })
+    return participants
+
+def ensure_utf8(stream: BinaryIO, block_size: int = 1024 * 1024):
+    """Decode the whole upload once and rewind it; raises UnicodeDecodeError.
+
+    Chunks are committed as the file is read, so a bad byte found halfway
+    through the import would leave the rows before it already saved.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    for block in iter(lambda: stream.read(block_size), b""):
+        decoder.decode(block)
+    decoder.decode(b"", final=True)
+    stream.seek(0)
+
+def read_rows(stream: TextIO, import_format: ReportImportFormat) -> Iterator[Tuple[int, Any]]:
+    """Yield (line number, raw row) without reading the whole file"""
+    if import_format == ReportImportFormat.CSV:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            data: Dict[str, Any] = {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key and value is not None and value.strip() != ""
+            }
+            if "participants" in data:
+                data["participants"] = parse_csv_participants(data["participants"])
+            yield reader.line_num, data
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, e
+
+class ReportImportService:
+    """Imports reports from CSV or NDJSON in chunked transactions.
+
+    Leaders are resolved by leader_person_id or leader_phone, recurring
+    meetings by recurring_meeting_id or by the leader's meeting of the given
+    report_type (and location when the leader has several). Lookups are
+    cached for the whole import.
+    """
+
+    def __init__(self, db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+        self._persons_by_id: Dict[int, Optional[Tuple[int, str]]] = {}
+        self._persons_by_phone: Dict[str, Optional[Tuple[int, str]]] = {}
+        # Plain rows rather than ORM objects, which every commit would expire
+        self._meetings_by_id: Dict[int, Optional[Row]] = {}
+        self._meetings_by_leader: Dict[int, List[Row]] = {}
+
+    def _person_by_id(self, person_id: int) -> Optional[Tuple[int, str]]:
+        if person_id not in self._persons_by_id:
+            row = self.db.execute(select(Person.id, Person.phone).where(Person.id == person_id)).first()
+            self._persons_by_id[person_id] = tuple(row) if row else None
+        return self._persons_by_id[person_id]
+
+    def _person_by_phone(self, phone: str) -> Optional[Tuple[int, str]]:
+        if phone not in self._persons_by_phone:
+            rows = self.db.execute(select(Person.id, Person.phone).where(Person.phone == phone).limit(2)).all()
+            # An ambiguous phone is treated as unknown
+            self._persons_by_phone[phone] = tuple(rows[0]) if len(rows) == 1 else None
+        return self._persons_by_phone[phone]
+
+    @staticmethod
+    def _meetings_query():
+        return select(
+            RecurringMeeting.id,
+            RecurringMeeting.leader_person_id,
+            RecurringMeeting.report_type,
+            RecurringMeeting.location
+        )
+
+    def _meeting_by_id(self, recurring_meeting_id: int) -> Optional[Row]:
+        if recurring_meeting_id not in self._meetings_by_id:
+            self._meetings_by_id[recurring_meeting_id] = self.db.execute(
+                self._meetings_query().where(RecurringMeeting.id == recurring_meeting_id)
+            ).first()
+        return self._meetings_by_id[recurring_meeting_id]
+
+    def _meetings_of(self, leader_person_id: int) -> List[Row]:
+        if leader_person_id not in self._meetings_by_leader:
+            self._meetings_by_leader[leader_person_id] = self.db.execute(
+                self._meetings_query().where(RecurringMeeting.leader_person_id == leader_person_id)
+            ).all()
+        return self._meetings_by_leader[leader_person_id]
+
+    def _resolve(self, data: Dict[str, Any]) -> List[str]:
+        """Fill in leader_person_id, recurring_meeting_id and leader_phone; returns errors"""
+        leader = None
+        if data.get("leader_person_id") not in (None, ""):
+            try:
+                leader = self._person_by_id(int(data["leader_person_id"]))
+            except (TypeError, ValueError):
+                return ["leader_person_id: must be an integer"]
+            if leader is None:
+                return [f"leader_person_id: person {data['leader_person_id']} not found"]
+        elif data.get("leader_phone") and data.get("recurring_meeting_id") in (None, ""):
+            leader = self._person_by_phone(str(data["leader_phone"]))
+            if leader is None:
+                return [f"leader_phone: no single person with phone {data['leader_phone']}"]
+
+        meeting = None
+        if data.get("recurring_meeting_id") not in (None, ""):
+            try:
+                meeting = self._meeting_by_id(int(data["recurring_meeting_id"]))
+            except (TypeError, ValueError):
+                return ["recurring_meeting_id: must be an integer"]
+            if meeting is None:
+                return [f"recurring_meeting_id: recurring meeting {data['recurring_meeting_id']} not found"]
+            if leader is None:
+                leader = self._person_by_id(meeting.leader_person_id)
+        elif leader is not None:
+            candidates = [
+                candidate for candidate in self._meetings_of(leader[0])
+                if data.get("report_type") in (None, candidate.report_type.value)
+                and data.get("location") in (None, candidate.location)
+            ]
+            if len(candidates) != 1:
+                return [f"recurring_meeting_id: {len(candidates)} matching recurring meetings for the leader"]
+            meeting = candidates[0]
+        else:
+            return ["leader_person_id, leader_phone or recurring_meeting_id is required"]
+
+        data["leader_person_id"] = leader[0]
+        data["recurring_meeting_id"] = meeting.id
+        data.setdefault("leader_phone", leader[1])
+        data.setdefault("location", meeting.location)
+        return []
+
+    @staticmethod
+    def _validation_errors(error: ValidationError) -> List[str]:
+        return [
+            f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+            for detail in error.errors()
+        ]
+
+    def _insert_reports(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert report rows in one statement and return their ids in row order"""
+        dialect = self.db.get_bind().dialect
+        if (
+            dialect.insert_executemany_returning_sort_by_parameter_order
+            and dialect.insertmanyvalues_implicit_sentinel & InsertmanyvaluesSentinelOpts.ANY_AUTOINCREMENT
+        ):
+            # PostgreSQL and MariaDB batch this and keep the ids in parameter order
+            return self.db.scalars(
+                insert(Report).returning(Report.id, sort_by_parameter_order=True),
+                rows
+            ).all()
+
+        # A single multi-row INSERT gets consecutive auto-increment ids: in every
+        # InnoDB lock mode on MySQL, and under the database write lock on SQLite.
+        # MySQL reports the first of them, SQLite the last
+        last_row_id = self.db.execute(insert(Report).values(rows)).lastrowid
+        first_id = last_row_id if dialect.name == "mysql" else last_row_id - len(rows) + 1
+        return list(range(first_id, first_id + len(rows)))
+
+    def _insert_chunk(self, chunk: List[Tuple[int, ReportCreate]]):
+        # Core inserts; the ORM would send one INSERT per report to read back each id
+        rollups = ReportRollupService(self.db)
+        for _, report_data in chunk:
+            rollups.add_report(report_data, [p.participant_type for p in report_data.participants])
+
+        report_ids = self._insert_reports([report_data.dict(exclude={"participants"}) for _, report_data in chunk])
+
+        participant_rows = [
+            {
+                "report_id": report_id,
+                "participant_name": participant_data.participant_name,
+                "participant_type": participant_data.participant_type
+            }
+            for report_id, (_, report_data) in zip(report_ids, chunk)
+            for participant_data in report_data.participants
+        ]
+        if participant_rows:
+            self.db.execute(ReportParticipant.__table__.insert(), participant_rows)
+
+        rollups.flush()
+
+    def _write(self, chunk: List[Tuple[int, ReportCreate]], result: Dict[str, Any]):
+        try:
+            self._insert_chunk(chunk)
+            self.db.commit()
+            result["imported"] += len(chunk)
+            return
+        except SQLAlchemyError:
+            self.db.rollback()
+
+        # Retry row by row so one bad row does not reject its whole chunk
+        for row_number, report_data in chunk:
+            try:
+                self._insert_chunk([(row_number, report_data)])
+                self.db.commit()
+                result["imported"] += 1
+            except SQLAlchemyError as e:
+                self.db.rollback()
+                self._add_error(result, row_number, [f"database error: {e.__class__.__name__}"])
+
+    @staticmethod
+    def _add_error(result: Dict[str, Any], row_number: int, errors: List[str]):
+        result["failed"] += 1
+        if len(result["errors"]) < MAX_REPORTED_ERRORS:
+            result["errors"].append({"row": row_number, "errors": errors})
+
+    def import_reports(self, stream: TextIO, import_format: ReportImportFormat, dry_run: bool = False) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"total_rows": 0, "valid": 0, "imported": 0, "failed": 0, "errors": []}
+        chunk: List[Tuple[int, ReportCreate]] = []
+
+        for row_number, data in read_rows(stream, import_format):
+            result["total_rows"] += 1
+            if not isinstance(data, dict):
+                self._add_error(result, row_number, [f"invalid row: {data}"])
+                continue
+
+            errors = self._resolve(data)
+            if errors:
+                self._add_error(result, row_number, errors)
+                continue
+
+            try:
+                report_data = ReportCreate(**data)
+            except ValidationError as e:
+                self._add_error(result, row_number, self._validation_errors(e))
+                continue
+
+            result["valid"] += 1
+            if dry_run:
+                continue
+
+            chunk.append((row_number, report_data))
+            if len(chunk) >= self.chunk_size:
+                self._write(chunk, result)
+                chunk = []
+
+        if chunk:
+            self._write(chunk, result)
+        return result
@@ -0,0 +1,271 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from models.report import Report, ReportParticipant, Currency, ParticipantType
+from models.report_rollup import ReportRollup, RollupPeriod
+
+CURRENCY_COLUMNS = {
+    Currency.USD: "collection_usd",
+    Currency.BOB: "collection_bob",
+}
+
+PARTICIPANT_COLUMNS = {
+    ParticipantType.MEMBER: "members_count",
+    ParticipantType.VISITOR: "visitors_count",
+    ParticipantType.PARTICIPANT: "participants_count",
+}
+
+METRIC_COLUMNS = [
+    "report_count",
+    "attendees_total",
+    *CURRENCY_COLUMNS.values(),
+    *PARTICIPANT_COLUMNS.values(),
+]
+
+RollupKey = Tuple[int, RollupPeriod, date]
+
+def period_start(period: RollupPeriod, meeting_datetime: datetime) -> date:
+    meeting_date = meeting_datetime.date()
+    if period == RollupPeriod.WEEK:
+        return meeting_date - timedelta(days=meeting_date.weekday())
+    return meeting_date.replace(day=1)
+
+def _empty_metrics() -> Dict[str, Any]:
+    metrics: Dict[str, Any] = {column: 0 for column in METRIC_COLUMNS}
+    for column in CURRENCY_COLUMNS.values():
+        metrics[column] = Decimal("0")
+    return metrics
+
+class ReportRollupService:
+    """Maintains per recurring meeting weekly and monthly report summaries.
+
+    Deltas are accumulated with add_report() and written by flush() within
+    the caller's transaction, so the rollups commit together with the reports.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._deltas: Dict[RollupKey, Dict[str, Any]] = defaultdict(_empty_metrics)
+
+    def add_report(self, report: Any, participant_types: Iterable[ParticipantType], sign: int = 1):
+        # Accepts ORM reports and ReportCreate payloads alike
+        self._add(
+            self._deltas,
+            report.recurring_meeting_id,
+            report.meeting_datetime,
+            report.attendees_count,
+            report.collection_amount,
+            report.currency,
+            self._count_types(participant_types),
+            sign
+        )
+
+    @staticmethod
+    def _count_types(participant_types: Iterable[ParticipantType]) -> Dict[ParticipantType, int]:
+        counts = {participant_type: 0 for participant_type in ParticipantType}
+        for participant_type in participant_types:
+            counts[ParticipantType(participant_type)] += 1
+        return counts
+
+    @staticmethod
+    def _add(
+        target: Dict[RollupKey, Dict[str, Any]],
+        recurring_meeting_id: int,
+        meeting_datetime: datetime,
+        attendees_count: int,
+        collection_amount: Decimal,
+        currency: Currency,
+        participant_counts: Dict[ParticipantType, int],
+        sign: int = 1
+    ):
+        for period in RollupPeriod:
+            metrics = target[(recurring_meeting_id, period, period_start(period, meeting_datetime))]
+            metrics["report_count"] += sign
+            metrics["attendees_total"] += sign * attendees_count
+            metrics[CURRENCY_COLUMNS[Currency(currency)]] += sign * Decimal(collection_amount)
+            for participant_type, count in participant_counts.items():
+                metrics[PARTICIPANT_COLUMNS[participant_type]] += sign * count
+
+    def _upsert_statement(self):
+        table = ReportRollup.__table__
+        now = datetime.utcnow()
+
+        if self.db.get_bind().dialect.name == "sqlite":
+            statement = sqlite_insert(table)
+            return statement.on_conflict_do_update(
+                index_elements=["recurring_meeting_id", "period_type", "period_start"],
+                set_={
+                    **{column: table.c[column] + statement.excluded[column] for column in METRIC_COLUMNS},
+                    "updated_at": now
+                }
+            )
+
+        statement = mysql_insert(table)
+        return statement.on_duplicate_key_update(
+            **{column: table.c[column] + statement.inserted[column] for column in METRIC_COLUMNS},
+            updated_at=now
+        )
+
+    def flush(self):
+        deltas = {
+            key: metrics for key, metrics in self._deltas.items()
+            if any(metrics[column] for column in METRIC_COLUMNS)
+        }
+        self._deltas.clear()
+        if not deltas:
+            return
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "recurring_meeting_id": recurring_meeting_id,
+                "period_type": period,
+                "period_start": start,
+                "created_at": now,
+                "updated_at": now,
+                **metrics
+            }
+            for (recurring_meeting_id, period, start), metrics in deltas.items()
+        ]
+        self.db.execute(self._upsert_statement(), rows)
+
+        # Periods whose last report was removed or moved away are dropped
+        shrunk = sorted({key[0] for key, metrics in deltas.items() if metrics["report_count"] < 0})
+        if shrunk:
+            self.db.execute(
+                delete(ReportRollup).where(
+                    ReportRollup.recurring_meeting_id.in_(shrunk),
+                    ReportRollup.report_count <= 0
+                )
+            )
+
+    def _aggregate(self, recurring_meeting_ids: Optional[Iterable[int]] = None) -> Dict[RollupKey, Dict[str, Any]]:
+        participant_counts = select(
+            ReportParticipant.report_id,
+            *[
+                func.sum(case((ReportParticipant.participant_type == participant_type, 1), else_=0))
+                .label(participant_type.value)
+                for participant_type in ParticipantType
+            ]
+        ).group_by(ReportParticipant.report_id).subquery()
+
+        statement = select(
+            Report.recurring_meeting_id,
+            Report.meeting_datetime,
+            Report.attendees_count,
+            Report.collection_amount,
+            Report.currency,
+            *[
+                func.coalesce(participant_counts.c[participant_type.value], 0)
+                for participant_type in ParticipantType
+            ]
+        ).outerjoin(participant_counts, participant_counts.c.report_id == Report.id)
+
+        if recurring_meeting_ids is not None:
+            statement = statement.where(Report.recurring_meeting_id.in_(list(recurring_meeting_ids)))
+
+        totals: Dict[RollupKey, Dict[str, Any]] = defaultdict(_empty_metrics)
+        for row in self.db.execute(statement.execution_options(yield_per=5000)):
+            recurring_meeting_id, meeting_datetime, attendees_count, collection_amount, currency, *counts = row
+            self._add(
+                totals,
+                recurring_meeting_id,
+                meeting_datetime,
+                attendees_count,
+                collection_amount,
+                currency,
+                dict(zip(ParticipantType, (int(count) for count in counts)))
+            )
+        return totals
+
+    def rebuild(self, recurring_meeting_ids: Optional[Iterable[int]] = None) -> int:
+        """Recompute rollups from the reports table; returns the number of rows written"""
+        if recurring_meeting_ids is not None:
+            recurring_meeting_ids = list(recurring_meeting_ids)
+            if not recurring_meeting_ids:
+                return 0
+
+        statement = delete(ReportRollup)
+        if recurring_meeting_ids is not None:
+            statement = statement.where(ReportRollup.recurring_meeting_id.in_(recurring_meeting_ids))
+        self.db.execute(statement)
+
+        self._deltas.clear()
+        self._deltas.update(self._aggregate(recurring_meeting_ids))
+        written = len(self._deltas)
+        self.flush()
+        return written
+
+    def check(self, recurring_meeting_ids: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Compare stored rollups with a fresh aggregation and return the differences"""
+        if recurring_meeting_ids is not None:
+            recurring_meeting_ids = list(recurring_meeting_ids)
+
+        expected = self._aggregate(recurring_meeting_ids)
+
+        query = self.db.query(ReportRollup)
+        if recurring_meeting_ids is not None:
+            query = query.filter(ReportRollup.recurring_meeting_id.in_(recurring_meeting_ids))
+        stored = {
+            (rollup.recurring_meeting_id, RollupPeriod(rollup.period_type), rollup.period_start): {
+                column: getattr(rollup, column) for column in METRIC_COLUMNS
+            }
+            for rollup in query
+        }
+
+        mismatches = []
+        for key in sorted(set(expected) | set(stored), key=lambda key: (key[0], key[1].value, key[2])):
+            expected_metrics = expected.get(key, _empty_metrics())
+            stored_metrics = stored.get(key, _empty_metrics())
+            differences = {
+                column: {"expected": expected_metrics[column], "stored": stored_metrics[column]}
+                for column in METRIC_COLUMNS
+                if expected_metrics[column] != stored_metrics[column]
+            }
+            if differences:
+                recurring_meeting_id, period, start = key
+                mismatches.append({
+                    "recurring_meeting_id": recurring_meeting_id,
+                    "period_type": period,
+                    "period_start": start,
+                    "differences": differences
+                })
+        return mismatches
+
+    def get_rollups(
+        self,
+        period: RollupPeriod,
+        recurring_meeting_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        query = self.db.query(ReportRollup).filter(ReportRollup.period_type == period)
+        if recurring_meeting_id is not None:
+            query = query.filter(ReportRollup.recurring_meeting_id == recurring_meeting_id)
+        if date_from is not None:
+            query = query.filter(ReportRollup.period_start >= period_start(period, datetime.combine(date_from, datetime.min.time())))
+        if date_to is not None:
+            query = query.filter(ReportRollup.period_start <= date_to)
+
+        return [
+            {
+                "recurring_meeting_id": rollup.recurring_meeting_id,
+                "period_type": rollup.period_type,
+                "period_start": rollup.period_start,
+                "report_count": rollup.report_count,
+                "attendees_total": rollup.attendees_total,
+                "collections": {
+                    currency: getattr(rollup, column) for currency, column in CURRENCY_COLUMNS.items()
+                },
+                "participants": {
+                    participant_type: getattr(rollup, column)
+                    for participant_type, column in PARTICIPANT_COLUMNS.items()
+                }
+            }
+            for rollup in query.order_by(ReportRollup.period_start, ReportRollup.recurring_meeting_id)
+        ]
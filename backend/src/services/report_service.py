@@ -1,13 +1,52 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
-from models.report import Report, ReportParticipant
+from datetime import datetime, time, timedelta
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.orm import Query, Session, joinedload, load_only, raiseload, selectinload
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+from models.report import Report, ReportParticipant, ReportAttachment, ParticipantType
 from models.recurring_meeting import RecurringMeeting
-from api.v1.schemas.report import ReportCreate, ReportUpdate
+from api.v1.schemas.report import (
+    ReportCreate,
+    ReportUpdate,
+    ReportFilter,
+    ParticipantUpdate,
+    ReportInclude,
+    DEFAULT_REPORT_INCLUDES
+)
+from services.report_rollup_service import ReportRollupService
+from services.s3_cleanup_service import S3CleanupService
+from utils.pagination import decode_cursor
 
 class ReportService:
     def __init__(self, db: Session):
         self.db = db
 
+    def _query_reports(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        include: FrozenSet[ReportInclude] = DEFAULT_REPORT_INCLUDES
+    ) -> Query:
+        # Many-to-one relations are joined; collections are loaded with one
+        # SELECT ... IN per relation so LIMIT applies to report rows only.
+        # Anything not selected raises instead of lazy loading per row.
+        options = []
+        if fields is not None:
+            # The pagination cursor needs meeting_datetime and id
+            columns = {"id", "meeting_datetime", *fields}
+            options.append(load_only(*(getattr(Report, column) for column in sorted(columns)), raiseload=True))
+
+        if ReportInclude.RECURRING_MEETING_LEADER in include:
+            options.append(joinedload(Report.recurring_meeting).joinedload(RecurringMeeting.leader))
+        elif ReportInclude.RECURRING_MEETING in include:
+            options.append(joinedload(Report.recurring_meeting).raiseload(RecurringMeeting.leader))
+        else:
+            options.append(raiseload(Report.recurring_meeting))
+
+        for relation in (ReportInclude.PARTICIPANTS, ReportInclude.ATTACHMENTS):
+            attribute = getattr(Report, relation.value)
+            options.append(selectinload(attribute) if relation in include else raiseload(attribute))
+
+        return self.db.query(Report).options(*options)
+
     def create_report(self, report_data: ReportCreate) -> Report:
         # Create the main report
         report = Report(
@@ -27,44 +66,101 @@ class ReportService:
         self.db.add(report)
         self.db.flush()  # Get the ID without committing
         
-        # Create participants
-        for participant_data in report_data.participants:
-            participant = ReportParticipant(
-                report_id=report.id,
-                participant_name=participant_data.participant_name,
-                participant_type=participant_data.participant_type
-            )
-            self.db.add(participant)
+        # Create participants in one executemany instead of an INSERT per row
+        if report_data.participants:
+            self.db.execute(insert(ReportParticipant), [
+                {
+                    "report_id": report.id,
+                    "participant_name": participant_data.participant_name,
+                    "participant_type": participant_data.participant_type
+                }
+                for participant_data in report_data.participants
+            ])
+
+        rollups = ReportRollupService(self.db)
+        rollups.add_report(report_data, [p.participant_type for p in report_data.participants])
+        rollups.flush()
         
         self.db.commit()
-        self.db.refresh(report)
         
         # Load the report with recurring_meeting and its leader
-        return self.db.query(Report).options(
-            joinedload(Report.recurring_meeting).joinedload(RecurringMeeting.leader),
-            joinedload(Report.participants),
-            joinedload(Report.attachments)
-        ).filter(Report.id == report.id).first()
-
-    def get_report(self, report_id: int) -> Optional[Report]:
-        return self.db.query(Report).options(
-            joinedload(Report.recurring_meeting).joinedload(RecurringMeeting.leader),
-            joinedload(Report.participants),
-            joinedload(Report.attachments)
-        ).filter(Report.id == report_id).first()
-
-    def get_reports(self, skip: int = 0, limit: int = 100) -> List[Report]:
-        return self.db.query(Report).options(
-            joinedload(Report.recurring_meeting).joinedload(RecurringMeeting.leader),
-            joinedload(Report.participants),
-            joinedload(Report.attachments)
-        ).offset(skip).limit(limit).all()
+        return self.get_report(report.id)
+
+    def get_report(
+        self,
+        report_id: int,
+        fields: Optional[Iterable[str]] = None,
+        include: FrozenSet[ReportInclude] = DEFAULT_REPORT_INCLUDES
+    ) -> Optional[Report]:
+        return self._query_reports(fields, include).filter(Report.id == report_id).first()
+
+    @staticmethod
+    def apply_filters(query: Query, filters: Optional[ReportFilter]) -> Query:
+        if filters is None:
+            return query
+
+        if filters.date_from is not None:
+            query = query.filter(Report.meeting_datetime >= datetime.combine(filters.date_from, time.min))
+        if filters.date_to is not None:
+            # Before the next midnight, so reports later on the last day are kept
+            query = query.filter(Report.meeting_datetime < datetime.combine(filters.date_to + timedelta(days=1), time.min))
+        if filters.leader_person_id is not None:
+            query = query.filter(Report.leader_person_id == filters.leader_person_id)
+        if filters.recurring_meeting_id is not None:
+            query = query.filter(Report.recurring_meeting_id == filters.recurring_meeting_id)
+        if filters.report_type is not None:
+            # The type lives on the recurring meeting; a semi-join keeps the
+            # report scan on its own indexes
+            query = query.filter(Report.recurring_meeting_id.in_(
+                select(RecurringMeeting.id).where(RecurringMeeting.report_type == filters.report_type)
+            ))
+        if filters.currency is not None:
+            query = query.filter(Report.currency == filters.currency)
+        return query
+
+    @staticmethod
+    def cursor_key(report: Report) -> tuple:
+        return (report.meeting_datetime, report.id)
+
+    def get_reports(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[ReportFilter] = None,
+        fields: Optional[Iterable[str]] = None,
+        include: FrozenSet[ReportInclude] = DEFAULT_REPORT_INCLUDES
+    ) -> List[Report]:
+        query = self.apply_filters(self._query_reports(fields, include), filters)
+        query = query.order_by(Report.meeting_datetime, Report.id)
+
+        if cursor is not None:
+            last_datetime, last_id = decode_cursor(cursor, (str, int))
+            try:
+                last_datetime = datetime.fromisoformat(last_datetime)
+            except ValueError:
+                raise ValueError("Invalid cursor")
+
+            # Expanded row comparison so MySQL can range-scan (meeting_datetime, id)
+            query = query.filter(or_(
+                Report.meeting_datetime > last_datetime,
+                and_(Report.meeting_datetime == last_datetime, Report.id > last_id)
+            ))
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
 
     def update_report(self, report_id: int, report_data: ReportUpdate) -> Optional[Report]:
         report = self.get_report(report_id)
         if not report:
             return None
         
+        # Take the report out of its rollups before any field changes
+        rollups = ReportRollupService(self.db)
+        participant_types = [participant.participant_type for participant in report.participants]
+        rollups.add_report(report, participant_types, sign=-1)
+        
         # Update main report fields
         update_data = report_data.dict(exclude_unset=True, exclude={'participants'})
         for field, value in update_data.items():
@@ -73,35 +169,145 @@ class ReportService:
         
         # Update participants if provided
         if report_data.participants is not None:
-            # Delete existing participants
-            self.db.query(ReportParticipant).filter(
-                ReportParticipant.report_id == report_id
-            ).delete()
-            
-            # Add new participants
-            for participant_data in report_data.participants:
-                participant = ReportParticipant(
-                    report_id=report.id,
-                    participant_name=participant_data.participant_name,
-                    participant_type=participant_data.participant_type
-                )
-                self.db.add(participant)
+            participant_types = self._apply_participants(report, report_data.participants)
+        
+        rollups.add_report(report, participant_types)
+        rollups.flush()
         
         self.db.commit()
-        self.db.refresh(report)
         
-        # Return the updated report with all relationships loaded
-        return self.db.query(Report).options(
-            joinedload(Report.recurring_meeting).joinedload(RecurringMeeting.leader),
-            joinedload(Report.participants),
-            joinedload(Report.attachments)
-        ).filter(Report.id == report_id).first()
+        # Commit expired the report; one load brings back all relationships
+        return self.get_report(report_id)
+
+    def _apply_participants(self, report: Report, participants_data: List[ParticipantUpdate]) -> List[ParticipantType]:
+        """Bring the report's participants in line with participants_data.
+
+        Existing rows are matched by id first, then by (name, type); only the
+        rows that changed are written, with one statement per kind of change.
+        Returns the participant types after the update.
+        """
+        existing = {participant.id: participant for participant in report.participants}
+        matched: Dict[int, ParticipantUpdate] = {}
+        unmatched: List[ParticipantUpdate] = []
+
+        for participant_data in participants_data:
+            if participant_data.id in existing and participant_data.id not in matched:
+                matched[participant_data.id] = participant_data
+            else:
+                unmatched.append(participant_data)
+
+        by_key: Dict[tuple, List[int]] = {}
+        for participant_id, participant in existing.items():
+            if participant_id not in matched:
+                by_key.setdefault((participant.participant_name, participant.participant_type), []).append(participant_id)
+
+        to_insert = []
+        for participant_data in unmatched:
+            candidates = by_key.get((participant_data.participant_name, participant_data.participant_type))
+            if candidates:
+                matched[candidates.pop(0)] = participant_data
+            else:
+                to_insert.append(participant_data)
+
+        now = datetime.utcnow()
+        to_update = [
+            {
+                "id": participant_id,
+                "participant_name": participant_data.participant_name,
+                "participant_type": participant_data.participant_type,
+                "updated_at": now
+            }
+            for participant_id, participant_data in matched.items()
+            if (existing[participant_id].participant_name, existing[participant_id].participant_type)
+            != (participant_data.participant_name, participant_data.participant_type)
+        ]
+        to_delete = [participant_id for participant_id in existing if participant_id not in matched]
+
+        if to_delete:
+            self.db.execute(delete(ReportParticipant).where(ReportParticipant.id.in_(to_delete)))
+        if to_update:
+            self.db.execute(update(ReportParticipant), to_update)
+        if to_insert:
+            self.db.execute(insert(ReportParticipant), [
+                {
+                    "report_id": report.id,
+                    "participant_name": participant_data.participant_name,
+                    "participant_type": participant_data.participant_type
+                }
+                for participant_data in to_insert
+            ])
+
+        return [participant_data.participant_type for participant_data in participants_data]
 
     def delete_report(self, report_id: int) -> bool:
-        report = self.get_report(report_id)
+        # Children are removed by ON DELETE CASCADE, so they are not loaded
+        report = self.db.get(Report, report_id)
         if not report:
             return False
+
+        participant_types = self.db.scalars(
+            select(ReportParticipant.participant_type).where(ReportParticipant.report_id == report_id)
+        )
+        
+        rollups = ReportRollupService(self.db)
+        rollups.add_report(report, participant_types, sign=-1)
+        rollups.flush()
+
+        # The S3 objects are removed by the outbox drainer once this commits
+        S3CleanupService(self.db).enqueue_attachments(ReportAttachment.report_id == report.id)
         
         self.db.delete(report)
         self.db.commit()
-        return True
\ No newline at end of file
+        return True
+
+    def report_exists(self, report_id: int) -> bool:
+        return self.db.query(Report.id).filter(Report.id == report_id).first() is not None
+
+    def get_attachment_by_key(self, report_id: int, file_key: str) -> Optional[ReportAttachment]:
+        return self.db.query(ReportAttachment).filter(
+            ReportAttachment.report_id == report_id,
+            ReportAttachment.file_key == file_key
+        ).first()
+
+    def get_attachment(self, report_id: int, attachment_id: int) -> Optional[ReportAttachment]:
+        return self.db.query(ReportAttachment).filter(
+            ReportAttachment.id == attachment_id,
+            ReportAttachment.report_id == report_id
+        ).first()
+
+    def create_attachment(
+        self,
+        report_id: int,
+        file_name: str,
+        file_key: str,
+        file_size: int,
+        content_type: str
+    ) -> ReportAttachment:
+        attachment = ReportAttachment(
+            report_id=report_id,
+            file_name=file_name,
+            file_key=file_key,
+            file_size=file_size,
+            content_type=content_type
+        )
+
+        self.db.add(attachment)
+        self.db.commit()
+        self.db.refresh(attachment)
+        return attachment
+
+    def create_attachments(self, report_id: int, attachments_data: List[Dict[str, Any]]) -> List[ReportAttachment]:
+        attachments = [
+            ReportAttachment(report_id=report_id, **attachment_data)
+            for attachment_data in attachments_data
+        ]
+
+        # One transaction for the whole batch
+        self.db.add_all(attachments)
+        self.db.commit()
+        return attachments
+
+    def delete_attachment(self, attachment: ReportAttachment) -> None:
+        S3CleanupService(self.db).enqueue([attachment.file_key])
+        self.db.delete(attachment)
+        self.db.commit()
\ No newline at end of file
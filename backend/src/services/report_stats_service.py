@@ -0,0 +1,126 @@
+from sqlalchemy import Integer, case, cast, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from models.report import Report, ReportParticipant, Currency, ParticipantType
+from models.recurring_meeting import RecurringMeeting
+from api.v1.schemas.report import ReportFilter, StatsPeriod, StatsGroupBy
+from services.report_service import ReportService
+
+_PERIOD_FORMATS = {
+    # (MySQL DATE_FORMAT, SQLite strftime); SQLite has no ISO week, see _sqlite_iso_week
+    StatsPeriod.DAY: ("%Y-%m-%d", "%Y-%m-%d"),
+    StatsPeriod.WEEK: ("%x-W%v", None),
+    StatsPeriod.MONTH: ("%Y-%m", "%Y-%m"),
+    StatsPeriod.YEAR: ("%Y", "%Y"),
+}
+
+def _sqlite_iso_week(column: ColumnElement) -> ColumnElement:
+    """ISO 8601 year and week (Monday start), formatted like MySQL's %x-W%v"""
+    # The Thursday of a date's week decides its ISO year, and its day of the year the week number
+    days_since_monday = (cast(func.strftime("%w", column), Integer) + 6) % 7
+    thursday = func.date(func.julianday(func.date(column)) - days_since_monday + 3)
+    week = (cast(func.strftime("%j", thursday), Integer) - 1) // 7 + 1
+    return func.printf("%s-W%02d", func.strftime("%Y", thursday), week)
+
+class ReportStatsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _period_bucket(self, period: StatsPeriod) -> ColumnElement:
+        mysql_format, sqlite_format = _PERIOD_FORMATS[period]
+        if self.db.get_bind().dialect.name == "sqlite":
+            if sqlite_format is None:
+                return _sqlite_iso_week(Report.meeting_datetime)
+            return func.strftime(sqlite_format, Report.meeting_datetime)
+        return func.date_format(Report.meeting_datetime, mysql_format)
+
+    def _group_keys(
+        self,
+        period: Optional[StatsPeriod],
+        group_by: Sequence[StatsGroupBy]
+    ) -> List[Tuple[str, ColumnElement]]:
+        keys = []
+        if period is not None:
+            keys.append(("period", self._period_bucket(period)))
+        if StatsGroupBy.LEADER in group_by:
+            keys.append(("leader_person_id", Report.leader_person_id))
+        if StatsGroupBy.RECURRING_MEETING in group_by:
+            keys.append(("recurring_meeting_id", Report.recurring_meeting_id))
+        if StatsGroupBy.REPORT_TYPE in group_by:
+            keys.append(("report_type", RecurringMeeting.report_type))
+        if StatsGroupBy.CURRENCY in group_by:
+            keys.append(("currency", Report.currency))
+        return keys
+
+    def _grouped(
+        self,
+        statement: Select,
+        keys: List[Tuple[str, ColumnElement]],
+        group_by: Sequence[StatsGroupBy],
+        filters: Optional[ReportFilter]
+    ) -> Select:
+        if StatsGroupBy.REPORT_TYPE in group_by:
+            statement = statement.join(RecurringMeeting, RecurringMeeting.id == Report.recurring_meeting_id)
+        statement = ReportService.apply_filters(statement, filters)
+
+        expressions = [expression for _, expression in keys]
+        return statement.group_by(*expressions).order_by(*expressions)
+
+    def get_stats(
+        self,
+        filters: Optional[ReportFilter] = None,
+        period: Optional[StatsPeriod] = None,
+        group_by: Sequence[StatsGroupBy] = ()
+    ) -> List[Dict[str, Any]]:
+        keys = self._group_keys(period, group_by)
+        key_columns = [expression.label(name) for name, expression in keys]
+
+        # Report totals; collections are summed per currency in the same pass
+        totals = select(
+            *key_columns,
+            func.count(Report.id).label("report_count"),
+            func.coalesce(func.sum(Report.attendees_count), 0).label("attendees_total"),
+            *[
+                func.coalesce(func.sum(
+                    case((Report.currency == currency, Report.collection_amount), else_=0)
+                ), 0).label(f"collection_{currency.value}")
+                for currency in Currency
+            ]
+        ).select_from(Report)
+
+        # Participant counts need their own pass, joining them above would
+        # repeat every report once per participant in the sums
+        participants = select(
+            *key_columns,
+            *[
+                func.sum(case((ReportParticipant.participant_type == participant_type, 1), else_=0))
+                .label(f"participants_{participant_type.value}")
+                for participant_type in ParticipantType
+            ]
+        ).select_from(Report).join(ReportParticipant, ReportParticipant.report_id == Report.id)
+
+        names = [name for name, _ in keys]
+        participant_counts = {
+            tuple(row[name] for name in names): row
+            for row in self.db.execute(self._grouped(participants, keys, group_by, filters)).mappings()
+        }
+
+        stats = []
+        for row in self.db.execute(self._grouped(totals, keys, group_by, filters)).mappings():
+            key = tuple(row[name] for name in names)
+            counts = participant_counts.get(key)
+            stats.append({
+                **{name: row[name] for name in names},
+                "report_count": row["report_count"],
+                "attendees_total": row["attendees_total"],
+                "collections": {
+                    currency: row[f"collection_{currency.value}"]
+                    for currency in Currency
+                },
+                "participants": {
+                    participant_type: int(counts[f"participants_{participant_type.value}"]) if counts else 0
+                    for participant_type in ParticipantType
+                }
+            })
+        return stats
@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import DateTime, Integer, delete, literal, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+from typing import Dict, Iterable, List, Optional
+from models.report import ReportAttachment
+from models.s3_deletion import S3DeletionOutbox
+from services.s3_service import s3_service
+from utils.config import settings
+
+# S3 DeleteObjects accepts at most 1000 keys per call
+DELETE_BATCH_SIZE = 1000
+
+class S3CleanupService:
+    """Deletes S3 objects through the s3_deletion_outbox table.
+
+    enqueue() and enqueue_attachments() run inside the caller's transaction,
+    so the outbox rows commit together with the removed attachment records.
+    drain() and sweep_orphans() are meant for scheduled jobs and scripts.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, file_keys: Iterable[str]):
+        now = datetime.utcnow()
+        rows = [
+            {"file_key": file_key, "attempts": 0, "created_at": now, "updated_at": now}
+            for file_key in file_keys
+        ]
+        if rows:
+            self.db.execute(S3DeletionOutbox.__table__.insert(), rows)
+
+    def enqueue_attachments(self, *criteria: ColumnElement):
+        # INSERT ... SELECT, the keys never have to be loaded
+        now = datetime.utcnow()
+        self.db.execute(
+            S3DeletionOutbox.__table__.insert().from_select(
+                ["file_key", "attempts", "created_at", "updated_at"],
+                select(
+                    ReportAttachment.file_key,
+                    literal(0, Integer),
+                    literal(now, DateTime),
+                    literal(now, DateTime)
+                ).where(*criteria)
+            )
+        )
+
+    def pending_count(self) -> int:
+        return self.db.query(S3DeletionOutbox).filter(
+            S3DeletionOutbox.attempts < settings.S3_DELETE_MAX_ATTEMPTS
+        ).count()
+
+    async def drain(self, batch_size: int = DELETE_BATCH_SIZE, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """Delete queued objects in batches; failed keys are retried on later runs"""
+        batch_size = min(batch_size, DELETE_BATCH_SIZE)
+        result = {"batches": 0, "deleted": 0, "skipped": 0, "failed": 0}
+        last_id = 0
+
+        while max_batches is None or result["batches"] < max_batches:
+            rows = (
+                self.db.query(S3DeletionOutbox.id, S3DeletionOutbox.file_key)
+                .filter(
+                    S3DeletionOutbox.id > last_id,
+                    S3DeletionOutbox.attempts < settings.S3_DELETE_MAX_ATTEMPTS
+                )
+                .order_by(S3DeletionOutbox.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not rows:
+                break
+
+            result["batches"] += 1
+            last_id = rows[-1].id
+
+            # A key that is referenced again (e.g. confirmed after the sweep) is kept
+            keys = {row.file_key for row in rows}
+            referenced = {
+                file_key for file_key, in self.db.execute(
+                    select(ReportAttachment.file_key).where(ReportAttachment.file_key.in_(keys))
+                )
+            }
+            to_delete = sorted(keys - referenced)
+
+            errors: Dict[str, str] = {}
+            if to_delete:
+                try:
+                    errors = await s3_service.delete_files(to_delete)
+                except Exception as e:
+                    errors = {file_key: str(e) for file_key in to_delete}
+
+            failed_ids: Dict[str, List[int]] = {}
+            done_ids = []
+            for row in rows:
+                if row.file_key in errors:
+                    failed_ids.setdefault(errors[row.file_key], []).append(row.id)
+                else:
+                    done_ids.append(row.id)
+
+            if done_ids:
+                self.db.execute(delete(S3DeletionOutbox).where(S3DeletionOutbox.id.in_(done_ids)))
+            for error, ids in failed_ids.items():
+                self.db.execute(
+                    update(S3DeletionOutbox)
+                    .where(S3DeletionOutbox.id.in_(ids))
+                    .values(
+                        attempts=S3DeletionOutbox.attempts + 1,
+                        last_error=error[:1000],
+                        updated_at=datetime.utcnow()
+                    )
+                )
+            self.db.commit()
+
+            result["deleted"] += len([key for key in to_delete if key not in errors])
+            result["skipped"] += len(referenced)
+            result["failed"] += len(errors)
+
+        return result
+
+    async def sweep_orphans(
+        self,
+        prefix: str = "reports/",
+        grace_period: Optional[timedelta] = None,
+        dry_run: bool = False
+    ) -> List[str]:
+        """Queue objects under prefix that no attachment references.
+
+        Objects younger than the grace period are left alone, they may belong
+        to presigned uploads that have not been confirmed yet.
+        """
+        if grace_period is None:
+            grace_period = timedelta(hours=settings.S3_ORPHAN_GRACE_HOURS)
+        cutoff = datetime.now(timezone.utc) - grace_period
+
+        orphans: List[str] = []
+        continuation_token = None
+        while True:
+            files, continuation_token = await s3_service.list_files(prefix, continuation_token)
+            candidates = [file["file_key"] for file in files if file["last_modified"] < cutoff]
+
+            if candidates:
+                known = {
+                    file_key for file_key, in self.db.execute(
+                        select(ReportAttachment.file_key).where(ReportAttachment.file_key.in_(candidates))
+                    )
+                }
+                queued = {
+                    file_key for file_key, in self.db.execute(
+                        select(S3DeletionOutbox.file_key).where(S3DeletionOutbox.file_key.in_(candidates))
+                    )
+                }
+                page_orphans = [key for key in candidates if key not in known and key not in queued]
+
+                if page_orphans and not dry_run:
+                    self.enqueue(page_orphans)
+                    self.db.commit()
+                orphans.extend(page_orphans)
+
+            if not continuation_token:
+                break
+
+        return orphans
@@ -1,18 +1,55 @@
-import boto3
 from botocore.exceptions import ClientError
 from fastapi import UploadFile
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Iterable, Set, Tuple
+import asyncio
+import time
 import uuid
 import os
+import threading
+from utils.aws import create_client
+from utils.concurrency import run_sync
 from utils.config import settings
+from utils.metrics import aws_timer
 
 class S3Service:
     def __init__(self):
-        # Use AWS profile for local development
-        session = boto3.Session(profile_name='nylrad') if settings.ENVIRONMENT == 'local' else boto3.Session()
-        
-        self.s3_client = session.client('s3', region_name=settings.AWS_REGION)
+        self._s3_client = None
+        self._transfer_config = None
+        self._client_lock = threading.Lock()
         self.bucket_name = settings.S3_BUCKET
+        # (file_key, expiration) -> (url, reuse_until); LRU bounded by DOWNLOAD_URL_CACHE_SIZE
+        self._url_cache: "OrderedDict[Tuple[str, int], Tuple[str, float]]" = OrderedDict()
+        # file_key -> expirations cached for it, so evicting a key does not scan the cache
+        self._url_expirations: Dict[str, Set[int]] = {}
+        self._url_cache_lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        # Created on first use so cold starts only pay for it when S3 is called
+        if self._s3_client is None:
+            with self._client_lock:
+                if self._s3_client is None:
+                    # S3_ENDPOINT_URL points at a local S3 stand-in (MinIO, moto server) when set
+                    self._s3_client = create_client(
+                        's3',
+                        settings.AWS_REGION,
+                        endpoint_url=settings.S3_ENDPOINT_URL or None
+                    )
+        return self._s3_client
+
+    @property
+    def transfer_config(self):
+        # Files above the threshold are sent as parallel multipart uploads
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+
+            self._transfer_config = TransferConfig(
+                multipart_threshold=settings.S3_MULTIPART_THRESHOLD_BYTES,
+                multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE_BYTES,
+                max_concurrency=settings.S3_MULTIPART_CONCURRENCY
+            )
+        return self._transfer_config
 
     async def upload_file(self, file: UploadFile, prefix: str = "") -> str:
         try:
@@ -21,44 +58,224 @@ class S3Service:
             file_key = f"{prefix}{uuid.uuid4()}{file_extension}"
             
             # Upload file to S3
-            self.s3_client.upload_fileobj(
-                file.file,
-                self.bucket_name,
-                file_key,
-                ExtraArgs={
-                    'ContentType': file.content_type,
-                    'Metadata': {
-                        'original_filename': file.filename
-                    }
-                }
-            )
+            # The transfer manager uses its own threads, which the client hooks cannot attribute
+            with aws_timer('s3'):
+                await run_sync(
+                    self.s3_client.upload_fileobj,
+                    file.file,
+                    self.bucket_name,
+                    file_key,
+                    ExtraArgs={
+                        'ContentType': file.content_type,
+                        'Metadata': {
+                            'original_filename': file.filename
+                        }
+                    },
+                    Config=self.transfer_config
+                )
             
             return file_key
             
         except ClientError as e:
             raise Exception(f"Failed to upload file to S3: {str(e)}")
 
+    async def upload_fileobj(self, fileobj, file_key: str, content_type: str, download_name: Optional[str] = None) -> str:
+        try:
+            extra_args = {'ContentType': content_type}
+            if download_name:
+                extra_args['ContentDisposition'] = f'attachment; filename="{download_name}"'
+
+            # The transfer manager uses its own threads, which the client hooks cannot attribute
+            with aws_timer('s3'):
+                await run_sync(
+                    self.s3_client.upload_fileobj,
+                    fileobj,
+                    self.bucket_name,
+                    file_key,
+                    ExtraArgs=extra_args,
+                    Config=self.transfer_config
+                )
+            return file_key
+
+        except ClientError as e:
+            raise Exception(f"Failed to upload file to S3: {str(e)}")
+
+    async def upload_files(self, files: List[UploadFile], prefix: str = "", max_parallel: int = 4) -> List[str]:
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def upload(file: UploadFile) -> str:
+            async with semaphore:
+                return await self.upload_file(file, prefix)
+
+        results = await asyncio.gather(*(upload(file) for file in files), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            # Do not leave orphaned objects behind when part of the batch failed
+            await asyncio.gather(
+                *(self.delete_file(key) for key in results if isinstance(key, str)),
+                return_exceptions=True
+            )
+            raise failures[0]
+
+        return results
+
     async def delete_file(self, file_key: str) -> bool:
         try:
-            self.s3_client.delete_object(
+            await run_sync(
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=file_key
             )
+            self.evict_file_url(file_key)
             return True
             
         except ClientError as e:
             raise Exception(f"Failed to delete file from S3: {str(e)}")
 
-    async def get_file_url(self, file_key: str, expiration: int = 3600) -> str:
+    async def delete_files(self, file_keys: List[str]) -> Dict[str, str]:
+        """Delete up to 1000 objects in one call; returns the error message per key that failed"""
+        try:
+            response = await run_sync(
+                self.s3_client.delete_objects,
+                Bucket=self.bucket_name,
+                Delete={
+                    'Objects': [{'Key': file_key} for file_key in file_keys],
+                    'Quiet': True
+                }
+            )
+            for file_key in file_keys:
+                self.evict_file_url(file_key)
+            return {
+                error['Key']: f"{error.get('Code')}: {error.get('Message')}"
+                for error in response.get('Errors', [])
+            }
+
+        except ClientError as e:
+            raise Exception(f"Failed to delete files from S3: {str(e)}")
+
+    async def list_files(
+        self,
+        prefix: str,
+        continuation_token: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         try:
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': file_key},
+            params = {'Bucket': self.bucket_name, 'Prefix': prefix}
+            if continuation_token:
+                params['ContinuationToken'] = continuation_token
+            response = await run_sync(self.s3_client.list_objects_v2, **params)
+
+            files = [
+                {'file_key': item['Key'], 'last_modified': item['LastModified']}
+                for item in response.get('Contents', [])
+            ]
+            return files, response.get('NextContinuationToken')
+
+        except ClientError as e:
+            raise Exception(f"Failed to list files in S3: {str(e)}")
+
+    async def create_presigned_upload(
+        self,
+        prefix: str,
+        file_name: str,
+        content_type: str,
+        max_size: int,
+        expiration: int = 900
+    ) -> Dict[str, Any]:
+        try:
+            # Generate unique file key
+            file_extension = os.path.splitext(file_name)[1]
+            file_key = f"{prefix}{uuid.uuid4()}{file_extension}"
+
+            # S3 enforces the key prefix, content type and size on the browser's POST
+            post = self.s3_client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                Fields={'Content-Type': content_type},
+                Conditions=[
+                    {'Content-Type': content_type},
+                    ['starts-with', '$key', prefix],
+                    ['content-length-range', 1, max_size]
+                ],
                 ExpiresIn=expiration
             )
-            return url
+
+            return {
+                'url': post['url'],
+                'fields': post['fields'],
+                'file_key': file_key
+            }
+
+        except ClientError as e:
+            raise Exception(f"Failed to generate presigned upload: {str(e)}")
+
+    async def get_file_metadata(self, file_key: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = await run_sync(
+                self.s3_client.head_object,
+                Bucket=self.bucket_name,
+                Key=file_key
+            )
+            return {
+                'file_size': response['ContentLength'],
+                'content_type': response.get('ContentType', 'application/octet-stream')
+            }
+
+        except ClientError as e:
+            if e.response['Error']['Code'] in ['404', 'NoSuchKey', 'NotFound']:
+                return None
+            raise Exception(f"Failed to read file metadata from S3: {str(e)}")
+
+    def _presigned_url(self, file_key: str, expiration: int) -> str:
+        # Keyed by expiration too, a URL is only reused for callers asking for the same lifetime
+        cache_key = (file_key, expiration)
+        now = time.monotonic()
+        with self._url_cache_lock:
+            cached = self._url_cache.get(cache_key)
+            if cached and cached[1] > now:
+                self._url_cache.move_to_end(cache_key)
+                return cached[0]
+
+        url = self.s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': file_key},
+            ExpiresIn=expiration
+        )
+
+        # Reused for half its lifetime only, so a cached URL always has time left when handed out
+        with self._url_cache_lock:
+            self._url_cache[cache_key] = (url, now + expiration / 2)
+            self._url_cache.move_to_end(cache_key)
+            self._url_expirations.setdefault(file_key, set()).add(expiration)
+            while len(self._url_cache) > settings.DOWNLOAD_URL_CACHE_SIZE:
+                (evicted_key, evicted_expiration), _ = self._url_cache.popitem(last=False)
+                self._forget_expiration(evicted_key, evicted_expiration)
+        return url
+
+    def _forget_expiration(self, file_key: str, expiration: int):
+        expirations = self._url_expirations.get(file_key)
+        if expirations is not None:
+            expirations.discard(expiration)
+            if not expirations:
+                del self._url_expirations[file_key]
+
+    async def get_file_url(self, file_key: str, expiration: int = 3600) -> str:
+        try:
+            return self._presigned_url(file_key, expiration)
             
         except ClientError as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
 
+    async def get_file_urls(self, file_keys: Iterable[str], expiration: int = 3600) -> Dict[str, str]:
+        # Signing happens locally, a whole page of URLs needs no round trip to S3
+        try:
+            return {file_key: self._presigned_url(file_key, expiration) for file_key in set(file_keys)}
+
+        except ClientError as e:
+            raise Exception(f"Failed to generate presigned URLs: {str(e)}")
+
+    def evict_file_url(self, file_key: str):
+        with self._url_cache_lock:
+            for expiration in self._url_expirations.pop(file_key, ()):
+                self._url_cache.pop((file_key, expiration), None)
+
 s3_service = S3Service()
\ No newline at end of file
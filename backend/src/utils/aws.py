@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Any
+from utils.config import settings
+from utils.metrics import current_metrics
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    # boto3 is imported here so cold starts that never touch AWS skip loading it
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import boto3
+
+                # Use AWS profile for local development
+                _session = boto3.Session(profile_name='nylrad') if settings.ENVIRONMENT == 'local' else boto3.Session()
+    return _session
+
+def _start_call(context, **kwargs):
+    context['metrics_started'] = time.perf_counter()
+
+def _timing_recorder(service: str):
+    def record(context, **kwargs):
+        metrics = current_metrics()
+        if metrics is not None and 'metrics_started' in context:
+            metrics.record_aws(service, time.perf_counter() - context['metrics_started'])
+    return record
+
+def create_client(service_name: str, region_name: str, **kwargs: Any):
+    session = get_session()
+    # Session.client is not thread-safe
+    with _session_lock:
+        client = session.client(service_name, region_name=region_name, **kwargs)
+
+    # Every API call, retries included, is timed for the request metrics
+    service = service_name.split('-')[0]
+    client.meta.events.register('before-call.*.*', _start_call)
+    client.meta.events.register('after-call.*.*', _timing_recorder(service))
+    return client
@@ -0,0 +1,27 @@
+import asyncio
+import functools
+import weakref
+from typing import Any, Callable, TypeVar
+import anyio
+from anyio import to_thread
+from utils.config import settings
+
+T = TypeVar("T")
+
+# One limiter per event loop, since anyio primitives are not meant to be shared
+# between loops and the scheduled jobs call asyncio.run more than once per process
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anyio.CapacityLimiter]" = weakref.WeakKeyDictionary()
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = anyio.CapacityLimiter(settings.THREADPOOL_MAX_WORKERS)
+    return limiter
+
+async def run_sync(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking SQLAlchemy or boto3 work in the bounded worker thread pool"""
+    if kwargs:
+        func = functools.partial(func, *args, **kwargs)
+        args = ()
+    return await to_thread.run_sync(func, *args, limiter=_get_limiter())
@@ -20,22 +20,66 @@ class Settings:
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "local")
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+
+    # Worker threads for blocking database and AWS calls
+    THREADPOOL_MAX_WORKERS: int = int(os.getenv("THREADPOOL_MAX_WORKERS", "16"))
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DATABASE_PROXY_HOST: str = os.getenv("DATABASE_PROXY_HOST", "")
+    DB_POOL_STRATEGY: str = os.getenv("DB_POOL_STRATEGY", "queue")  # "queue" or "null"
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
     
     # AWS
     AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
     S3_BUCKET: str = os.getenv("S3_BUCKET", "")
+    S3_ENDPOINT_URL: str = os.getenv("S3_ENDPOINT_URL", "")
+    S3_MULTIPART_THRESHOLD_BYTES: int = int(os.getenv("S3_MULTIPART_THRESHOLD_BYTES", str(8 * 1024 * 1024)))
+    S3_MULTIPART_CHUNKSIZE_BYTES: int = int(os.getenv("S3_MULTIPART_CHUNKSIZE_BYTES", str(8 * 1024 * 1024)))
+    S3_MULTIPART_CONCURRENCY: int = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+
+    # Attachments
+    ATTACHMENT_MAX_SIZE_BYTES: int = int(os.getenv("ATTACHMENT_MAX_SIZE_BYTES", str(20 * 1024 * 1024)))
+    PRESIGNED_UPLOAD_EXPIRATION: int = int(os.getenv("PRESIGNED_UPLOAD_EXPIRATION", "900"))
+    ATTACHMENT_BATCH_MAX_FILES: int = int(os.getenv("ATTACHMENT_BATCH_MAX_FILES", "20"))
+    ATTACHMENT_UPLOAD_PARALLELISM: int = int(os.getenv("ATTACHMENT_UPLOAD_PARALLELISM", "4"))
+    DOWNLOAD_URL_EXPIRATION: int = int(os.getenv("DOWNLOAD_URL_EXPIRATION", "3600"))
+    DOWNLOAD_URL_CACHE_SIZE: int = int(os.getenv("DOWNLOAD_URL_CACHE_SIZE", "4096"))
+    S3_DELETE_MAX_ATTEMPTS: int = int(os.getenv("S3_DELETE_MAX_ATTEMPTS", "5"))
+    EXPORT_URL_EXPIRATION: int = int(os.getenv("EXPORT_URL_EXPIRATION", "3600"))
+    S3_ORPHAN_GRACE_HOURS: int = int(os.getenv("S3_ORPHAN_GRACE_HOURS", "24"))
     
     # Cognito
     COGNITO_USER_POOL_ID: str = os.getenv("COGNITO_USER_POOL_ID", "")
     COGNITO_CLIENT_ID: str = os.getenv("COGNITO_CLIENT_ID", "")
     COGNITO_REGION: str = os.getenv("COGNITO_REGION", "us-east-1")
+    COGNITO_JWKS_CACHE_SECONDS: int = int(os.getenv("COGNITO_JWKS_CACHE_SECONDS", "3600"))
+    COGNITO_JWKS_MIN_REFRESH_SECONDS: int = int(os.getenv("COGNITO_JWKS_MIN_REFRESH_SECONDS", "60"))
     
     # JWT
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+    # Identity cache
+    IDENTITY_CACHE_MAX_SIZE: int = int(os.getenv("IDENTITY_CACHE_MAX_SIZE", "1024"))
+    IDENTITY_CACHE_TTL_SECONDS: int = int(os.getenv("IDENTITY_CACHE_TTL_SECONDS", "300"))
+
+    # Request metrics
+    REQUEST_METRICS_ENABLED: bool = os.getenv("REQUEST_METRICS_ENABLED", "true").lower() == "true"
+    REQUEST_METRICS_LOG: bool = os.getenv("REQUEST_METRICS_LOG", "true").lower() == "true"
+    SLOW_QUERY_MS: float = float(os.getenv("SLOW_QUERY_MS", "200"))
+    N_PLUS_ONE_THRESHOLD: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))
+    # The Server-Timing header shows SQL and AWS timings to the client, so it is opt-in
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+    # Comma-separated origins whose scripts may read the timings (Timing-Allow-Origin)
+    SERVER_TIMING_ALLOW_ORIGINS: str = os.getenv("SERVER_TIMING_ALLOW_ORIGINS", "")
+
+    # Render list and detail responses with precompiled TypeAdapters instead of the response_model path
+    FAST_JSON_RESPONSES: bool = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+
 settings = Settings()
\ No newline at end of file
@@ -1,20 +1,143 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 from utils.config import settings
-
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from utils.metrics import record_sql
 
 Base = declarative_base()
 
+class ConnectionMetrics:
+    """Per-container counters for connection acquisitions and wait time"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_acquisition(self, seconds: float):
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def record_connect(self):
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidation(self):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'strategy': settings.DB_POOL_STRATEGY,
+                'acquisitions': self.acquisitions,
+                'connects': self.connects,
+                'invalidations': self.invalidations,
+                'total_wait_ms': round(self.total_wait * 1000, 2),
+                'avg_wait_ms': round(self.total_wait * 1000 / self.acquisitions, 2) if self.acquisitions else 0.0,
+                'max_wait_ms': round(self.max_wait * 1000, 2),
+                'pool': _engine.pool.status() if _engine is not None else None
+            }
+
+connection_metrics = ConnectionMetrics()
+
+class TimedQueuePool(QueuePool):
+    def connect(self):
+        # Covers waiting for a free slot, pre-ping and opening new connections
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            connection_metrics.record_acquisition(time.perf_counter() - started)
+
+class TimedNullPool(NullPool):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            connection_metrics.record_acquisition(time.perf_counter() - started)
+
 def get_database_url():
     """Get the database URL for Alembic migrations"""
     return settings.DATABASE_URL
 
+def _engine_url():
+    url = make_url(settings.DATABASE_URL)
+    # Route application traffic through a connection proxy (e.g. RDS Proxy) when configured
+    if settings.DATABASE_PROXY_HOST:
+        url = url.set(host=settings.DATABASE_PROXY_HOST)
+    return url
+
+def _engine_options() -> Dict[str, Any]:
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    if settings.DB_POOL_STRATEGY == "null":
+        # A fresh connection per checkout; nothing is left open while the container is frozen
+        options["poolclass"] = TimedNullPool
+    elif settings.DB_POOL_STRATEGY == "queue":
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE
+        )
+    else:
+        raise ValueError(f"Unknown DB_POOL_STRATEGY: {settings.DB_POOL_STRATEGY}")
+
+    return options
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Attributed to the current request, if any (see utils.metrics)
+    record_sql(statement, time.perf_counter() - context._query_started)
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+def get_engine() -> Engine:
+    # Created on first use so cold starts that never hit the database skip it
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(_engine_url(), **_engine_options())
+                event.listen(engine, "connect", lambda *args: connection_metrics.record_connect())
+                event.listen(engine, "invalidate", lambda *args: connection_metrics.record_invalidation())
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+                if engine.dialect.name == "sqlite":
+                    # Deletes rely on the ON DELETE CASCADE foreign keys, which SQLite ignores by default
+                    event.listen(engine, "connect", _enable_sqlite_foreign_keys)
+                _engine = engine
+    return _engine
+
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
+
+def SessionLocal() -> Session:
+    return _session_factory(bind=get_engine())
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
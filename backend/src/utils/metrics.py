@@ -0,0 +1,146 @@
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+# Bare JSON lines on stdout, without the runtime's prefix, so CloudWatch Logs Insights discovers the fields
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+logger.propagate = False
+
+class RequestMetrics:
+    """What a single request spent on SQL, AWS calls and response serialization"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.aws_time: Dict[str, float] = {}
+        self.aws_calls: Dict[str, int] = {}
+        self.endpoint_finished: Optional[float] = None
+        self.serialization_time = 0.0
+        self.statements: Dict[str, int] = {}
+        self.slow_queries: List[Dict[str, Any]] = []
+
+    def record_sql(self, statement: str, seconds: float):
+        with self._lock:
+            self.sql_count += 1
+            self.sql_time += seconds
+            self.statements[statement] = self.statements.get(statement, 0) + 1
+            if seconds * 1000 >= settings.SLOW_QUERY_MS:
+                self.slow_queries.append({"statement": statement[:500], "ms": round(seconds * 1000, 2)})
+
+    def record_aws(self, service: str, seconds: float):
+        with self._lock:
+            self.aws_time[service] = self.aws_time.get(service, 0.0) + seconds
+            self.aws_calls[service] = self.aws_calls.get(service, 0) + 1
+
+    def repeated_statements(self) -> List[Dict[str, Any]]:
+        # The same SQL text run many times in one request is usually a lazy load per row
+        return [
+            {"statement": statement[:500], "count": count}
+            for statement, count in self.statements.items()
+            if count >= settings.N_PLUS_ONE_THRESHOLD
+        ]
+
+    def server_timing(self, total: float) -> str:
+        entries = [f'db;dur={self.sql_time * 1000:.1f};desc="{self.sql_count} queries"']
+        for service, seconds in sorted(self.aws_time.items()):
+            entries.append(f'{service};dur={seconds * 1000:.1f};desc="{self.aws_calls[service]} calls"')
+        entries.append(f"serialize;dur={self.serialization_time * 1000:.1f}")
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+def current_metrics() -> Optional[RequestMetrics]:
+    return _current.get()
+
+def record_sql(statement: str, seconds: float):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.record_sql(statement, seconds)
+
+@contextmanager
+def aws_timer(service: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.record_aws(service, time.perf_counter() - started)
+
+class RequestMetricsMiddleware:
+    """ASGI middleware that logs one JSON line per request and, when
+    SERVER_TIMING_ENABLED is set, adds a Server-Timing header"""
+
+    def __init__(self, app):
+        self.app = app
+
+    @staticmethod
+    def _timing_headers(metrics: RequestMetrics) -> List[tuple]:
+        # Streaming responses keep querying after this point; the log line has the full cost
+        timing = metrics.server_timing(time.perf_counter() - metrics.started)
+        headers = [(b"server-timing", timing.encode("latin-1"))]
+        origins = ", ".join(origin.strip() for origin in settings.SERVER_TIMING_ALLOW_ORIGINS.split(",") if origin.strip())
+        if origins:
+            headers.append((b"timing-allow-origin", origins.encode("latin-1")))
+        return headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.REQUEST_METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    message["headers"] = list(message.get("headers", [])) + self._timing_headers(metrics)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            if settings.REQUEST_METRICS_LOG:
+                self._log(scope, status_code, metrics)
+
+    @staticmethod
+    def _log(scope, status_code: int, metrics: RequestMetrics):
+        total = time.perf_counter() - metrics.started
+        repeated = metrics.repeated_statements()
+        logger.info(json.dumps({
+            "type": "request_metrics",
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "total_ms": round(total * 1000, 2),
+            "sql_count": metrics.sql_count,
+            "sql_ms": round(metrics.sql_time * 1000, 2),
+            "aws_ms": {service: round(seconds * 1000, 2) for service, seconds in metrics.aws_time.items()},
+            "serialization_ms": round(metrics.serialization_time * 1000, 2),
+            "slow_queries": metrics.slow_queries,
+            "n_plus_one": repeated,
+            "flagged": bool(metrics.slow_queries or repeated)
+        }))
+
+def mark_endpoint_finished():
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.endpoint_finished = time.perf_counter()
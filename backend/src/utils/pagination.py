@@ -0,0 +1,34 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return encoded.decode().rstrip("=")
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> List[Any]:
+    """Decode an opaque cursor, raising ValueError when it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+    if not all(isinstance(value, value_type) for value, value_type in zip(values, types)):
+        raise ValueError("Invalid cursor")
+    return values
+
+def next_cursor(items: Sequence[T], limit: int, key: Callable[[T], Sequence[Any]]) -> Optional[str]:
+    # A short page means there is nothing left to fetch
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(key(items[-1]))
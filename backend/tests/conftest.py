@@ -0,0 +1,155 @@
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import boto3
+from botocore.config import Config
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from fastapi.testclient import TestClient
+from moto import mock_aws
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import ExecuteStyle
+from main import app
+from models import Base, Currency, ParticipantType, Periodicity, Person, RecurringMeeting, Report, ReportAttachment, ReportParticipant, ReportType
+from auth.dependencies import get_current_user
+from services.s3_service import s3_service
+from utils.config import settings
+from utils.database import SessionLocal, get_engine
+
+# Set on the settings object rather than the environment, since a developer's
+# .env.local is loaded on import and would otherwise point the tests at a real database
+settings.DATABASE_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='iem-ipdd-tests-'), 'test.db')}"
+settings.DATABASE_PROXY_HOST = ""
+settings.S3_BUCKET = "test-bucket"
+settings.S3_ENDPOINT_URL = ""
+settings.REQUEST_METRICS_LOG = False
+
+TEST_USER = {"username": "tester", "attributes": {"sub": "tester", "email": "tester@example.com"}}
+
+@pytest.fixture(scope="session")
+def engine():
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+@pytest.fixture
+def db(engine):
+    session = SessionLocal()
+    yield session
+    session.close()
+    # Every test starts from empty tables
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+@pytest.fixture
+def authenticated():
+    """Skip token verification; every request runs as TEST_USER"""
+    async def test_user():
+        return TEST_USER
+
+    app.dependency_overrides[get_current_user] = test_user
+    yield TEST_USER
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def client(db, authenticated):
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def s3(monkeypatch):
+    """A moto S3 bucket behind s3_service; yields a plain client to inspect it"""
+    with mock_aws():
+        # SigV4, so presigned URLs carry their lifetime as X-Amz-Expires
+        client = boto3.client("s3", region_name=settings.AWS_REGION, config=Config(signature_version="s3v4"))
+        client.create_bucket(Bucket=settings.S3_BUCKET)
+        monkeypatch.setattr(s3_service, "_s3_client", client)
+        monkeypatch.setattr(s3_service, "bucket_name", settings.S3_BUCKET)
+        monkeypatch.setattr(s3_service, "_url_cache", OrderedDict())
+        monkeypatch.setattr(s3_service, "_url_expirations", {})
+        yield client
+
+@pytest.fixture
+def statements(engine):
+    """SQL statements sent to the database while the test runs.
+
+    An executemany counts once per parameter set, since pymysql sends
+    anything but an INSERT as one statement per row. A multi-row INSERT
+    batched by SQLAlchemy counts once per batch.
+    """
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        per_row = executemany and context.execute_style is ExecuteStyle.EXECUTEMANY
+        captured.extend([statement] * (len(parameters) if per_row else 1))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+@pytest.fixture
+def make_reports(db):
+    """Create a leader with a weekly meeting and count reports under it"""
+    def make(count: int, participants: int = 2, attachments: int = 1, leader: Person = None):
+        if leader is None:
+            leader = Person(
+                first_name="Ana",
+                last_name="Pérez",
+                birth_date=date(1990, 5, 1),
+                phone="70000000",
+                home_address="Equipetrol, calle 1 #1"
+            )
+            db.add(leader)
+            db.flush()
+
+        meeting = RecurringMeeting(
+            meeting_datetime=datetime(2024, 1, 4, 19),
+            leader_person_id=leader.id,
+            report_type=ReportType.CELULA,
+            location=leader.home_address,
+            periodicity=Periodicity.WEEKLY
+        )
+        db.add(meeting)
+        db.flush()
+
+        reports = []
+        for index in range(count):
+            meeting_datetime = meeting.meeting_datetime + timedelta(weeks=index)
+            report = Report(
+                registration_date=meeting_datetime,
+                meeting_datetime=meeting_datetime,
+                recurring_meeting_id=meeting.id,
+                leader_person_id=leader.id,
+                leader_phone=leader.phone,
+                location=meeting.location,
+                collection_amount=Decimal("25.50"),
+                currency=Currency.BOB,
+                attendees_count=participants,
+                participants=[
+                    ReportParticipant(participant_name=f"Participant {number}", participant_type=ParticipantType.MEMBER)
+                    for number in range(participants)
+                ],
+                attachments=[
+                    ReportAttachment(
+                        file_name=f"photo-{number}.jpg",
+                        file_key=f"reports/{meeting_datetime:%Y%m%d}/{index}-{number}.jpg",
+                        file_size=1024,
+                        content_type="image/jpeg"
+                    )
+                    for number in range(attachments)
+                ]
+            )
+            reports.append(report)
+        db.add_all(reports)
+        db.commit()
+        return leader, reports
+
+    return make
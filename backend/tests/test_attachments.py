@@ -0,0 +1,114 @@
+from urllib.parse import parse_qs, urlparse
+
+from boto3.s3.transfer import TransferConfig
+from sqlalchemy import select
+
+from models.report import ReportAttachment
+from services.s3_service import s3_service
+from utils.config import settings
+
+MB = 1024 * 1024
+
+def _bucket_objects(s3, prefix):
+    response = s3.list_objects_v2(Bucket=settings.S3_BUCKET, Prefix=prefix)
+    return {item["Key"]: item["Size"] for item in response.get("Contents", [])}
+
+def test_batch_upload_reports_results_per_file(client, db, make_reports, s3, monkeypatch):
+    monkeypatch.setattr(settings, "ATTACHMENT_MAX_SIZE_BYTES", 8 * MB)
+    # S3's smallest multipart part is 5 MiB; the 6 MiB file goes up in two parts
+    monkeypatch.setattr(s3_service, "_transfer_config", TransferConfig(multipart_threshold=5 * MB, multipart_chunksize=5 * MB))
+    _, (report,) = make_reports(1, attachments=0)
+
+    files = [
+        ("files", ("photo.jpg", b"\xff\xd8small photo", "image/jpeg")),
+        ("files", ("empty.jpg", b"", "image/jpeg")),
+        ("files", ("large.png", b"\x89PNG" + b"0" * (6 * MB), "image/png")),
+        ("files", ("too-large.mov", b"0" * (9 * MB), "video/quicktime")),
+    ]
+    response = client.post(f"/api/v1/reports/{report.id}/attachments/batch", files=files)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"] == "2 of 4 files uploaded"
+    assert [result["file_name"] for result in body["results"]] == ["photo.jpg", "empty.jpg", "large.png", "too-large.mov"]
+    assert [("attachment_id" in result, "error" in result) for result in body["results"]] == [
+        (True, False), (False, True), (True, False), (False, True)
+    ]
+    assert body["attachment_ids"] == [body["results"][0]["attachment_id"], body["results"][2]["attachment_id"]]
+
+    attachments = {
+        attachment.file_name: attachment
+        for attachment in db.scalars(select(ReportAttachment).where(ReportAttachment.report_id == report.id))
+    }
+    assert set(attachments) == {"photo.jpg", "large.png"}
+
+    objects = _bucket_objects(s3, f"reports/{report.id}/")
+    assert objects == {
+        attachments["photo.jpg"].file_key: len(b"\xff\xd8small photo"),
+        attachments["large.png"].file_key: 4 + 6 * MB,
+    }
+    assert s3.head_object(Bucket=settings.S3_BUCKET, Key=attachments["large.png"].file_key)["ContentType"] == "image/png"
+
+def test_confirm_accepts_only_uploaded_keys_under_the_report(client, db, make_reports, s3):
+    _, (report, other) = make_reports(2, attachments=0)
+    uploaded_key = f"reports/{report.id}/uploaded.jpg"
+    s3.put_object(Bucket=settings.S3_BUCKET, Key=uploaded_key, Body=b"photo", ContentType="image/jpeg")
+
+    presigned = client.post(
+        f"/api/v1/reports/{report.id}/attachments/presign",
+        json={"file_name": "photo.jpg", "content_type": "image/jpeg", "file_size": 5}
+    )
+    assert presigned.status_code == 200
+    assert presigned.json()["file_key"].startswith(f"reports/{report.id}/")
+
+    def confirm(file_key):
+        return client.post(
+            f"/api/v1/reports/{report.id}/attachments/confirm",
+            json={"file_key": file_key, "file_name": "photo.jpg"}
+        )
+
+    assert confirm(f"reports/{other.id}/uploaded.jpg").status_code == 400
+    assert confirm(f"reports/{report.id}/never-uploaded.jpg").status_code == 404
+
+    first = confirm(uploaded_key)
+    assert first.status_code == 200
+    # Confirming again returns the same attachment
+    assert confirm(uploaded_key).json()["attachment_id"] == first.json()["attachment_id"]
+
+    attachment = db.get(ReportAttachment, first.json()["attachment_id"])
+    assert (attachment.file_key, attachment.file_size, attachment.content_type) == (uploaded_key, 5, "image/jpeg")
+
+def _expires_in(url):
+    return int(parse_qs(urlparse(url).query)["X-Amz-Expires"][0])
+
+def test_download_urls_are_cached_per_expiration(s3):
+    short = s3_service._presigned_url("reports/1/photo.jpg", 60)
+    long = s3_service._presigned_url("reports/1/photo.jpg", 3600)
+
+    assert (_expires_in(short), _expires_in(long)) == (60, 3600)
+    assert s3_service._presigned_url("reports/1/photo.jpg", 60) == short
+    assert s3_service._presigned_url("reports/1/photo.jpg", 3600) == long
+
+    s3_service.evict_file_url("reports/1/photo.jpg")
+    assert not s3_service._url_cache and not s3_service._url_expirations
+
+def test_report_listing_includes_download_urls(client, make_reports, s3, monkeypatch):
+    monkeypatch.setattr(settings, "DOWNLOAD_URL_EXPIRATION", 600)
+    _, reports = make_reports(2, attachments=2)
+
+    listing = client.get("/api/v1/reports/", params={"include_urls": "true"}).json()
+    urls = {attachment["file_key"]: attachment["download_url"] for report in listing for attachment in report["attachments"]}
+    assert set(urls) == {attachment.file_key for report in reports for attachment in report.attachments}
+    assert all(_expires_in(url) == 600 and urlparse(url).path.endswith(key) for key, url in urls.items())
+
+    detail = client.get(f"/api/v1/reports/{reports[0].id}", params={"include_urls": "true"}).json()
+    assert [attachment["download_url"] for attachment in detail["attachments"]] == [
+        urls[attachment["file_key"]] for attachment in detail["attachments"]
+    ]
+
+    sparse = client.get("/api/v1/reports/", params={"include_urls": "true", "include": "attachments"}).json()
+    assert {attachment["file_key"]: attachment["download_url"] for report in sparse for attachment in report["attachments"]} == urls
+
+    # URLs are per request, without include_urls nothing is carried over
+    plain = client.get("/api/v1/reports/").json()
+    assert all(attachment["download_url"] is None for report in plain for attachment in report["attachments"])
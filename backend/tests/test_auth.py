@@ -0,0 +1,47 @@
+from urllib.error import URLError
+
+from auth.cognito import cognito_service
+
+def test_failed_jwks_fetch_is_not_retried_per_token(monkeypatch):
+    attempts = []
+
+    def unreachable():
+        attempts.append(1)
+        raise URLError("unreachable")
+
+    monkeypatch.setattr(cognito_service, "_fetch_jwks", unreachable)
+    monkeypatch.setattr(cognito_service, "_jwks", {})
+    monkeypatch.setattr(cognito_service, "_jwks_fetched_at", 0.0)
+
+    for kid in ("rotated-1", "rotated-2", "rotated-3"):
+        assert cognito_service._get_signing_key(kid) is None
+    assert len(attempts) == 1
+
+class PoolClient:
+    def admin_get_user(self, UserPoolId, Username):
+        return {
+            "Username": Username,
+            "UserAttributes": [
+                {"Name": "sub", "Value": "tester"},
+                {"Name": "email", "Value": "tester@example.com"},
+                {"Name": "given_name", "Value": "Ana"},
+                {"Name": "custom:church_role", "Value": "leader"},
+            ]
+        }
+
+def test_me_returns_every_pool_attribute(client, monkeypatch):
+    monkeypatch.setattr(cognito_service, "_client", PoolClient())
+
+    response = client.get("/api/v1/auth/me")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "username": "tester",
+        "email": "tester@example.com",
+        "attributes": {
+            "sub": "tester",
+            "email": "tester@example.com",
+            "given_name": "Ana",
+            "custom:church_role": "leader"
+        }
+    }
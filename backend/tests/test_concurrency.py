@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import httpx
+
+from main import app
+from auth.cognito import cognito_service
+from services.person_service import PersonService
+from utils.concurrency import run_sync
+from utils.config import settings
+
+DELAY = 0.5
+
+async def _fire_together(*requests):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(client.request(method, url, **kwargs) for method, url, kwargs in requests))
+        return responses, time.perf_counter() - started
+
+class SlowCognitoClient:
+    def admin_initiate_auth(self, **kwargs):
+        time.sleep(DELAY)
+        return {}
+
+def test_blocking_service_calls_overlap(db, authenticated, monkeypatch):
+    def slow_get_person(self, person_id):
+        time.sleep(DELAY)
+        return None
+
+    monkeypatch.setattr(PersonService, "get_person", slow_get_person)
+
+    responses, elapsed = asyncio.run(_fire_together(
+        ("GET", "/api/v1/persons/1", {}),
+        ("GET", "/api/v1/persons/2", {})
+    ))
+
+    assert [response.status_code for response in responses] == [404, 404]
+    # Run on the event loop, the two sleeps would add up
+    assert elapsed < 2 * DELAY * 0.8
+
+def test_blocking_boto3_calls_overlap(monkeypatch):
+    monkeypatch.setattr(cognito_service, "_client", SlowCognitoClient())
+
+    credentials = {"json": {"username": "someone", "password": "secret"}}
+    responses, elapsed = asyncio.run(_fire_together(
+        ("POST", "/api/v1/auth/login", credentials),
+        ("POST", "/api/v1/auth/login", credentials)
+    ))
+
+    assert [response.status_code for response in responses] == [401, 401]
+    assert elapsed < 2 * DELAY * 0.8
+
+def test_run_sync_works_across_event_loops(monkeypatch):
+    # A single worker makes the second call of each run wait on the limiter,
+    # as in jobs.py, which calls asyncio.run twice in one invocation
+    monkeypatch.setattr(settings, "THREADPOOL_MAX_WORKERS", 1)
+
+    async def two_calls():
+        return await asyncio.gather(run_sync(time.sleep, 0.05), run_sync(sum, [1, 2]))
+
+    assert asyncio.run(two_calls()) == [None, 3]
+    assert asyncio.run(two_calls()) == [None, 3]
@@ -0,0 +1,38 @@
+from sqlalchemy import func, select
+
+from models import Person, RecurringMeeting, Report, ReportAttachment, ReportParticipant, S3DeletionOutbox
+
+def _count(db, model, *criteria):
+    return db.scalar(select(func.count()).select_from(model).where(*criteria))
+
+def _delete_person(client, statements, person_id):
+    statements.clear()
+    response = client.delete(f"/api/v1/persons/{person_id}")
+    assert response.status_code == 200
+    return len(statements)
+
+def test_person_delete_statement_count_is_independent_of_dependents(client, db, make_reports, statements):
+    small_leader, _ = make_reports(2, participants=1, attachments=1)
+    large_leader, large_reports = make_reports(60, participants=8, attachments=3)
+    bystander, _ = make_reports(2, participants=2, attachments=1)
+    large_report_ids = [report.id for report in large_reports]
+    small_id, large_id, bystander_id = small_leader.id, large_leader.id, bystander.id
+    db.expunge_all()
+
+    small = _delete_person(client, statements, small_id)
+    large = _delete_person(client, statements, large_id)
+
+    # Children go through ON DELETE CASCADE, not one DELETE per loaded row
+    assert large == small
+
+    assert db.get(Person, large_id) is None
+    assert _count(db, RecurringMeeting, RecurringMeeting.leader_person_id == large_id) == 0
+    assert _count(db, Report, Report.leader_person_id == large_id) == 0
+    assert _count(db, ReportParticipant, ReportParticipant.report_id.in_(large_report_ids)) == 0
+    assert _count(db, ReportAttachment, ReportAttachment.report_id.in_(large_report_ids)) == 0
+    # Their S3 objects are queued for the cleanup job
+    assert _count(db, S3DeletionOutbox) == 2 + 60 * 3
+
+    assert _count(db, Report, Report.leader_person_id == bystander_id) == 2
+    assert _count(db, ReportParticipant) == 2 * 2
+    assert _count(db, ReportAttachment) == 2
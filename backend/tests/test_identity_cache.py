@@ -0,0 +1,61 @@
+from auth import identity_cache as identity_cache_module
+from auth.identity_cache import IdentityCache, identity_cache
+
+USER = {"username": "tester", "attributes": {}}
+
+class Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+def test_ttl_is_capped_at_token_expiry(monkeypatch):
+    clock = Clock(1_000_000.0)
+    monkeypatch.setattr(identity_cache_module, "time", clock)
+    cache = IdentityCache(max_size=10, ttl_seconds=300)
+
+    cache.set("short-lived", USER, token_exp=clock.now + 10)
+    cache.set("long-lived", USER, token_exp=clock.now + 3600)
+
+    clock.now += 9
+    assert cache.get("short-lived") == USER
+    clock.now += 2
+    assert cache.get("short-lived") is None
+    assert cache.get("long-lived") == USER
+
+    # A token outliving the TTL is still dropped after ttl_seconds
+    clock.now += 300
+    assert cache.get("long-lived") is None
+    assert cache.stats()["size"] == 0
+
+def test_least_recently_used_entry_is_evicted_at_the_size_limit():
+    cache = IdentityCache(max_size=2, ttl_seconds=300)
+    cache.set("first", USER)
+    cache.set("second", USER)
+    # Reading first makes second the least recently used
+    assert cache.get("first") == USER
+
+    cache.set("third", USER)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == USER
+    assert cache.get("third") == USER
+    assert cache.stats()["size"] == 2
+
+def test_logout_evicts_the_token(client, monkeypatch):
+    monkeypatch.setattr(identity_cache, "_entries", type(identity_cache._entries)())
+    identity_cache.set("session-token", USER)
+    identity_cache.set("other-session", USER)
+
+    response = client.post("/api/v1/auth/logout", headers={"Authorization": "Bearer session-token"})
+
+    assert response.status_code == 200
+    assert identity_cache.get("session-token") is None
+    assert identity_cache.get("other-session") == USER
+
+def test_health_does_not_expose_cache_stats(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert "identity_cache" not in response.json()
@@ -0,0 +1,19 @@
+import logging
+
+import jobs
+from services.s3_cleanup_service import S3CleanupService
+from utils.config import settings
+
+def test_drain_job_deletes_queued_objects_and_logs_the_result(db, s3, caplog):
+    s3.put_object(Bucket=settings.S3_BUCKET, Key="reports/1/photo.jpg", Body=b"photo")
+    S3CleanupService(db).enqueue(["reports/1/photo.jpg"])
+    db.commit()
+
+    with caplog.at_level(logging.INFO, logger="jobs"):
+        result = jobs.drain_s3_deletions({}, None)
+
+    assert result["deleted"] == 1
+    assert s3.list_objects_v2(Bucket=settings.S3_BUCKET).get("KeyCount") == 0
+    assert [record.getMessage() for record in caplog.records if record.name == "jobs"] == [
+        f"S3 deletion outbox drained: {result}"
+    ]
@@ -0,0 +1,58 @@
+from datetime import date, datetime
+
+import pytest
+
+from models.recurring_meeting import Periodicity
+from services.occurrence_service import expand_occurrences
+
+def _expand(start, periodicity, window_start, window_end):
+    return list(expand_occurrences(start, periodicity, window_start, window_end))
+
+@pytest.mark.parametrize("anchor_day, expected", [
+    (29, [date(2024, 1, 29), date(2024, 2, 29), date(2024, 3, 29), date(2024, 4, 29)]),
+    (30, [date(2024, 1, 30), date(2024, 2, 29), date(2024, 3, 30), date(2024, 4, 30)]),
+    (31, [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)]),
+])
+def test_monthly_anchor_clamps_to_month_end(anchor_day, expected):
+    start = datetime(2024, 1, anchor_day, 19)
+    assert _expand(start, Periodicity.MONTHLY, date(2024, 1, 1), date(2024, 4, 30)) == expected
+
+def test_monthly_clamping_does_not_drift():
+    # February clamps the 31st to the 28th, later months return to the anchor day
+    occurrences = _expand(datetime(2022, 12, 31, 19), Periodicity.MONTHLY, date(2023, 2, 1), date(2023, 5, 31))
+    assert occurrences == [date(2023, 2, 28), date(2023, 3, 31), date(2023, 4, 30), date(2023, 5, 31)]
+
+def test_monthly_window_starting_after_this_months_occurrence():
+    occurrences = _expand(datetime(2023, 1, 15, 19), Periodicity.MONTHLY, date(2024, 3, 16), date(2024, 5, 15))
+    assert occurrences == [date(2024, 4, 15), date(2024, 5, 15)]
+
+@pytest.mark.parametrize("periodicity, expected", [
+    (Periodicity.DAILY, [date(2024, 3, 6), date(2024, 3, 7), date(2024, 3, 8)]),
+    (Periodicity.WEEKLY, [date(2024, 3, 6), date(2024, 3, 13)]),
+    (Periodicity.MONTHLY, [date(2024, 3, 6), date(2024, 4, 6)]),
+])
+def test_window_starting_before_the_anchor_begins_at_the_anchor(periodicity, expected):
+    start = datetime(2024, 3, 6, 19)
+    window_end = expected[-1]
+    assert _expand(start, periodicity, date(2024, 1, 1), window_end) == expected
+
+def test_window_ending_before_the_anchor_is_empty():
+    assert _expand(datetime(2024, 3, 6, 19), Periodicity.WEEKLY, date(2024, 1, 1), date(2024, 3, 5)) == []
+
+def test_daily_window_bounds_are_inclusive():
+    occurrences = _expand(datetime(2020, 1, 1, 6), Periodicity.DAILY, date(2024, 2, 28), date(2024, 3, 1))
+    assert occurrences == [date(2024, 2, 28), date(2024, 2, 29), date(2024, 3, 1)]
+    assert _expand(datetime(2020, 1, 1, 6), Periodicity.DAILY, date(2024, 3, 1), date(2024, 3, 1)) == [date(2024, 3, 1)]
+
+@pytest.mark.parametrize("window_start, window_end, expected", [
+    # Both bounds on meeting days
+    (date(2024, 3, 7), date(2024, 3, 21), [date(2024, 3, 7), date(2024, 3, 14), date(2024, 3, 21)]),
+    # One day after and one day before a meeting day
+    (date(2024, 3, 8), date(2024, 3, 20), [date(2024, 3, 14)]),
+    # Six days, between two meetings
+    (date(2024, 3, 15), date(2024, 3, 20), []),
+])
+def test_weekly_window_bounds(window_start, window_end, expected):
+    # Anchored on a Thursday two years earlier
+    start = datetime(2022, 3, 10, 20)
+    assert _expand(start, Periodicity.WEEKLY, window_start, window_end) == expected
@@ -0,0 +1,39 @@
+import csv
+import io
+import json
+
+from services import report_export_service
+
+BATCH_SIZE = 7
+
+def _export(client, export_format, **params):
+    response = client.get("/api/v1/reports/export", params={"format": export_format, **params})
+    assert response.status_code == 200
+    return response.text
+
+def test_export_covers_every_report_across_batches(client, db, make_reports, monkeypatch):
+    monkeypatch.setattr(report_export_service, "EXPORT_BATCH_SIZE", BATCH_SIZE)
+    _, reports = make_reports(4 * BATCH_SIZE + 3, participants=2, attachments=0)
+    # Ties on meeting_datetime across a batch boundary must neither repeat nor skip reports
+    for report in reports[BATCH_SIZE - 2:BATCH_SIZE + 2]:
+        report.meeting_datetime = reports[BATCH_SIZE - 2].meeting_datetime
+    db.commit()
+    expected_ids = [report.id for report in sorted(reports, key=lambda report: (report.meeting_datetime, report.id))]
+
+    lines = [json.loads(line) for line in _export(client, "ndjson").splitlines()]
+    assert [line["id"] for line in lines] == expected_ids
+    assert all(len(line["participants"]) == 2 for line in lines)
+
+    rows = list(csv.DictReader(io.StringIO(_export(client, "csv"))))
+    assert [int(row["id"]) for row in rows] == expected_ids
+
+    flattened = list(csv.DictReader(io.StringIO(_export(client, "csv", flatten_participants="true"))))
+    assert len(flattened) == 2 * len(expected_ids)
+
+def test_export_applies_filters_across_batches(client, make_reports, monkeypatch):
+    monkeypatch.setattr(report_export_service, "EXPORT_BATCH_SIZE", BATCH_SIZE)
+    leader, _ = make_reports(3 * BATCH_SIZE, participants=0, attachments=0)
+    make_reports(2 * BATCH_SIZE, participants=0, attachments=0)
+
+    lines = _export(client, "ndjson", leader_person_id=leader.id).splitlines()
+    assert len(lines) == 3 * BATCH_SIZE
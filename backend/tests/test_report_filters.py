@@ -0,0 +1,31 @@
+from datetime import datetime
+
+def test_date_range_includes_whole_last_day(client, db, make_reports):
+    _, reports = make_reports(4, participants=1, attachments=0)
+    meeting_datetimes = [
+        datetime(2023, 12, 31, 19),  # before the range
+        datetime(2024, 1, 1, 0),     # first instant of date_from
+        datetime(2024, 1, 31, 20),   # evening of date_to
+        datetime(2024, 2, 1, 0),     # first instant after date_to
+    ]
+    for report, meeting_datetime in zip(reports, meeting_datetimes):
+        report.meeting_datetime = meeting_datetime
+    db.commit()
+    in_range = [reports[1].id, reports[2].id]
+    params = {"date_from": "2024-01-01", "date_to": "2024-01-31"}
+
+    response = client.get("/api/v1/reports/", params=params)
+    assert response.status_code == 200
+    assert [report["id"] for report in response.json()] == in_range
+
+    stats = client.get("/api/v1/reports/stats", params=params)
+    assert stats.status_code == 200
+    assert [row["report_count"] for row in stats.json()] == [2]
+
+    export = client.get("/api/v1/reports/export", params={"format": "ndjson", **params})
+    assert export.status_code == 200
+    assert len(export.text.splitlines()) == 2
+
+def test_date_range_rejects_times_of_day(client):
+    response = client.get("/api/v1/reports/", params={"date_to": "2024-01-31T18:00"})
+    assert response.status_code == 422
@@ -0,0 +1,61 @@
+import csv
+import io
+
+from sqlalchemy import func, select
+
+from models import Report, ReportParticipant
+from services.report_import_service import DEFAULT_CHUNK_SIZE
+
+COLUMNS = [
+    "recurring_meeting_id", "meeting_datetime", "registration_date",
+    "collection_amount", "currency", "attendees_count", "participants",
+]
+
+def _csv(meeting, count: int) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    for index in range(count):
+        day = f"2024-{index // 28 % 12 + 1:02d}-{index % 28 + 1:02d}T19:00:00"
+        writer.writerow([meeting.id, day, day, "10.00", "BOB", 2, f"MEMBER:Member {index};VISITOR:Visitor {index}"])
+    return buffer.getvalue().encode("utf-8")
+
+def _import(client, content: bytes):
+    return client.post("/api/v1/reports/import", files={"file": ("reports.csv", content, "text/csv")})
+
+def _count(db, model):
+    return db.scalar(select(func.count()).select_from(model))
+
+def test_import_inserts_reports_in_bulk(client, db, make_reports, statements):
+    _, (existing,) = make_reports(1, participants=0, attachments=0)
+    statements.clear()
+
+    response = _import(client, _csv(existing.recurring_meeting, 120))
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 120
+    report_inserts = [statement for statement in statements if statement.startswith("INSERT INTO reports ")]
+    assert len(report_inserts) == 1
+
+    # Participants are attached to the report of their own row
+    pairs = db.execute(
+        select(ReportParticipant.participant_name, Report.meeting_datetime)
+        .join(Report, Report.id == ReportParticipant.report_id)
+        .where(ReportParticipant.participant_name.like("Member %"))
+    ).all()
+    assert len(pairs) == 120
+    for name, meeting_datetime in pairs:
+        index = int(name.split()[1])
+        assert (meeting_datetime.month, meeting_datetime.day) == (index // 28 % 12 + 1, index % 28 + 1)
+
+def test_bad_encoding_late_in_the_file_imports_nothing(client, db, make_reports):
+    _, (existing,) = make_reports(1, participants=0, attachments=0)
+    # Enough rows before the bad byte for a chunk to be committed first
+    content = _csv(existing.recurring_meeting, DEFAULT_CHUNK_SIZE + 10) + b"\xff\xfe broken line\n"
+
+    response = _import(client, content)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "File must be UTF-8 encoded"
+    assert _count(db, Report) == 1
+    assert _count(db, ReportParticipant) == 0
@@ -0,0 +1,28 @@
+def _statements_for(client, statements, url):
+    statements.clear()
+    response = client.get(url)
+    assert response.status_code == 200
+    return response, len(statements)
+
+def test_report_list_statement_count_is_independent_of_page_size(client, make_reports, statements):
+    make_reports(3, participants=1, attachments=1)
+    response, small = _statements_for(client, statements, "/api/v1/reports/")
+    assert len(response.json()) == 3
+
+    make_reports(40, participants=6, attachments=3)
+    response, large = _statements_for(client, statements, "/api/v1/reports/")
+    assert len(response.json()) == 43
+    assert sum(len(report["participants"]) for report in response.json()) == 3 + 40 * 6
+
+    # One query per collection, not one per report
+    assert large == small
+
+def test_report_detail_statement_count_is_independent_of_collection_size(client, make_reports, statements):
+    _, (few,) = make_reports(1, participants=1, attachments=1)
+    _, (many,) = make_reports(1, participants=50, attachments=10)
+
+    _, small = _statements_for(client, statements, f"/api/v1/reports/{few.id}")
+    response, large = _statements_for(client, statements, f"/api/v1/reports/{many.id}")
+
+    assert len(response.json()["participants"]) == 50
+    assert large == small
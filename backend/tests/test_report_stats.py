@@ -0,0 +1,31 @@
+from datetime import datetime
+
+# Dates around New Year, where the ISO year differs from the calendar year
+MEETING_DATETIMES = [
+    datetime(2019, 12, 30, 19),  # Monday, 2020-W01
+    datetime(2020, 12, 31, 19),  # Thursday, 2020-W53
+    datetime(2021, 1, 3, 9),     # Sunday, still 2020-W53
+    datetime(2021, 1, 4, 19),    # Monday, 2021-W01
+    datetime(2023, 1, 1, 9),     # Sunday, 2022-W52
+    datetime(2024, 12, 30, 19),  # Monday, 2025-W01
+    datetime(2026, 6, 15, 19),   # Monday, 2026-W25
+]
+
+def _iso_week(value: datetime) -> str:
+    year, week, _ = value.isocalendar()
+    return f"{year}-W{week:02d}"
+
+def test_week_buckets_follow_iso_8601(client, db, make_reports):
+    _, reports = make_reports(len(MEETING_DATETIMES), participants=0, attachments=0)
+    for report, meeting_datetime in zip(reports, MEETING_DATETIMES):
+        report.meeting_datetime = meeting_datetime
+    db.commit()
+
+    response = client.get("/api/v1/reports/stats", params={"period": "week"})
+    assert response.status_code == 200
+
+    expected = {}
+    for meeting_datetime in MEETING_DATETIMES:
+        expected[_iso_week(meeting_datetime)] = expected.get(_iso_week(meeting_datetime), 0) + 1
+    assert {row["period"]: row["report_count"] for row in response.json()} == expected
+    assert expected["2020-W53"] == 2
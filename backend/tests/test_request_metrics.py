@@ -0,0 +1,45 @@
+import json
+import logging
+
+from utils import metrics
+from utils.config import settings
+
+class _Lines(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(record.getMessage())
+
+def test_server_timing_is_off_by_default(client):
+    response = client.get("/api/v1/persons/")
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert "timing-allow-origin" not in response.headers
+
+def test_server_timing_when_enabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", True)
+
+    response = client.get("/api/v1/persons/")
+    assert 'db;dur=' in response.headers["server-timing"]
+    assert "total;dur=" in response.headers["server-timing"]
+    assert "timing-allow-origin" not in response.headers
+
+    monkeypatch.setattr(settings, "SERVER_TIMING_ALLOW_ORIGINS", "https://app.example.com, https://staging.example.com")
+    response = client.get("/api/v1/persons/")
+    assert response.headers["timing-allow-origin"] == "https://app.example.com, https://staging.example.com"
+
+def test_metrics_line_goes_through_the_logger(client, monkeypatch):
+    monkeypatch.setattr(settings, "REQUEST_METRICS_LOG", True)
+    handler = _Lines()
+    metrics.logger.addHandler(handler)
+    try:
+        client.get("/api/v1/persons/")
+    finally:
+        metrics.logger.removeHandler(handler)
+
+    (line,) = [json.loads(line) for line in handler.lines]
+    assert (line["type"], line["method"], line["path"], line["status"]) == ("request_metrics", "GET", "/api/v1/persons/", 200)
+    assert line["sql_count"] >= 1